@@ -0,0 +1,743 @@
+"""
+Legal reporters database: records, canonical keys, the reporter matcher,
+the compiled snapshot and the shared read-only tables the API workers use.
+
+Importing this module has no side effects, so build steps can compile the
+snapshot without the API's database and web dependencies:
+
+    python backend/reporters.py
+"""
+from pathlib import Path
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional, Dict, Any, Tuple
+from bisect import bisect_left
+from array import array
+import os
+import json
+import zlib
+import hashlib
+import re
+import sys
+import mmap
+import marshal
+import struct
+
+ROOT_DIR = Path(__file__).parent
+
+# Legal reporters data, plus the compiled snapshot built from it
+REPORTERS_FILE = ROOT_DIR.parent / 'legal_reporters_comprehensive.json'
+REPORTERS_SNAPSHOT = Path(os.environ.get(
+    'REPORTERS_SNAPSHOT', REPORTERS_FILE.with_suffix('.snapshot')
+))
+
+class ReporterRecord(BaseModel):
+    """Immutable entry of the legal reporters database."""
+    model_config = ConfigDict(frozen=True)
+
+    abbreviation: str
+    aliases: Tuple[str, ...] = ()
+    description: str = ""
+    # Publication metadata for the pre-flight check; None means unknown, or
+    # for last_year/last_volume that the series is still being published
+    first_year: Optional[int] = None
+    last_year: Optional[int] = None
+    first_volume: Optional[int] = None
+    last_volume: Optional[int] = None
+    # Abbreviation of the next series, e.g. "F.3d" for "F.2d"
+    successor: Optional[str] = None
+    court_level: str = ""
+    jurisdiction: str = ""
+    states: Tuple[str, ...] = ()
+    common_citation_mistakes: Tuple[str, ...] = ()
+    placeholder_examples: Tuple[str, ...] = ()
+
+
+# Canonical keys: any spacing, period or apostrophe variant of a reporter
+# ("F. 3d", "F 3d", "F.3d") maps to one key ("f3d")
+CANONICAL_STRIP = re.compile(r"[\s.']+")
+CITATION_SHAPE = re.compile(r'^\s*(\d+)\s+([^,]+?)\s+(\d+)\s*$')
+
+def canonical_reporter_key(name: str) -> str:
+    return CANONICAL_STRIP.sub('', name.lower())
+
+# Series ordinal at the end of a canonical key: "nys2d", "calapp4th", "f3rd"
+CANONICAL_SERIES = re.compile(r'(\d{1,2})(?:st|nd|rd|d|th)$')
+
+def _series_ordinal(number: str) -> str:
+    return number + {"2": "d", "3": "d"}.get(number, "th")
+
+def canonical_series_key(written: str, reporter: str) -> str:
+    """
+    Canonical key of reporter's abbreviation, for the series actually
+    written. Some records list later series as aliases of the first one
+    ("N.Y.S.2d" of "N.Y.S."); those keep their own series ("nys2d"), while
+    plain variants ("F3rd" of "F.3d") collapse onto the abbreviation.
+    """
+    key = canonical_reporter_key(reporter)
+    written_series = CANONICAL_SERIES.search(canonical_reporter_key(written))
+    if not written_series:
+        return key
+    series = CANONICAL_SERIES.search(key)
+    if series and series.group(1) == written_series.group(1):
+        return key
+    base = key[:series.start()] if series else key
+    return base + _series_ordinal(written_series.group(1))
+
+def canonical_citation_key(citation: str, reporter: Optional[str] = None) -> Optional[str]:
+    """
+    Key of a "volume reporter page" citation such as "410 us 113", using
+    reporter's abbreviation when given so aliases collapse onto one key,
+    but never across series. Returns None for citations of any other shape.
+    """
+    match = CITATION_SHAPE.match(citation)
+    if not match:
+        return None
+    written = match.group(2)
+    name = canonical_series_key(written, reporter) if reporter else canonical_reporter_key(written)
+    return f"{match.group(1)} {name} {match.group(3)}"
+
+
+def build_automaton(patterns: List[str]) -> Tuple[List[Dict[str, int]], List[int], List[int], List[int]]:
+    """
+    Aho-Corasick automaton over non-empty patterns. Returns the goto tables,
+    the failure links, the state each pattern ends at (in pattern order) and
+    every non-root state in breadth-first order, so callers can propagate
+    their outputs along failure links from shallower states to deeper ones.
+    """
+    goto: List[Dict[str, int]] = [{}]
+    ends = []
+    for pattern in patterns:
+        state = 0
+        for char in pattern:
+            if char not in goto[state]:
+                goto.append({})
+                goto[state][char] = len(goto) - 1
+            state = goto[state][char]
+        ends.append(state)
+
+    fail = [0] * len(goto)
+    order = list(goto[0].values())
+    head = 0
+    while head < len(order):
+        state = order[head]
+        head += 1
+        for char, child in goto[state].items():
+            order.append(child)
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            target = goto[fallback].get(char, 0)
+            fail[child] = target if target != child else 0
+    return goto, fail, ends, order
+
+class ReporterMatcher:
+    """
+    Aho-Corasick automaton over the canonical key of every reporter
+    abbreviation and alias. Text is canonicalized the same way as it is
+    scanned, so "F. 2d", "F 2d" and "F.2d" all match, and matches are mapped
+    back to offsets in the original text. Finds the leftmost-longest reporter
+    in a single pass, only accepting matches that start and end on token
+    boundaries of the original text.
+    """
+
+    def __init__(self, reporters: List[ReporterRecord]):
+        # Flat tables: goto[state] maps a character to the next state,
+        # fail[state] is the failure link, output[state] is the pattern
+        # (length, abbreviation) ending at this state, and dict_link[state]
+        # points to the next state on the failure chain that has an output.
+        patterns = [
+            (canonical_reporter_key(pattern), reporter.abbreviation)
+            for reporter in reporters
+            for pattern in (reporter.abbreviation,) + reporter.aliases
+            if canonical_reporter_key(pattern)
+        ]
+        self.goto, self.fail, ends, order = build_automaton([pattern for pattern, _ in patterns])
+        self.output: List[Optional[tuple]] = [None] * len(self.goto)
+        self.dict_link: List[int] = [0] * len(self.goto)
+        self.max_length = max((len(pattern) for pattern, _ in patterns), default=0)
+        # Reporter of each name as listed (lowered): a match spelled exactly
+        # like a name goes to that reporter even when an earlier one shares
+        # its canonical key ("LA" is the neutral citation, not "La.")
+        self.spellings: Dict[str, str] = {}
+        for reporter in reporters:
+            for pattern in (reporter.abbreviation,) + reporter.aliases:
+                self.spellings.setdefault(pattern.lower(), reporter.abbreviation)
+
+        # First reporter to claim a pattern keeps it
+        for (pattern, abbreviation), state in zip(patterns, ends):
+            if self.output[state] is None:
+                self.output[state] = (len(pattern), abbreviation)
+        for state in order:
+            link = self.fail[state]
+            self.dict_link[state] = link if self.output[link] else self.dict_link[link]
+
+    @classmethod
+    def from_tables(cls, tables: tuple) -> "ReporterMatcher":
+        """Rebuild a matcher from tables() without recompiling the patterns."""
+        matcher = cls.__new__(cls)
+        matcher.goto, matcher.fail, matcher.output, matcher.dict_link, matcher.max_length, matcher.spellings = tables
+        return matcher
+
+    def tables(self) -> tuple:
+        return self.goto, self.fail, self.output, self.dict_link, self.max_length, self.spellings
+
+    @property
+    def state_count(self) -> int:
+        return len(self.goto)
+
+    def _transition(self, state: int, char: str) -> Optional[int]:
+        return self.goto[state].get(char)
+
+    def _advance(self, state: int, char: str) -> int:
+        """Follow goto, falling back along failure links, for one character."""
+        target = self._transition(state, char)
+        while target is None and state:
+            state = self.fail[state]
+            target = self._transition(state, char)
+        return target or 0
+
+    @staticmethod
+    def _canonicalize(text: str) -> Tuple[str, List[int], List[int]]:
+        """
+        text as canonical_reporter_key sees it, plus where every canonical
+        character starts and ends in text. A character ends after the periods
+        and apostrophes right behind it, so a match of "U.S." keeps its period.
+        """
+        chars, starts, ends = [], [], []
+        for index, char in enumerate(text):
+            if char in ".'":
+                if ends and ends[-1] == index:
+                    ends[-1] = index + 1
+                continue
+            if char.isspace():
+                continue
+            for lowered in char.lower():
+                chars.append(lowered)
+                starts.append(index)
+                ends.append(index + 1)
+        return ''.join(chars), starts, ends
+
+    def _as_written(self, text: str, start: int, end: int) -> bool:
+        """
+        Citations capitalize reporters, so a variant in lower case only
+        counts when spelled exactly as listed: "5 So 2d" and "123 f3d 456"
+        are citations, "also 5 so 2" is prose.
+        """
+        return not text[start].islower() or text[start:end].lower() in self.spellings
+
+    @staticmethod
+    def _on_boundary(text: str, start: int, end: int) -> bool:
+        if text[start].isalnum() and start > 0 and text[start - 1].isalnum():
+            return False
+        if text[end - 1].isalnum() and end < len(text) and text[end].isalnum():
+            return False
+        return True
+
+    def find(self, text: str) -> Optional[str]:
+        """Return the abbreviation of the leftmost-longest reporter in text."""
+        canonical, starts, ends = self._canonicalize(text)
+        best = None  # (canonical start, length, abbreviation)
+        state = 0
+        for index, char in enumerate(canonical):
+            if best and index - best[0] >= self.max_length:
+                break
+            state = self._advance(state, char)
+
+            candidate = state if self.output[state] else self.dict_link[state]
+            while candidate:
+                length, abbreviation = self.output[candidate]
+                start = index + 1 - length
+                if self._on_boundary(text, starts[start], ends[index]) and \
+                        self._as_written(text, starts[start], ends[index]):
+                    abbreviation = self.spellings.get(text[starts[start]:ends[index]].lower(), abbreviation)
+                    if best is None or start < best[0] or (start == best[0] and length > best[1]):
+                        best = (start, length, abbreviation)
+                    # Outputs further down the chain are shorter suffixes
+                    break
+                candidate = self.dict_link[candidate]
+
+        return best[2] if best else None
+
+    def finditer(self, text: str, accept=None):
+        """
+        Yield non-overlapping (start, end, abbreviation) matches over the whole
+        text, leftmost-longest first. accept(start, end, abbreviation) can veto
+        candidates before overlaps are resolved.
+        """
+        canonical, starts, ends = self._canonicalize(text)
+        candidates = []
+        state = 0
+        for index, char in enumerate(canonical):
+            state = self._advance(state, char)
+
+            # Keep the longest acceptable pattern ending here
+            candidate = state if self.output[state] else self.dict_link[state]
+            while candidate:
+                length, abbreviation = self.output[candidate]
+                start, end = starts[index + 1 - length], ends[index]
+                abbreviation = self.spellings.get(text[start:end].lower(), abbreviation)
+                if self._on_boundary(text, start, end) and self._as_written(text, start, end) and (
+                    accept is None or accept(start, end, abbreviation)
+                ):
+                    candidates.append((start, end, abbreviation))
+                    break
+                candidate = self.dict_link[candidate]
+
+        candidates.sort(key=lambda match: (match[0], match[0] - match[1]))
+        last_end = 0
+        for start, end, abbreviation in candidates:
+            if start >= last_end:
+                last_end = end
+                yield start, end, abbreviation
+
+
+class ReporterRegistry:
+    """
+    Reporter database built once at load time, with O(1) indexes by
+    canonical abbreviation, by canonical key of every abbreviation and alias,
+    by jurisdiction, by state and by court level, plus the compiled matcher.
+    """
+
+    def __init__(self, records: Tuple[ReporterRecord, ...], version: str = "",
+                 matcher: Optional[ReporterMatcher] = None, source: str = "json"):
+        self.records = records
+        # SHA-256 of the JSON database these tables were built from
+        self.version = version
+        self.source = source
+        self.by_abbreviation: Dict[str, ReporterRecord] = {}
+        self.by_key: Dict[str, ReporterRecord] = {}
+        by_jurisdiction: Dict[str, List[ReporterRecord]] = {}
+        by_state: Dict[str, List[ReporterRecord]] = {}
+        by_court_level: Dict[str, List[ReporterRecord]] = {}
+
+        for record in self.records:
+            self.by_abbreviation[record.abbreviation] = record
+            # Canonical keys of abbreviation and aliases; the first reporter
+            # keeps a shared key (e.g. "La." before the neutral "LA")
+            for name in (record.abbreviation,) + record.aliases:
+                self.by_key.setdefault(canonical_reporter_key(name), record)
+            by_jurisdiction.setdefault(record.jurisdiction, []).append(record)
+            by_court_level.setdefault(record.court_level, []).append(record)
+            for state in record.states:
+                by_state.setdefault(state, []).append(record)
+
+        self.by_jurisdiction = {k: tuple(v) for k, v in by_jurisdiction.items()}
+        self.by_state = {k: tuple(v) for k, v in by_state.items()}
+        self.by_court_level = {k: tuple(v) for k, v in by_court_level.items()}
+        self.matcher = matcher or ReporterMatcher(self.records)
+        self.diagnostics = DiagnosticRules(self.records)
+
+    @classmethod
+    def from_json(cls, path: Path) -> "ReporterRegistry":
+        raw = path.read_bytes()
+        records = tuple(ReporterRecord(**r) for r in json.loads(raw))
+        return cls(records, version=hashlib.sha256(raw).hexdigest())
+
+    @classmethod
+    def from_snapshot(cls, path: Path, version: str) -> Optional["ReporterRegistry"]:
+        """
+        Load a snapshot written by compile_reporter_snapshot, or return None
+        when it is missing, from another format or Python version, or was
+        compiled from a different JSON database than `version`.
+        """
+        try:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                header = SNAPSHOT_HEADER.unpack_from(mm)
+                if header[:4] != (SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, *sys.version_info[:2]):
+                    return None
+                if header[4] != bytes.fromhex(version):
+                    return None
+                payload = marshal.loads(mm[SNAPSHOT_HEADER.size:SNAPSHOT_HEADER.size + header[5]])
+        except (OSError, ValueError, EOFError, struct.error):
+            return None
+        records = tuple(
+            ReporterRecord.model_construct(**dict(zip(SNAPSHOT_FIELDS, values)))
+            for values in payload["records"]
+        )
+        return cls(records, version=version, matcher=ReporterMatcher.from_tables(payload["matcher"]),
+                   source="snapshot")
+
+    @classmethod
+    def load(cls, json_path: Path = REPORTERS_FILE, snapshot_path: Path = REPORTERS_SNAPSHOT) -> "ReporterRegistry":
+        """
+        Attach to the shared tables published by the serving master process
+        when there are any; otherwise load the compiled snapshot, falling back
+        to JSON if it is missing or stale.
+        """
+        shared_path = os.environ.get('REPORTERS_SHARED_TABLES')
+        if shared_path:
+            return SharedReporterRegistry.attach(Path(shared_path))
+        version = hashlib.sha256(json_path.read_bytes()).hexdigest()
+        return cls.from_snapshot(snapshot_path, version) or cls.from_json(json_path)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def key_count(self) -> int:
+        return len(self.by_key)
+
+    def get(self, abbreviation: str) -> Optional[ReporterRecord]:
+        """Record for a canonical abbreviation such as "F.3d"."""
+        return self.by_abbreviation.get(abbreviation)
+
+    def lookup(self, name: str) -> Optional[ReporterRecord]:
+        """
+        Record for an abbreviation or alias in any spacing, period or case
+        variant. An exact abbreviation wins, so "LA" finds the neutral
+        reporter while "La" finds "La.".
+        """
+        return self.get(name.strip()) or self.by_key.get(canonical_reporter_key(name))
+
+    def filter(self, jurisdiction: Optional[str] = None, state: Optional[str] = None,
+               court_level: Optional[str] = None) -> Tuple[ReporterRecord, ...]:
+        """Records matching every given attribute, in database order."""
+        selected = None
+        for index, key in ((self.by_jurisdiction, jurisdiction), (self.by_state, state),
+                           (self.by_court_level, court_level)):
+            if key is None:
+                continue
+            matches = index.get(key, ())
+            if selected is None:
+                selected = matches
+            else:
+                allowed = set(matches)
+                selected = tuple(r for r in selected if r in allowed)
+        return self.records if selected is None else selected
+
+# Binary snapshot layout: header, then a marshal payload with the records
+# as field tuples and the compiled matcher tables. The header pins the
+# format, the Python version (marshal is version specific) and the SHA-256
+# of the JSON database, so a stale snapshot is never used.
+SNAPSHOT_MAGIC = b"SCREPSNP"
+SNAPSHOT_FORMAT = 3
+SNAPSHOT_HEADER = struct.Struct("<8sIII32sQ")
+SNAPSHOT_FIELDS = tuple(ReporterRecord.model_fields)
+
+def compile_reporter_snapshot(json_path: Path = REPORTERS_FILE, snapshot_path: Path = REPORTERS_SNAPSHOT) -> str:
+    """Compile the JSON reporter database into a snapshot; returns its version hash."""
+    registry = ReporterRegistry.from_json(json_path)
+    payload = marshal.dumps({
+        "records": [tuple(getattr(r, field) for field in SNAPSHOT_FIELDS) for r in registry.records],
+        "matcher": registry.matcher.tables(),
+    })
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, *sys.version_info[:2],
+                                  bytes.fromhex(registry.version), len(payload))
+    # Write then rename so running workers never see a partial file
+    partial = snapshot_path.with_suffix('.partial')
+    partial.write_bytes(header + payload)
+    partial.replace(snapshot_path)
+    return registry.version
+
+# Shared read-only reporter tables. `python server.py serve` builds them once
+# in the master process into a file under /dev/shm; every worker mmaps that
+# file and answers lookups straight from the mapped pages, so the tables are
+# never deserialized into per-worker objects. Sections are little-endian
+# uint32 arrays or UTF-8 blobs, found through a directory after the header,
+# except the lower-case spellings and the diagnostic rules: small marshal
+# payloads (master and workers run the same interpreter) that workers load
+# without decoding any record.
+SHARED_MAGIC = b"SCRSHMEM"
+SHARED_FORMAT = 4
+SHARED_HEADER = struct.Struct("<8sI32sI")
+SHARED_SECTION = struct.Struct("<16sQQ")
+EMPTY_SLOT = 0
+
+def _slot_hash(key: str) -> int:
+    # Stable across processes, unlike hash()
+    return zlib.crc32(key.encode('utf-8'))
+
+def _build_hash_index(keys: Dict[str, int]) -> tuple:
+    """Open-addressing table of (key offset, key length, record + 1) slots."""
+    capacity = 1
+    while capacity < 2 * max(len(keys), 1):
+        capacity *= 2
+    slots = array('I', [EMPTY_SLOT] * (3 * capacity))
+    blob = bytearray()
+    for key, record_index in keys.items():
+        encoded = key.encode('utf-8')
+        slot = _slot_hash(key) & (capacity - 1)
+        while slots[3 * slot + 2] != EMPTY_SLOT:
+            slot = (slot + 1) & (capacity - 1)
+        slots[3 * slot:3 * slot + 3] = array('I', [len(blob), len(encoded), record_index + 1])
+        blob += encoded
+    return slots, bytes(blob)
+
+def _offsets_and_blob(items: List[bytes]) -> tuple:
+    offsets = array('I', [0])
+    for item in items:
+        offsets.append(offsets[-1] + len(item))
+    return offsets, b"".join(items)
+
+def publish_shared_tables(registry: ReporterRegistry, path: Path) -> Path:
+    """Write registry's records, indexes, matcher and diagnostic rules as shared tables at path."""
+    index_of = {record.abbreviation: i for i, record in enumerate(registry.records)}
+    matcher = registry.matcher
+    transitions = [sorted((ord(c), t) for c, t in matcher.goto[s].items()) for s in range(matcher.state_count)]
+    trans_offsets = array('I', [0])
+    for edges in transitions:
+        trans_offsets.append(trans_offsets[-1] + len(edges))
+
+    record_offsets, records_blob = _offsets_and_blob(
+        [json.dumps(record.model_dump()).encode('utf-8') for record in registry.records]
+    )
+    abbreviation_offsets, abbreviations_blob = _offsets_and_blob(
+        [record.abbreviation.encode('utf-8') for record in registry.records]
+    )
+    abbreviation_slots, abbreviation_keys = _build_hash_index(index_of)
+    key_slots, key_keys = _build_hash_index(
+        {key: index_of[record.abbreviation] for key, record in registry.by_key.items()}
+    )
+    sections = {
+        "scalars": array('I', [len(registry.records), matcher.max_length]),
+        "record_offsets": record_offsets,
+        "records": records_blob,
+        "abbr_offsets": abbreviation_offsets,
+        "abbrs": abbreviations_blob,
+        "abbr_slots": abbreviation_slots,
+        "abbr_keys": abbreviation_keys,
+        "key_slots": key_slots,
+        "key_keys": key_keys,
+        "trans_offsets": trans_offsets,
+        "trans_chars": array('I', [c for edges in transitions for c, _ in edges]),
+        "trans_next": array('I', [t for edges in transitions for _, t in edges]),
+        "fail": array('I', matcher.fail),
+        "dict_link": array('I', matcher.dict_link),
+        "out_len": array('I', [o[0] if o else 0 for o in matcher.output]),
+        "out_record": array('I', [index_of[o[1]] + 1 if o else EMPTY_SLOT for o in matcher.output]),
+        "spellings": marshal.dumps(matcher.spellings),
+        "diagnostics": marshal.dumps(registry.diagnostics.tables()),
+    }
+
+    directory_size = SHARED_HEADER.size + SHARED_SECTION.size * len(sections)
+    body = bytearray()
+    directory = []
+    for name, data in sections.items():
+        raw = data.tobytes() if isinstance(data, array) else data
+        body += b"\0" * (-(directory_size + len(body)) % 8)  # keep uint32 arrays aligned
+        directory.append(SHARED_SECTION.pack(name.encode(), directory_size + len(body), len(raw)))
+        body += raw
+    header = SHARED_HEADER.pack(SHARED_MAGIC, SHARED_FORMAT, bytes.fromhex(registry.version), len(sections))
+    partial = path.with_suffix('.partial')
+    partial.write_bytes(header + b"".join(directory) + body)
+    partial.replace(path)
+    return path
+
+class _SharedOutputs:
+    """Read-only view of matcher outputs as (length, abbreviation) or None."""
+
+    def __init__(self, lengths: memoryview, records: memoryview, abbreviation):
+        self.lengths = lengths
+        self.records = records
+        self.abbreviation = abbreviation
+
+    def __getitem__(self, state: int) -> Optional[tuple]:
+        record = self.records[state]
+        if record == EMPTY_SLOT:
+            return None
+        return self.lengths[state], self.abbreviation(record - 1)
+
+class SharedReporterMatcher(ReporterMatcher):
+    """ReporterMatcher whose automaton lives in the shared tables."""
+
+    def __init__(self, sections: Dict[str, memoryview], abbreviation):
+        self.trans_offsets = sections["trans_offsets"]
+        self.trans_chars = sections["trans_chars"]
+        self.trans_next = sections["trans_next"]
+        self.fail = sections["fail"]
+        self.dict_link = sections["dict_link"]
+        self.output = _SharedOutputs(sections["out_len"], sections["out_record"], abbreviation)
+        self.max_length = sections["scalars"][1]
+        self.spellings = marshal.loads(sections["spellings"])
+
+    @property
+    def state_count(self) -> int:
+        return len(self.fail)
+
+    def _transition(self, state: int, char: str) -> Optional[int]:
+        low, high = self.trans_offsets[state], self.trans_offsets[state + 1]
+        code = ord(char)
+        position = bisect_left(self.trans_chars, code, low, high)
+        if position < high and self.trans_chars[position] == code:
+            return self.trans_next[position]
+        return None
+
+class SharedReporterRegistry(ReporterRegistry):
+    """
+    ReporterRegistry backed by shared tables mapped into this worker.
+    Lookups probe the mapped hash indexes; a record is only decoded when a
+    caller asks for it.
+    """
+
+    def __init__(self, mm: mmap.mmap, version: str):
+        self.mm = mm
+        self.version = version
+        self.source = "shared"
+        view = memoryview(mm)
+        _, _, _, section_count = SHARED_HEADER.unpack_from(mm)
+        self.sections: Dict[str, memoryview] = {}
+        for i in range(section_count):
+            name, offset, length = SHARED_SECTION.unpack_from(mm, SHARED_HEADER.size + i * SHARED_SECTION.size)
+            section = view[offset:offset + length]
+            name = name.rstrip(b"\0").decode()
+            is_blob = name in ("records", "abbrs", "abbr_keys", "key_keys", "spellings", "diagnostics")
+            self.sections[name] = section if is_blob else section.cast('I')
+        self.count = self.sections["scalars"][0]
+        self.matcher = SharedReporterMatcher(self.sections, self._abbreviation)
+        self.diagnostics = DiagnosticRules.from_tables(marshal.loads(self.sections["diagnostics"]))
+
+    @classmethod
+    def attach(cls, path: Path) -> "SharedReporterRegistry":
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version_format, version, _ = SHARED_HEADER.unpack_from(mm)
+        if (magic, version_format) != (SHARED_MAGIC, SHARED_FORMAT):
+            raise ValueError(f"{path} is not a shared reporter table")
+        return cls(mm, version.hex())
+
+    def _blob(self, name: str, start: int, end: int) -> str:
+        return bytes(self.sections[name][start:end]).decode('utf-8')
+
+    def _abbreviation(self, index: int) -> str:
+        offsets = self.sections["abbr_offsets"]
+        return self._blob("abbrs", offsets[index], offsets[index + 1])
+
+    def _record(self, index: int) -> ReporterRecord:
+        offsets = self.sections["record_offsets"]
+        data = json.loads(self._blob("records", offsets[index], offsets[index + 1]))
+        return ReporterRecord.model_construct(**{k: tuple(v) if isinstance(v, list) else v for k, v in data.items()})
+
+    def _probe(self, index: str, key: str) -> Optional[ReporterRecord]:
+        slots, keys = self.sections[f"{index}_slots"], self.sections[f"{index}_keys"]
+        capacity = len(slots) // 3
+        encoded = key.encode('utf-8')
+        slot = _slot_hash(key) & (capacity - 1)
+        while slots[3 * slot + 2] != EMPTY_SLOT:
+            offset, length, record = slots[3 * slot:3 * slot + 3]
+            if keys[offset:offset + length] == encoded:
+                return self._record(record - 1)
+            slot = (slot + 1) & (capacity - 1)
+        return None
+
+    @property
+    def records(self) -> Tuple[ReporterRecord, ...]:
+        return tuple(self._record(i) for i in range(self.count))
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def key_count(self) -> int:
+        return sum(1 for record in self.sections["key_slots"][2::3] if record != EMPTY_SLOT)
+
+    def get(self, abbreviation: str) -> Optional[ReporterRecord]:
+        return self._probe("abbr", abbreviation)
+
+    def lookup(self, name: str) -> Optional[ReporterRecord]:
+        return self.get(name.strip()) or self._probe("key", canonical_reporter_key(name))
+
+    def filter(self, jurisdiction: Optional[str] = None, state: Optional[str] = None,
+               court_level: Optional[str] = None) -> Tuple[ReporterRecord, ...]:
+        return tuple(
+            record for record in self.records
+            if (jurisdiction is None or record.jurisdiction == jurisdiction)
+            and (state is None or state in record.states)
+            and (court_level is None or record.court_level == court_level)
+        )
+
+# Diagnostic rules for unverified-citation notes. Each rule fires when any of
+# its keywords occurs in the raw citation (case-insensitively), unless the raw
+# citation contains its `unless` text; the highest priority rule wins. Every
+# reporter's common_citation_mistakes also become rules scoped to that
+# reporter, at MISTAKE_RULE_PRIORITY, in database order.
+DIAGNOSTIC_RULES = [
+    {"name": "f3rd-typo", "priority": 30, "keywords": ["f3rd"],
+     "note": "probable typo: 'F3rd' should be 'F.3d'"},
+    {"name": "f3d-missing-period", "priority": 20, "keywords": ["f3d"], "unless": ".",
+     "note": "missing period: should be 'F.3d'"},
+    {"name": "informal-scotus", "priority": 10, "keywords": ["scotus"],
+     "note": "informal abbreviation: use proper reporter"},
+]
+MISTAKE_RULE_PRIORITY = 0
+
+class DiagnosticRules:
+    """
+    Rules engine compiled once from DIAGNOSTIC_RULES and the reporter
+    database. All rule keywords share one Aho-Corasick automaton, so a
+    citation is diagnosed in a single pass over its characters.
+    """
+
+    def __init__(self, records: Tuple[ReporterRecord, ...], rules: List[Dict[str, Any]] = DIAGNOSTIC_RULES):
+        # Rule tuples are (priority, order, note, unless); lower order wins ties
+        self.rules: List[tuple] = []
+        keyword_ids: Dict[str, int] = {}
+        # keyword id -> rule ids, for global rules and per (reporter, keyword id)
+        self.global_rules: Dict[int, List[int]] = {}
+        self.reporter_rules: Dict[tuple, List[int]] = {}
+
+        def add(keywords: List[str], priority: int, note: str, reporter: Optional[str] = None,
+                unless: Optional[str] = None):
+            rule_id = len(self.rules)
+            self.rules.append((priority, rule_id, note, unless))
+            for keyword in keywords:
+                keyword_id = keyword_ids.setdefault(keyword.lower(), len(keyword_ids))
+                if reporter is None:
+                    self.global_rules.setdefault(keyword_id, []).append(rule_id)
+                else:
+                    self.reporter_rules.setdefault((reporter, keyword_id), []).append(rule_id)
+
+        for rule in rules:
+            add(rule["keywords"], rule["priority"], rule["note"], unless=rule.get("unless"))
+        for record in records:
+            for mistake in record.common_citation_mistakes:
+                note = f"possible error: {mistake[:50]}..." if len(mistake) > 50 else f"possible error: {mistake}"
+                add([word for word in mistake.lower().split() if len(word) > 2],
+                    MISTAKE_RULE_PRIORITY, note, reporter=record.abbreviation)
+
+        # Aho-Corasick over every keyword; hits[state] lists the keyword ids
+        # ending at that state, including those reached through failure links
+        self.goto, self.fail, ends, order = build_automaton(list(keyword_ids))
+        self.hits: List[List[int]] = [[] for _ in self.goto]
+        for keyword_id, state in enumerate(ends):
+            self.hits[state].append(keyword_id)
+        for state in order:
+            self.hits[state] = self.hits[state] + self.hits[self.fail[state]]
+
+    @classmethod
+    def from_tables(cls, tables: tuple) -> "DiagnosticRules":
+        """Rebuild rules from tables() without recompiling them."""
+        diagnostics = cls.__new__(cls)
+        (diagnostics.rules, diagnostics.global_rules, diagnostics.reporter_rules,
+         diagnostics.goto, diagnostics.fail, diagnostics.hits) = tables
+        return diagnostics
+
+    def tables(self) -> tuple:
+        return self.rules, self.global_rules, self.reporter_rules, self.goto, self.fail, self.hits
+
+    def diagnose(self, raw_citation: str, reporter: Optional[str]) -> Optional[str]:
+        """Note of the highest priority rule matching raw_citation, if any."""
+        found = set()
+        state = 0
+        for char in raw_citation.lower():
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            found.update(self.hits[state])
+
+        best = None
+        for keyword_id in found:
+            for rule_id in self.global_rules.get(keyword_id, []) + (
+                self.reporter_rules.get((reporter, keyword_id), []) if reporter else []
+            ):
+                priority, order, note, unless = self.rules[rule_id]
+                if unless and unless in raw_citation:
+                    continue
+                if best is None or (priority, -order) > (best[0], -best[1]):
+                    best = self.rules[rule_id]
+        return best[2] if best else None
+
+
+if __name__ == "__main__":
+    # Build step: python reporters.py
+    version = compile_reporter_snapshot()
+    print(f"Compiled {REPORTERS_SNAPSHOT} (version {version})")
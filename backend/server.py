@@ -1,40 +1,1407 @@
-from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File
+from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Form, Depends, Query, Response, Header
+from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
+import asyncio
 import logging
 import json
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal, AsyncIterator, Tuple, Callable, Awaitable
 import uuid
-from datetime import datetime
-import requests
+from datetime import datetime, timedelta
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+import hashlib
+import functools
+import hmac
+import time
+import threading
+from pymongo import UpdateOne, ReturnDocument
+from email.utils import parsedate_to_datetime
+import random
+import httpx
 import PyPDF2
 import io
+import re
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Legal reporters database; imported after .env so REPORTERS_SNAPSHOT applies
+from reporters import (
+    REPORTERS_FILE, CITATION_SHAPE, ReporterRecord, ReporterRegistry,
+    canonical_reporter_key, canonical_citation_key, canonical_series_key, publish_shared_tables,
+)
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
-# Load legal reporters data
-REPORTERS_FILE = ROOT_DIR.parent / 'legal_reporters_comprehensive.json'
-with open(REPORTERS_FILE, 'r') as f:
-    LEGAL_REPORTERS = json.load(f)
+# Metrics: in-process counters and histograms, rendered in the Prometheus
+# text format at /metrics. An update is a dict lookup and a few additions
+# under an uncontended lock (pipeline stages of large documents record from
+# worker threads), with no background work, so collection stays on under
+# production load. Every worker process keeps its own series; the
+# scrape sees whichever worker answers, so aggregate with sum() per instance.
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+METRIC_HELP = {
+    "strikecite_stage_seconds": "Time spent per pipeline stage",
+    "strikecite_pdf_pages_total": "PDF pages scheduled for text extraction",
+    "strikecite_citations_total": "Citations validated, by verification outcome",
+    "strikecite_reporter_matches_total": "Reporter identifications by matching strategy and result",
+    "strikecite_upstream_responses_total": "CourtListener responses by HTTP status, or error for transport errors",
+    "strikecite_upstream_request_bytes": "Size of request bodies sent to CourtListener",
+    "strikecite_upstream_response_bytes": "Size of response bodies received from CourtListener",
+    "strikecite_upstream_requests_total": "Requests sent to CourtListener, retries included",
+    "strikecite_upstream_retries_total": "CourtListener requests retried",
+    "strikecite_upstream_throttled_total": "CourtListener 429 responses",
+    "strikecite_upstream_coalesced_total": "Lookups that joined an identical request already in flight",
+    "strikecite_rate_limiter_acquired_total": "Rate limiter tokens acquired",
+    "strikecite_rate_limiter_wait_seconds_total": "Time spent waiting for rate limiter tokens",
+    "strikecite_rate_limiter_wait_seconds_max": "Longest wait for a rate limiter token",
+    "strikecite_circuit_breaker_open": "1 while the circuit breaker refuses CourtListener requests",
+    "strikecite_circuit_breaker_trips_total": "Times the circuit breaker opened",
+}
+
+class Histogram:
+    """Cumulative-bucket histogram; the last count is the +Inf bucket."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+class Metrics:
+    """Counters and histograms by name, with one series per set of label values."""
+
+    def __init__(self):
+        self.counters: Dict[str, Dict[tuple, float]] = {}
+        self.histograms: Dict[str, Dict[tuple, Histogram]] = {}
+        self.lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = tuple(labels.items())
+        with self.lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets: tuple = LATENCY_BUCKETS, **labels):
+        key = tuple(labels.items())
+        with self.lock:
+            series = self.histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def stage(self, stage: str, seconds: float):
+        """Record time spent in a pipeline stage, also charging it to the current request."""
+        self.observe("strikecite_stage_seconds", seconds, stage=stage)
+        cost = REQUEST_COST.get()
+        if cost is not None:
+            with self.lock:
+                cost.stages[stage] = cost.stages.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def time(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage(stage, time.perf_counter() - started)
+
+    def timed(self, stage: str):
+        """Decorator timing every call of a function as the given stage."""
+        def decorate(function):
+            @functools.wraps(function)
+            def timed_call(*args, **kwargs):
+                with self.time(stage):
+                    return function(*args, **kwargs)
+            return timed_call
+        return decorate
+
+    def render(self) -> List[str]:
+        with self.lock:
+            return self._render()
+
+    def _render(self) -> List[str]:
+        lines = []
+        for name, series in sorted(self.counters.items()):
+            lines += metric_header(name, "counter")
+            lines += [f"{name}{metric_labels(key)} {value}" for key, value in series.items()]
+        for name, series in sorted(self.histograms.items()):
+            lines += metric_header(name, "histogram")
+            for key, histogram in series.items():
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + ("+Inf",), histogram.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{metric_labels(key + (('le', bound),))} {cumulative}")
+                lines.append(f"{name}_sum{metric_labels(key)} {histogram.sum}")
+                lines.append(f"{name}_count{metric_labels(key)} {histogram.count}")
+        return lines
+
+def metric_header(name: str, kind: str) -> List[str]:
+    return [f"# HELP {name} {METRIC_HELP.get(name, name)}", f"# TYPE {name} {kind}"]
+
+def metric_labels(key: tuple) -> str:
+    if not key:
+        return ""
+    escaped = (
+        (label, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for label, value in key
+    )
+    return "{" + ",".join(f'{label}="{value}"' for label, value in escaped) + "}"
+
+METRICS = Metrics()
+
+# Per-request cost, sent back in Server-Timing and X-* headers so a slow
+# document can be explained without reproducing it. Stages and upstream
+# traffic are charged to the request whose context they run in; a lookup
+# coalesced onto another request's flight is charged to that request.
+# Upstream time is summed over concurrent chunk requests, so it can exceed
+# the wall time.
+SERVER_TIMING_STAGES = (
+    ("extraction", ("pdf_parse", "extract")),
+    ("upstream", ("upstream",)),
+    ("validation", ("validate",)),
+    ("serialization", ("serialize",)),
+)
+COST_HEADERS = ("Server-Timing", "X-Page-Count", "X-Text-Length", "X-Citation-Count",
+                "X-Upstream-Bytes-Sent", "X-Upstream-Bytes-Received")
+
+class RequestCost:
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.page_count: Optional[int] = None
+        self.text_length: Optional[int] = None
+        self.citation_count: Optional[int] = None
+        self.upstream_bytes_sent = 0
+        self.upstream_bytes_received = 0
+
+    @classmethod
+    def start(cls) -> "RequestCost":
+        """A new cost, charged with everything the current request does from here on."""
+        cost = cls()
+        REQUEST_COST.set(cost)
+        return cost
+
+    def headers(self) -> Dict[str, str]:
+        timing = ", ".join(
+            f"{name};dur={sum(self.stages.get(stage, 0.0) for stage in stages) * 1000:.1f}"
+            for name, stages in SERVER_TIMING_STAGES
+        )
+        values = (timing, self.page_count, self.text_length, self.citation_count,
+                  self.upstream_bytes_sent, self.upstream_bytes_received)
+        # Counts that are unknown (e.g. pages of a text request) are left out
+        return {header: str(value) for header, value in zip(COST_HEADERS, values) if value is not None}
+
+REQUEST_COST: ContextVar[Optional[RequestCost]] = ContextVar("request_cost", default=None)
+
+REPORTER_REGISTRY = ReporterRegistry.load()
+
+# The registry a request started with. Requests pin it once and every
+# pipeline stage reads it through reporter_registry(), so a reload landing
+# mid-request never mixes two databases within one result.
+PINNED_REGISTRY: ContextVar[Optional[ReporterRegistry]] = ContextVar("pinned_registry", default=None)
+
+def reporter_registry() -> ReporterRegistry:
+    return PINNED_REGISTRY.get() or REPORTER_REGISTRY
+
+def pin_reporter_registry() -> ReporterRegistry:
+    """Pin the current registry (or keep an outer pin) for the rest of this request."""
+    registry = reporter_registry()
+    PINNED_REGISTRY.set(registry)
+    return registry
+
+# Hot reload: a new registry is built off the event loop and swapped in with
+# one assignment; requests already running keep the registry they pinned.
+# Every worker reloads on its own: through its file watcher, or by following
+# the reload requests other workers publish in Mongo. A reloaded worker
+# keeps private tables, not the shared ones, until it restarts.
+REPORTERS_WATCH_INTERVAL = float(os.environ.get('REPORTERS_WATCH_INTERVAL', 0))
+REPORTERS_SYNC_INTERVAL = float(os.environ.get('REPORTERS_SYNC_INTERVAL', 5))
+_reload_lock = asyncio.Lock()
+
+async def reload_reporter_registry(json_path: Path = REPORTERS_FILE) -> Dict[str, Any]:
+    """Rebuild the registry from json_path and swap it in if it changed."""
+    global REPORTER_REGISTRY
+    async with _reload_lock:
+        previous = REPORTER_REGISTRY.version
+        registry = await asyncio.to_thread(ReporterRegistry.from_json, json_path)
+        reloaded = registry.version != previous
+        if reloaded:
+            REPORTER_REGISTRY = registry
+            logger.info(f"Reloaded {len(registry)} legal reporters (version {registry.version[:12]})")
+        return {
+            "reloaded": reloaded,
+            "previous_version": previous,
+            "version": REPORTER_REGISTRY.version,
+            "reporters_loaded": len(REPORTER_REGISTRY),
+        }
+
+async def watch_reporters_file(interval: float, json_path: Path = REPORTERS_FILE):
+    """Reload the registry whenever the JSON database's modification time changes."""
+    last_modified = json_path.stat().st_mtime_ns
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            modified = json_path.stat().st_mtime_ns
+            if modified != last_modified:
+                last_modified = modified
+                await reload_reporter_registry(json_path)
+        except Exception as e:
+            logger.error(f"Could not reload reporters from {json_path}: {e}")
+
+class ReloadSignal:
+    """
+    Reload requests shared by all workers through one Mongo document: a
+    worker that reloaded bumps its generation, and every other worker
+    reloads when it sees a generation it has not handled yet.
+    """
+
+    def __init__(self, collection, key: str = "reporters"):
+        self.collection = collection
+        self.key = key
+        self.seen: Optional[int] = None
+
+    async def publish(self) -> int:
+        doc = await self.collection.find_one_and_update(
+            {"_id": self.key},
+            {"$inc": {"generation": 1}, "$set": {"requested_at": datetime.utcnow()}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        self.seen = doc["generation"]
+        return self.seen
+
+    async def follow(self, interval: float):
+        while True:
+            try:
+                doc = await self.collection.find_one({"_id": self.key})
+                generation = doc["generation"] if doc else 0
+                if self.seen is None:
+                    self.seen = generation  # this worker started with the current database
+                elif generation != self.seen:
+                    self.seen = generation
+                    await reload_reporter_registry()
+            except Exception as e:
+                logger.error(f"Could not follow reporter reload requests: {e}")
+            await asyncio.sleep(interval)
+
+# Local citation extraction
+# Vendor databases cite as "year [court] vendor number", e.g. "2023 WL 123456"
+# or "2023 U.S. Dist. LEXIS 4567"; everything else is "volume reporter page",
+# which also covers neutral citations such as "2014 WY 20".
+VENDOR_REPORTERS = {'WL', 'LEXIS'}
+VOLUME_BEFORE = re.compile(r'(\d{1,5})\s+$')
+VENDOR_PREFIX_BEFORE = re.compile(r"((?:19|20)\d{2})\s+((?:[A-Z][A-Za-z.']*\s+){0,3})$")
+VENDOR_CITATION = re.compile(
+    rf"^\s*(?:19|20)\d{{2}}\s+(?:[A-Z][A-Za-z.']*\s+){{0,3}}?({'|'.join(sorted(VENDOR_REPORTERS))})\s+\d+\s*$"
+)
+PAGE_AFTER = re.compile(r'\s*(\d{1,7})\b')
+LOOKBEHIND_CHARS = 40
+
+# Status for citations that were found locally and never sent to CourtListener
+STATUS_NOT_LOOKED_UP = 0
+
+def _match_citation_span(text: str, start: int, end: int, abbreviation: str) -> Optional[tuple]:
+    """Return (citation_start, citation_end, volume, page) around a reporter match."""
+    page_match = PAGE_AFTER.match(text, end)
+    if not page_match:
+        return None
+    before = text[max(0, start - LOOKBEHIND_CHARS):start]
+    pattern = VENDOR_PREFIX_BEFORE if abbreviation in VENDOR_REPORTERS else VOLUME_BEFORE
+    volume_match = pattern.search(before)
+    if not volume_match:
+        return None
+    citation_start = start - len(before) + volume_match.start()
+    return citation_start, page_match.end(), volume_match.group(1), page_match.group(1)
+
+def _citation_element(raw: str, normalized: str, start: int, end: int) -> Dict[str, Any]:
+    return {
+        "citation": raw,
+        "normalized_citations": [normalized],
+        "start_index": start,
+        "end_index": end,
+        "status": STATUS_NOT_LOOKED_UP,
+        "error_message": "",
+        "clusters": [],
+    }
+
+def _series_name(written: str, abbreviation: str) -> str:
+    """
+    Name to normalize a matched reporter to: its abbreviation, or for a later
+    series listed as an alias of the first ("N.Y.S.2d" of "N.Y.S."), that alias.
+    """
+    key = canonical_series_key(written, abbreviation)
+    if key == canonical_reporter_key(abbreviation):
+        return abbreviation
+    record = reporter_registry().get(abbreviation)
+    for alias in record.aliases if record else ():
+        if canonical_reporter_key(alias) == key:
+            return alias
+    return ' '.join(written.split())
+
+@METRICS.timed("extract")
+def extract_citations_local(text: str) -> List[Dict[str, Any]]:
+    """
+    Find citations in text without calling CourtListener, including ones
+    to a series that was never published (e.g. "F.1d") so the pre-flight
+    check can reject them.
+    Returns CitationElement-shaped dicts with offsets into the original text.
+    """
+    elements = []
+    accept = lambda start, end, abbreviation: _match_citation_span(text, start, end, abbreviation) is not None
+    for start, end, abbreviation in reporter_registry().matcher.finditer(text, accept):
+        citation_start, citation_end, volume, page = _match_citation_span(text, start, end, abbreviation)
+        raw = text[citation_start:citation_end]
+        if abbreviation in VENDOR_REPORTERS:
+            normalized = re.sub(r'\s+', ' ', raw)
+        else:
+            normalized = f"{volume} {_series_name(text[start:end], abbreviation)} {page}"
+        elements.append(_citation_element(raw, normalized, citation_start, citation_end))
+    for match in SERIES_CITATION.finditer(text):
+        if _series_error(match.group(2)):
+            raw = match.group(0)
+            elements.append(_citation_element(raw, ' '.join(raw.split()), match.start(), match.end()))
+    elements.sort(key=lambda element: element['start_index'])
+    return elements
+
+# Local pre-flight: citations that cannot exist according to the reporter
+# metadata (a series that was never published, a volume outside a series)
+# are rejected with a precise note and never sent upstream. A year outside
+# the reporter's publication span only earns a warning: year spans are less
+# reliable than volumes, and a wrong year does not make the citation wrong.
+# Years get some slack since series overlap around their changeover.
+STATUS_PREFLIGHT_FAILED = 422
+YEAR_SPAN_GRACE = 1
+SERIES_SUFFIX = re.compile(r'^(.*?)\s*(\d{1,2})(?:st|nd|rd|d|th)$')
+SERIES_CITATION = re.compile(
+    r"\b(\d{1,5})\s+([A-Z][A-Za-z.']*(?:\s[A-Z][A-Za-z.']*){0,2}?\s?\d{1,2}(?:st|nd|rd|d|th))\s+(\d{1,7})\b"
+)
+
+def _series_error(name: str) -> Optional[str]:
+    """Note for a series of a known reporter family that was never published."""
+    suffix = SERIES_SUFFIX.match(name)
+    registry = reporter_registry()
+    first = registry.lookup(suffix.group(1)) if suffix else None
+    if first is None or first.successor is None:
+        return None
+    series = [first.abbreviation]
+    record = first
+    while record.successor and record.successor not in series:
+        record = registry.get(record.successor)
+        if record is None:
+            break
+        series.append(record.abbreviation)
+    number = int(suffix.group(2))
+    if number == 1:
+        return f"impossible citation: there is no '{name}', the first series is cited as '{first.abbreviation}'"
+    if number > len(series):
+        return f"impossible citation: there is no '{name}', the latest series is '{series[-1]}'"
+    return None
+
+def preflight_error(citation: str) -> Optional[str]:
+    """Why a "volume reporter page" citation cannot exist, or None if it may."""
+    shape = CITATION_SHAPE.match(citation)
+    if not shape:
+        return None
+    record = reporter_registry().lookup(shape.group(2))
+    if record is None:
+        return _series_error(shape.group(2).strip())
+    abbreviation = record.abbreviation
+    volume = int(shape.group(1))
+    if volume < (record.first_volume or 1) or (record.last_volume and volume > record.last_volume):
+        volumes = f"{record.first_volume or 1}-{record.last_volume or 'present'}"
+        note = f"impossible citation: '{abbreviation}' has no volume {volume} (volumes {volumes})"
+        if record.successor and record.last_volume and volume > record.last_volume:
+            note += f", later volumes are in '{record.successor}'"
+        return note
+    return None
+
+def year_span_warning(citation: str, text: Optional[str] = None, end: int = 0) -> Optional[str]:
+    """
+    Warning for a citation dated outside its reporter's publication span, or
+    None. The year comes from the parenthetical after end in text, if given.
+    """
+    shape = CITATION_SHAPE.match(citation)
+    record = reporter_registry().lookup(shape.group(2)) if shape else None
+    if record is None or not (record.first_year or record.last_year):
+        return None
+    parsed = parse_citation(citation, record.abbreviation, text, end)
+    year = parsed.year if parsed else None
+    if year is None:
+        return None
+    if record.first_year and year < record.first_year - YEAR_SPAN_GRACE:
+        return f"check year: '{record.abbreviation}' begins in {record.first_year}, after {year}"
+    if record.last_year and year > record.last_year + YEAR_SPAN_GRACE:
+        note = f"check year: '{record.abbreviation}' ends in {record.last_year}, before {year}"
+        if record.successor:
+            note += f"; {year} decisions are in '{record.successor}'"
+        return note
+    return None
+
+def preflight(elements: List[Dict[str, Any]], text: Optional[str] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Split elements into those that may exist and rejected ones, marked
+    invalid. Passed elements dated outside their reporter's span carry a
+    preflight_warning.
+    """
+    passed, rejected = [], []
+    for element in elements:
+        note = preflight_error(element['citation'])
+        if note:
+            rejected.append({**element, "status": STATUS_PREFLIGHT_FAILED, "error_message": note})
+            continue
+        warning = year_span_warning(element['citation'], text, element['end_index'])
+        passed.append({**element, "preflight_warning": warning} if warning else element)
+    return passed, rejected
+
+def mask_spans(text: str, elements: List[Dict[str, Any]]) -> str:
+    """Blank out the elements' spans with spaces, keeping every other offset."""
+    parts = []
+    position = 0
+    for element in sorted(elements, key=lambda e: e['start_index']):
+        start = max(element['start_index'], position)
+        parts.append(text[position:start])
+        parts.append(' ' * (element['end_index'] - start))
+        position = element['end_index']
+    parts.append(text[position:])
+    return "".join(parts)
+
+# Parallel citations: consecutive citations to different reporters with only
+# commas and pin cites between them share one closing parenthetical and name
+# one authority, e.g. "410 U.S. 113, 93 S. Ct. 705, 35 L. Ed. 2d 147 (1973)".
+# A group's ID is the canonical key of its first member.
+PARALLEL_GAP = re.compile(r'\s*,(?:\s*\d+(?:\s*[-\u2013]\s*\d+)?\s*,)*\s*')
+
+def _element_reporter(element: Dict[str, Any]) -> Optional[str]:
+    shape = CITATION_SHAPE.match((element.get('normalized_citations') or [element.get('citation', '')])[0])
+    record = reporter_registry().lookup(shape.group(2)) if shape else None
+    return record.abbreviation if record else None
+
+def group_parallel_citations(elements: List[Dict[str, Any]], text: str) -> List[List[Dict[str, Any]]]:
+    """
+    Split elements, sorted by offset, into runs of parallel citations; every
+    element of a run of two or more gets the run's group_id.
+    """
+    groups: List[List[Dict[str, Any]]] = []
+    reporters: List[Optional[set]] = []  # per group, None once a member has no known reporter
+    for element in elements:
+        reporter = _element_reporter(element)
+        if groups and reporter and reporters[-1] and reporter not in reporters[-1] and PARALLEL_GAP.fullmatch(
+            text, groups[-1][-1]['end_index'], element['start_index']
+        ):
+            groups[-1].append(element)
+            reporters[-1].add(reporter)
+        else:
+            groups.append([element])
+            reporters.append({reporter} if reporter else None)
+    for group in groups:
+        if len(group) > 1:
+            group_id = VerificationCache.key(group[0])
+            for element in group:
+                element['group_id'] = group_id
+    return groups
+
+# Layer B: CourtListener upstream client
+COURTLISTENER_URL = os.environ.get(
+    'COURTLISTENER_URL', "https://www.courtlistener.com/api/rest/v4/citation-lookup/"
+)
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx when installed)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+class CourtListenerError(Exception):
+    """Non-200 response from the CourtListener citation-lookup API."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+    @property
+    def unavailable(self) -> bool:
+        """True for upstream outages, as opposed to problems with the request."""
+        return self.status_code >= 500
+
+class UpstreamUnavailable(CourtListenerError):
+    """CourtListener is unreachable, or the circuit breaker is refusing calls."""
+
+    def __init__(self, detail: str = "circuit breaker open"):
+        super().__init__(503, detail)
+
+# Status for citations left unverified because CourtListener is unavailable
+STATUS_UPSTREAM_UNAVAILABLE = 503
+
+class CircuitBreaker:
+    """
+    Circuit breaker over upstream requests. While closed it keeps the outcome
+    of the last `window` requests; a request fails on a 5xx response, a
+    transport error or by taking longer than slow_seconds. Once min_calls
+    outcomes are in and failure_rate of them are failures it opens and
+    refuses requests for open_seconds. Then it is half-open: one trial
+    request goes through, closing it on success and reopening it on failure.
+    """
+
+    def __init__(self, failure_rate: float = 0.5, slow_seconds: float = 10.0, window: int = 20,
+                 min_calls: int = 5, open_seconds: float = 30.0):
+        self.failure_rate = failure_rate
+        self.slow_seconds = slow_seconds
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.outcomes: deque = deque(maxlen=window)
+        self.state = "closed"
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.trips = 0
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreaker":
+        return cls(
+            failure_rate=float(os.environ.get('COURTLISTENER_BREAKER_FAILURE_RATE', 0.5)),
+            slow_seconds=float(os.environ.get('COURTLISTENER_BREAKER_SLOW_SECONDS', 10)),
+            window=int(os.environ.get('COURTLISTENER_BREAKER_WINDOW', 20)),
+            min_calls=int(os.environ.get('COURTLISTENER_BREAKER_MIN_CALLS', 5)),
+            open_seconds=float(os.environ.get('COURTLISTENER_BREAKER_OPEN_SECONDS', 30)),
+        )
+
+    def allow(self) -> bool:
+        """Whether a request may go upstream now; each allowed one must be recorded or released."""
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.open_seconds:
+                return False
+            self.state = "half_open"
+        if self.state == "half_open":
+            if self.trial_in_flight:
+                return False
+            self.trial_in_flight = True
+        return True
+
+    def record(self, ok: bool, seconds: float):
+        ok = ok and seconds <= self.slow_seconds
+        if self.state == "half_open":
+            self.trial_in_flight = False
+            if ok:
+                self.state = "closed"
+            else:
+                self._open()
+            return
+        self.outcomes.append(ok)
+        if len(self.outcomes) >= self.min_calls and self.outcomes.count(False) >= self.failure_rate * len(self.outcomes):
+            self._open()
+
+    def release(self):
+        """Forget an allowed request that ended without an outcome (e.g. cancelled)."""
+        if self.state == "half_open":
+            self.trial_in_flight = False
+
+    def _open(self):
+        self.state = "open"
+        self.opened_at = time.monotonic()
+        self.outcomes.clear()
+        self.trips += 1
+
+    def stats(self) -> Dict[str, Any]:
+        failures = self.outcomes.count(False)
+        return {
+            "state": self.state,
+            "recent_failure_rate": round(failures / len(self.outcomes), 3) if self.outcomes else 0.0,
+            "trips": self.trips,
+            "retry_in_seconds": (
+                round(max(0.0, self.open_seconds - (time.monotonic() - self.opened_at)), 1)
+                if self.state == "open" else None
+            ),
+        }
+
+class TokenBucket:
+    """
+    Process-wide token bucket for upstream calls: `rate` tokens a second, up
+    to `capacity` saved for bursts. acquire() waits for a token, in arrival
+    order, and returns how long it queued; penalize() holds every caller
+    back for a while, e.g. after a 429.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+        self.acquired = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @classmethod
+    def from_env(cls, database) -> Optional["TokenBucket"]:
+        """Bucket sized from COURTLISTENER_RATE_* settings, or None when unlimited."""
+        per_minute = float(os.environ.get('COURTLISTENER_RATE_PER_MINUTE', 60))
+        if per_minute <= 0:
+            return None
+        capacity = float(os.environ.get('COURTLISTENER_BURST', 5))
+        if os.environ.get('COURTLISTENER_RATE_SHARED', 'false').lower() == 'true':
+            return MongoTokenBucket(database.upstream_rate_limit, per_minute / 60, capacity)
+        return cls(per_minute / 60, capacity)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def _take(self) -> float:
+        """Take a token if there is one and return 0, else the seconds until there is."""
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    async def acquire(self) -> float:
+        started = time.monotonic()
+        async with self.lock:
+            while True:
+                delay = await self._take()
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+        waited = time.monotonic() - started
+        self.acquired += 1
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return waited
+
+    async def penalize(self, seconds: float):
+        """Hand out no tokens for the next `seconds`."""
+        self._refill()
+        self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.capacity,
+            "acquired": self.acquired,
+            "queue_delay_seconds_total": round(self.wait_seconds, 3),
+            "queue_delay_seconds_max": round(self.max_wait_seconds, 3),
+        }
+
+class MongoTokenBucket(TokenBucket):
+    """
+    TokenBucket whose tokens live in one Mongo document shared by every
+    worker, refilled and taken in a single atomic update against the
+    server's clock. Falls back to the local bucket while Mongo is unreachable.
+    """
+
+    def __init__(self, collection, rate: float, capacity: float, key: str = "courtlistener"):
+        super().__init__(rate, capacity)
+        self.collection = collection
+        self.key = key
+
+    async def _take(self) -> float:
+        elapsed_ms = {"$subtract": ["$$NOW", {"$ifNull": ["$updated_at", "$$NOW"]}]}
+        try:
+            doc = await self.collection.find_one_and_update(
+                {"_id": self.key},
+                [
+                    {"$set": {
+                        "tokens": {"$min": [self.capacity, {"$add": [
+                            {"$ifNull": ["$tokens", self.capacity]},
+                            {"$multiply": [self.rate / 1000, elapsed_ms]},
+                        ]}]},
+                        "updated_at": "$$NOW",
+                    }},
+                    {"$set": {"granted": {"$gte": ["$tokens", 1]}}},
+                    {"$set": {"tokens": {"$cond": ["$granted", {"$subtract": ["$tokens", 1]}, "$tokens"]}}},
+                ],
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except Exception as e:
+            logger.warning(f"Shared rate limiter unavailable, limiting locally: {e}")
+            return await super()._take()
+        return 0.0 if doc["granted"] else (1 - doc["tokens"]) / self.rate
+
+    async def penalize(self, seconds: float):
+        try:
+            await self.collection.update_one(
+                {"_id": self.key},
+                [{"$set": {
+                    "tokens": {"$min": [{"$ifNull": ["$tokens", self.capacity]}, 1 - seconds * self.rate]},
+                    "updated_at": "$$NOW",
+                }}],
+                upsert=True,
+            )
+        except Exception as e:
+            logger.warning(f"Shared rate limiter unavailable, limiting locally: {e}")
+            await super().penalize(seconds)
+
+class CourtListenerClient:
+    """
+    Shared async HTTP client for the CourtListener citation-lookup API.
+    One instance is opened at startup and reused by every request, so
+    connections are pooled and kept alive instead of blocking the event loop.
+    Pass a custom transport (e.g. httpx.MockTransport) to point it at a stand-in.
+    Calls wait for the rate limiter, when there is one, and 429/5xx responses
+    are retried with jittered exponential backoff, honoring Retry-After.
+    Concurrent lookups of identical text share one upstream request, and a
+    circuit breaker, when given, fails lookups fast during an outage.
+    """
+
+    RETRY_STATUSES = (429, 502, 503, 504)
+
+    def __init__(
+        self,
+        url: str = COURTLISTENER_URL,
+        api_key: Optional[str] = None,
+        pool_size: int = 20,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        limiter: Optional[TokenBucket] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        max_retry_wait: float = 30.0,
+    ):
+        self.url = url
+        self.limiter = limiter
+        self.breaker = breaker
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_retry_wait = max_retry_wait
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.coalesced = 0
+        # SHA-256 of the text -> task of the upstream request being made for it
+        self.in_flight: Dict[str, asyncio.Task] = {}
+        self.api_key = api_key if api_key is not None else os.environ.get('COURTLISTENER_API_KEY', '')
+        self.http = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Token {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            http2=http2 and HTTP2_AVAILABLE,
+            transport=transport,
+        )
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "CourtListenerClient":
+        """Build a client configured from COURTLISTENER_* environment variables."""
+        return cls(
+            pool_size=int(os.environ.get('COURTLISTENER_POOL_SIZE', 20)),
+            connect_timeout=float(os.environ.get('COURTLISTENER_CONNECT_TIMEOUT', 5)),
+            read_timeout=float(os.environ.get('COURTLISTENER_READ_TIMEOUT', 60)),
+            http2=os.environ.get('COURTLISTENER_HTTP2', 'true').lower() == 'true',
+            max_retries=int(os.environ.get('COURTLISTENER_MAX_RETRIES', 3)),
+            max_retry_wait=float(os.environ.get('COURTLISTENER_MAX_RETRY_WAIT', 30)),
+            **kwargs,
+        )
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None if Retry-After asks for too long."""
+        backoff = random.uniform(0, min(self.max_retry_wait, self.backoff_base * 2 ** attempt))
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return backoff
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return backoff
+        delay = max(delay, 0.0)
+        # Jitter on top, so callers held back together do not retry together
+        return delay + random.uniform(0, self.backoff_base) if delay <= self.max_retry_wait else None
+
+    async def lookup(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Send text to the citation-lookup API and return its LOOKUP_JSON. A call
+        made while the same text is already in flight awaits that request;
+        every caller gets its own copy of the elements to rebase or annotate.
+        """
+        key = hashlib.sha256(text.encode()).hexdigest()
+        flight = self.in_flight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._lookup(text))
+            self.in_flight[key] = flight
+            flight.add_done_callback(lambda done: self._landed(key, done))
+        else:
+            self.coalesced += 1
+        # Shielded so one caller going away does not cancel it for the others
+        result = await asyncio.shield(flight)
+        return [dict(element) for element in result]
+
+    def _landed(self, key: str, flight: asyncio.Task):
+        self.in_flight.pop(key, None)
+        if not flight.cancelled():
+            flight.exception()  # retrieved here in case every caller went away
+
+    async def _post(self, text: str) -> httpx.Response:
+        """One upstream request, gated and recorded by the circuit breaker."""
+        if self.breaker and not self.breaker.allow():
+            raise UpstreamUnavailable()
+        started = time.monotonic()
+        try:
+            if self.limiter:
+                await self.limiter.acquire()
+            self.requests += 1
+            started = time.monotonic()
+            response = await self.http.post(self.url, json={"text": text})
+        except httpx.TransportError as e:
+            if self.breaker:
+                self.breaker.record(False, time.monotonic() - started)
+            METRICS.inc("strikecite_upstream_responses_total", status="error")
+            raise UpstreamUnavailable(f"CourtListener unreachable: {e!r}")
+        except BaseException:
+            if self.breaker:
+                self.breaker.release()
+            raise
+        elapsed = time.monotonic() - started
+        if self.breaker:
+            self.breaker.record(response.status_code < 500, elapsed)
+        sent, received = len(response.request.content), len(response.content)
+        METRICS.stage("upstream", elapsed)
+        METRICS.inc("strikecite_upstream_responses_total", status=str(response.status_code))
+        METRICS.observe("strikecite_upstream_request_bytes", sent, SIZE_BUCKETS)
+        METRICS.observe("strikecite_upstream_response_bytes", received, SIZE_BUCKETS)
+        cost = REQUEST_COST.get()
+        if cost is not None:
+            cost.upstream_bytes_sent += sent
+            cost.upstream_bytes_received += received
+        return response
+
+    async def _lookup(self, text: str) -> List[Dict[str, Any]]:
+        for attempt in range(self.max_retries + 1):
+            response = await self._post(text)
+            if response.status_code == 200:
+                return response.json()
+            if response.status_code == 429:
+                self.throttled += 1
+            delay = self._retry_delay(response, attempt) if response.status_code in self.RETRY_STATUSES else None
+            if delay is None or attempt == self.max_retries:
+                raise CourtListenerError(response.status_code, response.text)
+            self.retries += 1
+            if response.status_code == 429 and self.limiter:
+                # Hold back every caller sharing the bucket, not just this one
+                await self.limiter.penalize(delay)
+            else:
+                await asyncio.sleep(delay)
+
+    def metric_lines(self) -> List[str]:
+        """Client, rate limiter and circuit breaker state in the /metrics format."""
+        samples = [
+            ("strikecite_upstream_requests_total", "counter", self.requests),
+            ("strikecite_upstream_retries_total", "counter", self.retries),
+            ("strikecite_upstream_throttled_total", "counter", self.throttled),
+            ("strikecite_upstream_coalesced_total", "counter", self.coalesced),
+        ]
+        if self.limiter:
+            samples += [
+                ("strikecite_rate_limiter_acquired_total", "counter", self.limiter.acquired),
+                ("strikecite_rate_limiter_wait_seconds_total", "counter", self.limiter.wait_seconds),
+                ("strikecite_rate_limiter_wait_seconds_max", "gauge", self.limiter.max_wait_seconds),
+            ]
+        if self.breaker:
+            samples += [
+                ("strikecite_circuit_breaker_open", "gauge", int(self.breaker.state == "open")),
+                ("strikecite_circuit_breaker_trips_total", "counter", self.breaker.trips),
+            ]
+        lines = []
+        for name, kind, value in samples:
+            lines += metric_header(name, kind) + [f"{name} {value}"]
+        return lines
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "coalesced": self.coalesced,
+            "rate_limiter": self.limiter.stats() if self.limiter else None,
+            "circuit_breaker": self.breaker.stats() if self.breaker else None,
+        }
+
+    async def close(self):
+        await self.http.aclose()
+
+def get_courtlistener_client() -> CourtListenerClient:
+    """Dependency returning the shared client; override it in tests."""
+    return app.state.courtlistener
+
+# Verification cache: CourtListener results per normalized citation
+class VerificationCache:
+    """
+    Mongo-backed cache of CourtListener verification results keyed by
+    canonical citation key, or by normalized citation when it has no known
+    reporter. Every document carries its own expires_at so found citations
+    and 404s can live for different lengths of time; a TTL index removes
+    them once expired. Cache failures are logged and treated as misses.
+    """
+
+    CACHEABLE_STATUSES = (200, 300, 404)
+
+    def __init__(self, collection, ttl_seconds: int = 30 * 24 * 3600,
+                 negative_ttl_seconds: int = 24 * 3600, enabled: bool = True):
+        self.collection = collection
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.negative_ttl = timedelta(seconds=negative_ttl_seconds)
+        self.enabled = enabled
+
+    @classmethod
+    def from_env(cls, database) -> "VerificationCache":
+        return cls(
+            database.citation_cache,
+            ttl_seconds=int(os.environ.get('VERIFICATION_CACHE_TTL', 30 * 24 * 3600)),
+            negative_ttl_seconds=int(os.environ.get('VERIFICATION_CACHE_NEGATIVE_TTL', 24 * 3600)),
+            enabled=os.environ.get('VERIFICATION_CACHE_ENABLED', 'true').lower() == 'true',
+        )
+
+    @staticmethod
+    def key(element: Dict[str, Any]) -> str:
+        normalized = (element.get('normalized_citations') or [element.get('citation', '')])[0]
+        shape = CITATION_SHAPE.match(normalized)
+        record = reporter_registry().lookup(shape.group(2)) if shape else None
+        if record:
+            return canonical_citation_key(normalized, record.abbreviation)
+        return ' '.join(normalized.lower().split())
+
+    async def ensure_indexes(self):
+        if self.enabled:
+            await self.collection.create_index("expires_at", expireAfterSeconds=0)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not self.enabled or not keys:
+            return {}
+        try:
+            cursor = self.collection.find({
+                "_id": {"$in": list(set(keys))},
+                "expires_at": {"$gt": datetime.utcnow()},
+            })
+            return {doc["_id"]: doc async for doc in cursor}
+        except Exception as e:
+            logger.warning(f"Verification cache read failed: {e}")
+            return {}
+
+    async def put_many(self, elements: List[Dict[str, Any]]):
+        if not self.enabled:
+            return
+        now = datetime.utcnow()
+        operations = []
+        for element in elements:
+            status = element.get('status')
+            if status not in self.CACHEABLE_STATUSES:
+                continue
+            clusters = element.get('clusters') or []
+            doc = {
+                "citation": (element.get('normalized_citations') or [element.get('citation', '')])[0],
+                "status": status,
+                "error_message": element.get('error_message', ''),
+                "clusters": clusters,
+                "source_url": clusters[0].get('url') if clusters else None,
+                "cached_at": now,
+                "expires_at": now + (self.negative_ttl if status == 404 else self.ttl),
+            }
+            operations.append(UpdateOne({"_id": self.key(element)}, {"$set": doc}, upsert=True))
+        if not operations:
+            return
+        try:
+            await self.collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.warning(f"Verification cache write failed: {e}")
+
+    @staticmethod
+    def apply(element: Dict[str, Any], doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill a locally extracted element with a cached verification result."""
+        return {
+            **element,
+            "normalized_citations": [doc["citation"]],
+            "status": doc["status"],
+            "error_message": doc.get("error_message", ""),
+            "clusters": doc.get("clusters", []),
+        }
+
+def get_verification_cache() -> VerificationCache:
+    """Dependency returning the shared verification cache."""
+    return app.state.verification_cache
+
+# Chunked upstream submission for large documents
+CHUNK_MAX_CHARS = int(os.environ.get('CHUNK_MAX_CHARS', 50000))
+CHUNK_OVERLAP = int(os.environ.get('CHUNK_OVERLAP', 300))
+UPSTREAM_CONCURRENCY = int(os.environ.get('UPSTREAM_CONCURRENCY', 4))
+
+def split_text_chunks(text: str, max_chars: int = CHUNK_MAX_CHARS,
+                      overlap: int = CHUNK_OVERLAP) -> List[tuple]:
+    """
+    Split text into (start, end, owned_until) windows of at most max_chars,
+    cutting on paragraph, then sentence, then word boundaries. Consecutive
+    windows overlap by about `overlap` characters; a citation belongs to the
+    window whose [start, owned_until) range contains its start, so any
+    citation shorter than the overlap is seen whole by its owner.
+    """
+    if len(text) <= max_chars:
+        return [(0, len(text), len(text))]
+    overlap = min(overlap, max_chars // 4)
+    chunks = []
+    start = 0
+    while True:
+        end = start + max_chars
+        if end >= len(text):
+            chunks.append((start, len(text), len(text)))
+            return chunks
+        # Prefer the last paragraph break, then sentence end, then whitespace
+        floor = start + max_chars // 2
+        cut = -1
+        for boundary in ("\n\n", ". ", "\n", " "):
+            cut = text.rfind(boundary, floor, end)
+            if cut != -1:
+                cut += len(boundary)
+                break
+        if cut == -1:
+            cut = end
+        next_start = max(cut - overlap, start + 1)
+        # Start the next window on a word boundary inside the overlap
+        space = text.find(" ", next_start, cut)
+        if space != -1:
+            next_start = space + 1
+        chunks.append((start, cut, next_start))
+        start = next_start
+
+async def lookup_text(text: str, courtlistener: CourtListenerClient,
+                      progress: Optional[Callable[..., Awaitable]] = None) -> List[Dict[str, Any]]:
+    """
+    Send text upstream, split into overlapping chunks submitted concurrently
+    when it is too large for one call. Offsets are rebased to whole-text
+    coordinates and citations seen by two windows are kept once. progress,
+    when given, is awaited with total={"chunks_total": ...} up front and
+    done={"chunks_verified": 1} as each chunk comes back.
+    """
+    chunks = split_text_chunks(text)
+    if progress:
+        await progress(total={"chunks_total": len(chunks)})
+
+    semaphore = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+
+    async def submit(chunk_start: int, chunk_end: int) -> List[Dict[str, Any]]:
+        async with semaphore:
+            lookup_json = await courtlistener.lookup(text[chunk_start:chunk_end])
+        if progress:
+            await progress(done={"chunks_verified": 1})
+        return lookup_json
+
+    if len(chunks) == 1:
+        return await submit(0, len(text))
+
+    results = await asyncio.gather(*(submit(start, end) for start, end, _ in chunks))
+
+    merged = []
+    seen = set()
+    for (chunk_start, _, owned_until), lookup_json in zip(chunks, results):
+        for element in lookup_json:
+            start_index = element.get('start_index', 0) + chunk_start
+            end_index = element.get('end_index', 0) + chunk_start
+            if not chunk_start <= start_index < owned_until or (start_index, end_index) in seen:
+                continue
+            seen.add((start_index, end_index))
+            merged.append({**element, "start_index": start_index, "end_index": end_index})
+    return merged
+
+def mark_unavailable(elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{**e, "status": STATUS_UPSTREAM_UNAVAILABLE, "error_message": "upstream unavailable"} for e in elements]
+
+# CPU-bound stages (extraction, pre-flight, validation) of texts of at least
+# CPU_OFFLOAD_MIN_CHARS run in a worker thread, so a large document does not
+# stall the event loop for every other request. asyncio.to_thread copies the
+# context, so the pinned registry and the request cost still apply there.
+CPU_OFFLOAD_MIN_CHARS = int(os.environ.get('CPU_OFFLOAD_MIN_CHARS', 20000))
+
+async def run_cpu_bound(text_length: int, function, *args, **kwargs):
+    """Call function inline for small texts, in a worker thread for large ones."""
+    if text_length < CPU_OFFLOAD_MIN_CHARS:
+        return function(*args, **kwargs)
+    return await asyncio.to_thread(function, *args, **kwargs)
+
+def find_candidates(text: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Citations found locally in text, pre-flight checked and grouped, plus the rejected ones."""
+    candidates, rejected = preflight(extract_citations_local(text), text)
+    group_parallel_citations(candidates, text)
+    return candidates, rejected
+
+# Anything still citation-shaped once the spans that need no upstream
+# verification are blanked out; without it the scan is skipped. That is a
+# volume and a page around at most seven words, one of them reporter-like:
+# an abbreviation with a period ("Cal."), an ordinal series ("3d", "4th")
+# or a vendor database. Dates and counts in prose ("March 3, 2020, alleging
+# 4 counts under Title 7") are not.
+REPORTER_LIKE = rf"(?=\S*(?:[A-Za-z]\.|\d(?:d|th)\b|\b(?:{'|'.join(sorted(VENDOR_REPORTERS))})\b))\S+"
+CITATION_LIKE = re.compile(
+    rf"\b\d+\s+(?:[^\s\d]\S*\s+){{0,3}}?{REPORTER_LIKE}\s+(?:[^\s\d]\S*\s+){{0,3}}?\d+\b"
+)
+
+async def lookup_citations(
+    text: str,
+    extraction: str,
+    courtlistener: CourtListenerClient,
+    cache: VerificationCache,
+    progress: Optional[Callable[..., Awaitable]] = None,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Produce LOOKUP_JSON for text, and whether it is degraded because
+    CourtListener was unavailable. Citations found locally are pre-flight
+    checked and answered from the verification cache where possible, but
+    CourtListener still scans the whole document, so citations to reporters
+    missing from the local database are found too. Spans it need not verify
+    again are blanked out first: rejected and cached citations, repeated
+    occurrences of an authority and all but the first member of a parallel
+    group, which get the result of their authority. In "local" mode misses
+    stay unverified and nothing leaves the process. While CourtListener is
+    unavailable, citations still needing verification are returned right
+    away, marked as such; citations only CourtListener would find are then
+    missing, so a degraded result must not be cached. progress is passed
+    on to lookup_text.
+    """
+    candidates, rejected = await run_cpu_bound(len(text), find_candidates, text)
+    keys = [cache.key(c) for c in candidates]
+    cached = await cache.get_many(keys)
+    resolved, masked = list(rejected), list(rejected)
+    misses = []
+    # First occurrence of every authority missing from the cache, where a
+    # parallel citation stands for its group's first member
+    authorities: Dict[str, Dict[str, Any]] = {}
+    for key, candidate in zip(keys, candidates):
+        verify_key = candidate.get('group_id', key)
+        doc = cached.get(key) or cached.get(verify_key)
+        if doc:
+            applied = cache.apply(candidate, doc)
+            if key not in cached:
+                applied['normalized_citations'] = candidate['normalized_citations']
+            resolved.append(applied)
+            masked.append(candidate)
+        else:
+            misses.append((key, verify_key, candidate))
+            if authorities.setdefault(verify_key, candidate) is not candidate:
+                masked.append(candidate)
+
+    if extraction == "local":
+        resolved.extend(candidate for _, _, candidate in misses)
+        resolved.sort(key=lambda element: element['start_index'])
+        return resolved, False
+
+    scanned = mask_spans(text, masked) if masked else text
+    degraded = False
+    try:
+        found = await lookup_text(scanned, courtlistener, progress) if CITATION_LIKE.search(scanned) else []
+    except CourtListenerError as e:
+        if not e.unavailable:
+            raise
+        degraded = True
+        results = {verify_key: mark_unavailable([candidate])[0] for verify_key, candidate in authorities.items()}
+    else:
+        await cache.put_many(found)
+        results = {}
+        # Upstream results are matched to the authorities by overlapping span
+        by_start = sorted(authorities, key=lambda verify_key: authorities[verify_key]['start_index'])
+        starts = [authorities[verify_key]['start_index'] for verify_key in by_start]
+        for element in found:
+            index = bisect_left(starts, element.get('end_index', 0)) - 1
+            if index >= 0 and element.get('start_index', 0) < authorities[by_start[index]]['end_index']:
+                results.setdefault(by_start[index], element)
+            else:
+                resolved.append(element)  # found by CourtListener alone
+        for verify_key, candidate in authorities.items():
+            if verify_key not in results:
+                # CourtListener did not recognize it as a citation at all
+                results[verify_key] = {**candidate, "status": 400, "error_message": "not recognized by CourtListener"}
+
+    for key, verify_key, candidate in misses:
+        result = results[verify_key]
+        resolved.append({
+            **candidate,
+            "normalized_citations": (
+                result.get('normalized_citations') or candidate['normalized_citations']
+                if key == verify_key else candidate['normalized_citations']
+            ),
+            "status": result.get('status'),
+            "error_message": result.get('error_message', ''),
+            "clusters": result.get('clusters', []),
+        })
+
+    resolved.sort(key=lambda element: element['start_index'])
+    return resolved, degraded
+
+# Document result cache: whole ValidationResult per uploaded document
+class DocumentResultCache:
+    """
+    Two-tier cache of serialized ValidationResults keyed by a SHA-256 of the
+    submitted bytes. The first tier is an in-process LRU bounded by total
+    size; the optional second tier is a Mongo collection shared by all
+    workers. Entries older than ttl_seconds are treated as misses.
+    """
+
+    def __init__(self, collection=None, max_bytes: int = 64 * 1024 * 1024,
+                 ttl_seconds: int = 24 * 3600):
+        self.collection = collection
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (body, created_at)
+        self.size = 0
+
+    @classmethod
+    def from_env(cls, database) -> "DocumentResultCache":
+        shared = os.environ.get('DOCUMENT_CACHE_SHARED', 'false').lower() == 'true'
+        return cls(
+            database.document_cache if shared else None,
+            max_bytes=int(os.environ.get('DOCUMENT_CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+            ttl_seconds=int(os.environ.get('DOCUMENT_CACHE_TTL', 24 * 3600)),
+        )
+
+    @staticmethod
+    def key(kind: str, extraction: str, content: bytes, parsed: bool = False, version: str = "") -> str:
+        """Key per document and options; version is the reporter database's, so a reload misses."""
+        variant = f"{extraction}+parsed" if parsed else extraction
+        return f"{kind}:{variant}:{version[:16]}:{hashlib.sha256(content).hexdigest()}"
+
+    async def ensure_indexes(self):
+        if self.collection is not None:
+            await self.collection.create_index("expires_at", expireAfterSeconds=0)
+
+    def _remember(self, key: str, body: str, created_at: float):
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key)[0])
+        if len(body) > self.max_bytes:
+            return
+        self.entries[key] = (body, created_at)
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, (evicted, _) = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    async def get(self, key: str) -> Optional[tuple]:
+        """Return (body, created_at) for a fresh entry, or None."""
+        now = time.time()
+        entry = self.entries.get(key)
+        if entry and now - entry[1] < self.ttl_seconds:
+            self.entries.move_to_end(key)
+            return entry
+        if self.collection is None:
+            return None
+        try:
+            doc = await self.collection.find_one({"_id": key})
+        except Exception as e:
+            logger.warning(f"Document cache read failed: {e}")
+            return None
+        if not doc or now - doc["created_at"] >= self.ttl_seconds:
+            return None
+        self._remember(key, doc["body"], doc["created_at"])
+        return doc["body"], doc["created_at"]
 
-# Create lookup dictionaries for fast matching
-REPORTER_LOOKUP = {}
-for reporter in LEGAL_REPORTERS:
-    # Add main abbreviation
-    REPORTER_LOOKUP[reporter['abbreviation'].lower()] = reporter
-    # Add aliases
-    for alias in reporter['aliases']:
-        REPORTER_LOOKUP[alias.lower()] = reporter
+    async def put(self, key: str, body: str) -> float:
+        created_at = time.time()
+        self._remember(key, body, created_at)
+        if self.collection is not None:
+            try:
+                await self.collection.replace_one(
+                    {"_id": key},
+                    {
+                        "body": body,
+                        "created_at": created_at,
+                        "expires_at": datetime.utcnow() + timedelta(seconds=self.ttl_seconds),
+                    },
+                    upsert=True,
+                )
+            except Exception as e:
+                logger.warning(f"Document cache write failed: {e}")
+        return created_at
+
+def get_document_cache() -> DocumentResultCache:
+    """Dependency returning the shared document result cache."""
+    return app.state.document_cache
+
+def document_response(body: str, created_at: float, hit: bool, cost: Optional[RequestCost] = None) -> Response:
+    """Serialized ValidationResult with cache status, entry age and request cost headers."""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={
+            "X-Cache": "HIT" if hit else "MISS",
+            "Age": str(int(time.time() - created_at)),
+            **(cost.headers() if cost else {}),
+        },
+    )
+
+# PDF text extraction in a process pool
+PDF_WORKERS = int(os.environ.get('PDF_WORKERS', os.cpu_count() or 1))
+PDF_PAGES_PER_TASK = int(os.environ.get('PDF_PAGES_PER_TASK', 20))
+PDF_MAX_PAGES = int(os.environ.get('PDF_MAX_PAGES', 2000))
+
+def _count_pdf_pages(pdf_content: bytes) -> int:
+    return len(PyPDF2.PdfReader(io.BytesIO(pdf_content)).pages)
+
+def _extract_pdf_page_range(pdf_content: bytes, start: int, end: int) -> List[str]:
+    """Extract pages [start, end) in a worker process."""
+    pages = PyPDF2.PdfReader(io.BytesIO(pdf_content)).pages
+    return [pages[number].extract_text() or "" for number in range(start, end)]
+
+async def schedule_pdf_extraction(pdf_content: bytes, executor: Optional[ProcessPoolExecutor]) -> tuple:
+    """
+    Count pages, enforce PDF_MAX_PAGES and fan page ranges out across the
+    process pool. Returns the page count and one future per range, each
+    resolving to its page texts, in document order.
+    """
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    page_count = await loop.run_in_executor(executor, _count_pdf_pages, pdf_content)
+    if PDF_MAX_PAGES and page_count > PDF_MAX_PAGES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"PDF has {page_count} pages; the limit is {PDF_MAX_PAGES}"
+        )
+    futures = [
+        loop.run_in_executor(executor, _extract_pdf_page_range, pdf_content, start,
+                             min(start + PDF_PAGES_PER_TASK, page_count))
+        for start in range(0, page_count, PDF_PAGES_PER_TASK)
+    ]
+    METRICS.inc("strikecite_pdf_pages_total", page_count)
+    # Timed until the last range is extracted, however the caller consumes them
+    asyncio.gather(*futures).add_done_callback(lambda extracted: _pdf_parsed(extracted, started))
+    return page_count, futures
+
+def _pdf_parsed(extracted: asyncio.Future, started: float):
+    if not extracted.cancelled() and extracted.exception() is None:
+        METRICS.stage("pdf_parse", time.perf_counter() - started)
+
+async def extract_pdf_pages(pdf_content: bytes, executor: Optional[ProcessPoolExecutor]) -> List[str]:
+    """Extract the text of every page without parsing on the event loop."""
+    _, futures = await schedule_pdf_extraction(pdf_content, executor)
+    results = await asyncio.gather(*futures)
+    return [page for pages in results for page in pages]
+
+def get_pdf_executor() -> Optional[ProcessPoolExecutor]:
+    """Dependency returning the PDF extraction pool."""
+    return app.state.pdf_executor
 
 # Create the main app without a prefix
 app = FastAPI(title="Strike Cite API", description="U.S. Legal Citation Validator")
@@ -52,6 +1419,16 @@ class CitationElement(BaseModel):
     error_message: str = ""
     clusters: List[Dict[str, Any]] = []
 
+class ParsedCitation(BaseModel):
+    volume: int
+    reporter: str
+    page: int
+    # Pinpoint pages as written, e.g. ["115", "118-19", "120 n.3"]
+    pin_cites: List[str] = []
+    # Court part of the closing parenthetical, e.g. "9th Cir."; None for "(1973)"
+    court: Optional[str] = None
+    year: Optional[int] = None
+
 class ValidatedCitation(BaseModel):
     raw: str
     normalized: str
@@ -61,27 +1438,227 @@ class ValidatedCitation(BaseModel):
     note: str
     start_char: int
     end_char: int
+    # Spacing/punctuation-insensitive "volume reporter page" key, e.g. "410 us 113"
+    canonical_key: Optional[str] = None
+    # Structured fields, only when the caller asks for them (include_parsed)
+    parsed: Optional[ParsedCitation] = None
+    # "full" citation or short form: "id" (Id. at 120), "supra" (Roe, supra)
+    # or "short" (410 U.S. at 115). Short forms take the verification of the
+    # full citation starting at antecedent_start.
+    form: Literal["full", "id", "supra", "short"] = "full"
+    antecedent_start: Optional[int] = None
+    # Shared by the members of a parallel citation ("410 U.S. 113, 93 S. Ct.
+    # 705"): the canonical key of the first member
+    group_id: Optional[str] = None
 
 class ValidationSummary(BaseModel):
     total: int
     verified: int
     unverified: int
     confidence: str
+    # CourtListener was unavailable: nothing was verified upstream and
+    # citations only it would have found are missing
+    degraded: bool = False
+
+class CitedAuthority(BaseModel):
+    # canonical_key, or the lowercased normalized citation when there is none
+    key: str
+    citation: str
+    occurrences: int
+    verified: bool
 
 class ValidationResult(BaseModel):
     citations: List[ValidatedCitation]
     summary: ValidationSummary
+    # Every distinct authority cited, in order of first occurrence
+    authorities: List[CitedAuthority] = []
 
 class TextValidationRequest(BaseModel):
     text: str
+    # "courtlistener" finds and verifies citations upstream, "local" only
+    # extracts them offline with the reporter database
+    extraction: Literal["courtlistener", "local"] = "courtlistener"
+    # Add the structured ParsedCitation to every citation
+    include_parsed: bool = False
+
+# Structured citation parsing: "volume reporter page[, pin, ...] [(court year)]".
+# Pin cites and the parenthetical follow the citation in the document, so when
+# the text is available they are read from a bounded window after the
+# citation's end; otherwise from whatever the raw citation itself carries.
+# A pin is never followed by a letter or digit, so the volume of a parallel
+# citation ("410 U.S. 113, 93 S. Ct. 705") is not taken for a pin.
+PARSE_WINDOW_CHARS = 200
+CITATION_HEAD = re.compile(r'\s*(\d+)\s+([^,(]+?)\s+(\d+)\b')
+PIN_CITE = r'\d+(?:\s*[-\u2013]\s*\d+)?(?:\s*nn?\.\s*\d+(?:\s*[-\u2013]\s*\d+)?)?(?!\s*[A-Za-z\d])'
+CITATION_TAIL = re.compile(
+    rf'((?:\s*,\s*(?:at\s+)?{PIN_CITE})*)'
+    r'(?:\s*\(([^()]*?)\s*((?:1[6-9]|20)\d{2})\))?'
+)
+PIN_SEPARATOR = re.compile(r'\s*,\s*(?:at\s+)?')
+
+def parse_citation(citation: str, reporter: Optional[str] = None,
+                   text: Optional[str] = None, end: int = 0) -> Optional[ParsedCitation]:
+    """
+    Decompose a citation in one pass. reporter overrides the reporter as
+    written (so aliases come back canonical); text and end, the citation's
+    end offset in text, supply the pin cites and parenthetical that follow it.
+    Returns None when the citation is not "volume reporter page".
+    """
+    head = CITATION_HEAD.match(citation)
+    if not head:
+        return None
+    if text is not None:
+        tail = CITATION_TAIL.match(text, end, end + PARSE_WINDOW_CHARS)
+    else:
+        tail = CITATION_TAIL.match(citation, head.end())
+    pins, court, year = tail.group(1), tail.group(2), tail.group(3)
+    return ParsedCitation(
+        volume=int(head.group(1)),
+        reporter=reporter or head.group(2),
+        page=int(head.group(3)),
+        pin_cites=[re.sub(r'\s+', ' ', pin) for pin in PIN_SEPARATOR.split(pins)[1:]],
+        court=court or None,
+        year=int(year) if year else None,
+    )
+
+# Short-form resolution. One scan over the text finds Id., supra and
+# "volume reporter at page" references; they are walked together with the
+# full citations in offset order against a table of antecedents: the last
+# citation (for Id.), full citations by volume and reporter, and by the
+# party names before " v." in the case name that precedes them. A reporter
+# never holds a number followed by a period, so a short form cannot run
+# across a sentence end ("410 U.S. 113. Id. at 115").
+PIN = r'\d+(?:\s*[-\u2013]\s*\d+)?'
+SHORT_FORM = re.compile(
+    rf"(?P<id>\b(?:[Ii]d|Ibid)\.(?:,?\s+at\s+(?P<id_pin>{PIN}))?)"
+    rf"|(?P<short>\b(?P<volume>\d{{1,5}})\s+(?P<reporter>[A-Z](?:(?!\d+\.)[A-Za-z0-9.' ]){{0,24}}?)\s+at\s+(?P<short_pin>{PIN}))"
+    rf"|(?P<supra>\b(?P<party>[A-Z][A-Za-z'&-]*),?\s+supra\b(?:,?\s+at\s+(?P<supra_pin>{PIN}))?)"
+)
+CASE_NAME_BEFORE = re.compile(r"([A-Z][A-Za-z'&-]*)\s+v\.\s+([A-Z][A-Za-z'&-]*)[^;()\n]*?,\s*$")
+CASE_NAME_CHARS = 150
+
+class ShortFormResolver:
+    """
+    Links short forms to the full citation they refer to in a single pass.
+    The antecedent table carries over between calls, so a document can be
+    resolved one slice at a time, as the streaming endpoints do.
+    """
+
+    def __init__(self):
+        self.by_volume: Dict[tuple, ValidatedCitation] = {}
+        self.by_party: Dict[str, ValidatedCitation] = {}
+        self.last: Optional[ValidatedCitation] = None
+        # Absolute offset up to which text has been scanned for short forms
+        self.scanned_until = 0
+        # Text just before the next slice, (absolute start, text), so a case
+        # name cut off at the start of that slice is still found
+        self.tail: Tuple[int, str] = (0, "")
+
+    def _remember(self, citation: ValidatedCitation, text: str, text_offset: int):
+        shape = CITATION_SHAPE.match(citation.normalized)
+        if shape and citation.reporter and citation.canonical_key:  # its own reporter, not a label
+            self.by_volume[(shape.group(1), canonical_series_key(shape.group(2), citation.reporter))] = citation
+        start = citation.start_char - text_offset
+        if start > 0:
+            name = CASE_NAME_BEFORE.search(text, max(0, start - CASE_NAME_CHARS), start)
+            if name:
+                self.by_party[name.group(1).lower()] = citation
+                self.by_party[name.group(2).lower()] = citation
+        # Id. after a parallel citation refers to the group's first member
+        if not (citation.group_id and self.last and self.last.group_id == citation.group_id):
+            self.last = citation
+
+    def _short_form(self, match: re.Match, text_offset: int, include_parsed: bool) -> Optional[ValidatedCitation]:
+        if match.group("id"):
+            form, antecedent = "id", self.last
+            missing = "unresolved short form: no preceding citation for Id."
+        elif match.group("short"):
+            record = reporter_registry().lookup(match.group("reporter"))
+            if record is None:
+                return None
+            form = "short"
+            series = canonical_series_key(match.group("reporter"), record.abbreviation)
+            antecedent = self.by_volume.get((match.group("volume"), series))
+            missing = f"unresolved short form: no earlier full citation to {match.group('volume')} {record.abbreviation}"
+        else:
+            form = "supra"
+            antecedent = self.by_party.get(match.group("party").lower())
+            if antecedent is None:
+                # Often refers to a book or article, not a case
+                return None
+        self.last = antecedent
+        pin = match.group(f"{form}_pin")
+        start, end = match.start() + text_offset, match.end() + text_offset
+        if antecedent is None:
+            return ValidatedCitation(raw=match.group(0), normalized=match.group(0), reporter=None,
+                                     verified=False, source_url=None, note=missing,
+                                     start_char=start, end_char=end, form=form)
+        parsed = None
+        if include_parsed and antecedent.parsed:
+            parsed = antecedent.parsed.model_copy(update={"pin_cites": [pin] if pin else []})
+        return antecedent.model_copy(update={
+            "raw": match.group(0), "start_char": start, "end_char": end, "parsed": parsed,
+            "form": form, "antecedent_start": antecedent.start_char, "group_id": None,
+        })
+
+    def resolve(self, citations: List[ValidatedCitation], text: str, text_offset: int = 0,
+                include_parsed: bool = False, owned_until: Optional[int] = None) -> List[ValidatedCitation]:
+        """
+        Return citations (full ones from text, in offset order) with the
+        short forms found in text merged in. text starts at text_offset.
+        Short forms starting at or after owned_until (absolute) are left to
+        the next slice, which owns that overlap.
+        """
+        merged = []
+        index = 0
+        start = max(self.scanned_until - text_offset, 0)
+        tail_start, tail = self.tail
+        context, context_offset = text, text_offset
+        if tail_start < text_offset <= tail_start + len(tail):
+            context, context_offset = tail[:text_offset - tail_start] + text, tail_start
+        for match in SHORT_FORM.finditer(text, start):
+            position = match.start() + text_offset
+            if owned_until is not None and position >= owned_until:
+                break
+            while index < len(citations) and citations[index].end_char <= position:
+                self._remember(citations[index], context, context_offset)
+                merged.append(citations[index])
+                index += 1
+            if index < len(citations) and citations[index].start_char <= position:
+                continue  # inside a full citation
+            short_form = self._short_form(match, text_offset, include_parsed)
+            if short_form:
+                merged.append(short_form)
+        for citation in citations[index:]:
+            self._remember(citation, context, context_offset)
+            merged.append(citation)
+        end = text_offset + len(text) if owned_until is None else owned_until
+        self.scanned_until = max(self.scanned_until, end)
+        tail_from = max(end - text_offset - CASE_NAME_CHARS, 0)
+        self.tail = (text_offset + tail_from, text[tail_from:end - text_offset])
+        return merged
 
 # Layer A: Core Validation Microservice
-def validate_citations(lookup_json: List[Dict[str, Any]]) -> ValidationResult:
+@METRICS.timed("validate")
+def validate_citations(lookup_json: List[Dict[str, Any]], text: Optional[str] = None,
+                       include_parsed: bool = False, text_offset: int = 0,
+                       resolver: Optional[ShortFormResolver] = None, degraded: bool = False,
+                       owned_until: Optional[int] = None) -> ValidationResult:
     """
     Core validation function that processes LOOKUP_JSON and returns validated citations.
     This is the reusable microservice that can be called by other projects.
+    Given text (which starts at text_offset in LOOKUP_JSON coordinates), its
+    short forms are resolved too, with resolver's state when slices of one
+    document are validated in turn; owned_until (absolute) is where the
+    slice's overlap with the next one begins. With include_parsed, each
+    citation also gets its ParsedCitation. degraded marks the summary of a
+    LOOKUP_JSON produced while CourtListener was unavailable.
     """
+    registry = reporter_registry()
     validated_citations = []
+    # Reporter per citation text, and whether it is the citation's own
+    # "volume reporter page" reporter, so repeated authorities are resolved once
+    reporters: Dict[str, Tuple[Optional[str], bool]] = {}
     
     for element in lookup_json:
         # 1. Normalize citation
@@ -91,41 +1668,35 @@ def validate_citations(lookup_json: List[Dict[str, Any]]) -> ValidationResult:
             normalized = element.get('citation', '')
         
         # 2. Identify reporter using enhanced matching logic
-        reporter_abbrev = None
         citation_text = normalized or element.get('citation', '')
-        
-        # Extract reporter abbreviation from citation using multiple strategies
-        # Common patterns: "123 F.3d 456", "410 U.S. 113", "999 So. 2d 123", etc.
-        parts = citation_text.split()
-        if len(parts) >= 2:
-            # Try exact match first
-            potential_reporter = parts[1].lower()
-            if potential_reporter in REPORTER_LOOKUP:
-                reporter_abbrev = REPORTER_LOOKUP[potential_reporter]['abbreviation']
-            else:
-                # Try matching with more complex patterns
-                # Look for patterns like "F.3d", "S.E.2d", "N.W.3d", etc.
-                import re
-                reporter_pattern = r'([A-Z][a-z]*\.?\s*(?:2d|3d|App\.?|Supp\.?|Ct\.?)?)'
-                match = re.search(reporter_pattern, citation_text)
-                if match:
-                    potential_match = match.group(1).strip().lower()
-                    if potential_match in REPORTER_LOOKUP:
-                        reporter_abbrev = REPORTER_LOOKUP[potential_match]['abbreviation']
-                
-                # If still no match, try partial matching for common abbreviations
-                if not reporter_abbrev:
-                    for reporter in LEGAL_REPORTERS:
-                        if reporter['abbreviation'].lower() in citation_text.lower():
-                            reporter_abbrev = reporter['abbreviation']
-                            break
-                        # Check aliases too
-                        for alias in reporter['aliases']:
-                            if alias.lower() in citation_text.lower():
-                                reporter_abbrev = reporter['abbreviation']
-                                break
-                        if reporter_abbrev:
-                            break
+        if citation_text in reporters:
+            reporter_abbrev, exact = reporters[citation_text]
+        else:
+            reporter_abbrev = None
+            # Extract reporter abbreviation from citation using multiple strategies
+            # Common patterns: "123 F.3d 456", "410 U.S. 113", "999 So. 2d 123", etc.
+            # "volume reporter page" resolves through one canonical-key probe, so
+            # "F. 3d", "F 3d" and "F.3d" (or "F. Supp. 2d") all take the fast path
+            shape = CITATION_SHAPE.match(citation_text)
+            exact = registry.lookup(shape.group(2)) if shape else None
+            if shape:
+                METRICS.inc("strikecite_reporter_matches_total", strategy="exact",
+                            result="hit" if exact else "miss")
+            vendor = None if exact else VENDOR_CITATION.match(citation_text)
+            if exact:
+                reporter_abbrev = exact.abbreviation
+            elif vendor:
+                # "2023 U.S. Dist. LEXIS 4567" is a LEXIS cite, not one to "U.S."
+                reporter_abbrev = vendor.group(1)
+                METRICS.inc("strikecite_reporter_matches_total", strategy="vendor", result="hit")
+            elif len(citation_text.split()) >= 2:
+                # Single pass for the leftmost-longest known reporter or alias;
+                # only a label, as it need not be the citation's own reporter
+                reporter_abbrev = registry.matcher.find(citation_text)
+                METRICS.inc("strikecite_reporter_matches_total", strategy="automaton",
+                            result="hit" if reporter_abbrev else "miss")
+            exact = exact is not None
+            reporters[citation_text] = (reporter_abbrev, exact)
         
         # 3. Verification status
         verified = element.get('status') == 200
@@ -140,7 +1711,13 @@ def validate_citations(lookup_json: List[Dict[str, Any]]) -> ValidationResult:
         if not verified:
             status_code = element.get('status', 'unknown')
             
-            if status_code == 404:
+            if status_code == STATUS_NOT_LOOKED_UP:
+                note = "not verified: extracted locally without CourtListener lookup"
+            elif status_code == STATUS_PREFLIGHT_FAILED:
+                note = element.get('error_message') or "impossible citation"
+            elif status_code == STATUS_UPSTREAM_UNAVAILABLE:
+                note = "unverified: upstream unavailable"
+            elif status_code == 404:
                 note = "not found in CourtListener database"
             elif status_code == 400:
                 note = "invalid citation format"
@@ -149,25 +1726,25 @@ def validate_citations(lookup_json: List[Dict[str, Any]]) -> ValidationResult:
             else:
                 note = f"validation failed (status {status_code})"
             
-            # Enhanced error detection using common mistakes database
-            if reporter_abbrev:
-                reporter_data = next((r for r in LEGAL_REPORTERS if r['abbreviation'] == reporter_abbrev), None)
-                if reporter_data and reporter_data.get('common_citation_mistakes'):
-                    # Check if the raw citation matches any common mistake patterns
-                    raw_citation = element.get('citation', '').lower()
-                    for mistake in reporter_data['common_citation_mistakes']:
-                        if any(word in raw_citation for word in mistake.lower().split() if len(word) > 2):
-                            note = f"possible error: {mistake[:50]}..." if len(mistake) > 50 else f"possible error: {mistake}"
-                            break
-            
-            # Check for common formatting errors
-            raw_citation = element.get('citation', '')
-            if 'f3rd' in raw_citation.lower():
-                note = "probable typo: 'F3rd' should be 'F.3d'"
-            elif 'f3d' in raw_citation.lower() and '.' not in raw_citation:
-                note = "missing period: should be 'F.3d'"
-            elif 'scotus' in raw_citation.lower():
-                note = "informal abbreviation: use proper reporter"
+            # Typo rules and the reporter's common mistakes, in one pass
+            diagnosis = registry.diagnostics.diagnose(element.get('citation', ''), reporter_abbrev)
+            if diagnosis and status_code == STATUS_UPSTREAM_UNAVAILABLE:
+                note = f"{note}; {diagnosis}"
+            elif diagnosis and status_code != STATUS_PREFLIGHT_FAILED:
+                note = diagnosis
+        
+        # Passed pre-flight, but dated outside the reporter's span
+        if element.get('preflight_warning'):
+            note = f"{note}; {element['preflight_warning']}" if note else element['preflight_warning']
+        
+        parsed = None
+        if include_parsed:
+            end = element.get('end_index', 0) - text_offset
+            # The reporter replaces the one as written only when it is that one
+            reporter_override = reporter_abbrev if exact else None
+            parsed = parse_citation(element.get('citation', ''), reporter_override, text, end)
+            if parsed is None and normalized != element.get('citation', ''):
+                parsed = parse_citation(normalized, reporter_override, text, end)
         
         validated_citation = ValidatedCitation(
             raw=element.get('citation', ''),
@@ -177,20 +1754,62 @@ def validate_citations(lookup_json: List[Dict[str, Any]]) -> ValidationResult:
             source_url=source_url,
             note=note,
             start_char=element.get('start_index', 0),
-            end_char=element.get('end_index', 0)
+            end_char=element.get('end_index', 0),
+            canonical_key=canonical_citation_key(citation_text, reporter_abbrev) if exact else None,
+            parsed=parsed,
+            group_id=element.get('group_id')
         )
         validated_citations.append(validated_citation)
     
-    # Calculate summary with enhanced confidence logic
-    total = len(validated_citations)
-    verified_count = sum(1 for c in validated_citations if c.verified)
+    if include_parsed:
+        # Parallel citations share the closing parenthetical of the last member
+        closing = {c.group_id: c.parsed for c in validated_citations
+                   if c.group_id and c.parsed and c.parsed.year}
+        for citation in validated_citations:
+            shared = closing.get(citation.group_id)
+            if shared and citation.parsed and citation.parsed.year is None:
+                citation.parsed = citation.parsed.model_copy(update={"court": shared.court, "year": shared.year})
+    
+    if text is not None:
+        validated_citations.sort(key=lambda citation: citation.start_char)
+        validated_citations = (resolver or ShortFormResolver()).resolve(
+            validated_citations, text, text_offset, include_parsed, owned_until
+        )
+    
+    summary = summarize_citations(
+        total=len(validated_citations),
+        verified_count=sum(1 for c in validated_citations if c.verified),
+        recognized_count=sum(1 for c in validated_citations if c.reporter),
+        degraded=degraded,
+    )
+    METRICS.inc("strikecite_citations_total", summary.verified, verified="true")
+    METRICS.inc("strikecite_citations_total", summary.unverified, verified="false")
+    
+    authorities: Dict[str, CitedAuthority] = {}
+    for citation in validated_citations:
+        if citation.form != "full" and citation.antecedent_start is None:
+            continue  # unresolved short form
+        key = citation.canonical_key or ' '.join(citation.normalized.lower().split())
+        authority = authorities.get(key)
+        if authority is None:
+            authorities[key] = CitedAuthority(key=key, citation=citation.normalized, occurrences=1,
+                                              verified=citation.verified)
+        else:
+            authority.occurrences += 1
+    
+    return ValidationResult(citations=validated_citations, summary=summary,
+                            authorities=list(authorities.values()))
+
+def summarize_citations(total: int, verified_count: int, recognized_count: int,
+                        degraded: bool = False) -> ValidationSummary:
+    """Build the summary, with enhanced confidence logic, from running counts."""
     unverified_count = total - verified_count
     
     if total == 0:
         confidence = "low"
     else:
         verification_ratio = verified_count / total
-        reporter_recognition_ratio = sum(1 for c in validated_citations if c.reporter) / total
+        reporter_recognition_ratio = recognized_count / total
         
         # Enhanced confidence calculation
         if verification_ratio >= 0.9 and reporter_recognition_ratio >= 0.8:
@@ -200,126 +1819,569 @@ def validate_citations(lookup_json: List[Dict[str, Any]]) -> ValidationResult:
         else:
             confidence = "low"
     
-    summary = ValidationSummary(
+    return ValidationSummary(
         total=total,
         verified=verified_count,
         unverified=unverified_count,
-        confidence=confidence
+        confidence=confidence,
+        degraded=degraded
     )
-    
-    return ValidationResult(citations=validated_citations, summary=summary)
+
+# Streaming validation: emit citations as each page range or chunk finishes
+STREAM_CHUNK_CHARS = int(os.environ.get('STREAM_CHUNK_CHARS', 5000))
+
+async def lookup_unit(
+    offset: int,
+    text: str,
+    owned_until: Optional[int],
+    extraction: str,
+    courtlistener: CourtListenerClient,
+    cache: VerificationCache,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Look up one slice of a document starting at offset, rebasing results to
+    document coordinates. owned_until (absolute, or None) drops citations
+    that start in the overlap owned by the next slice. Returns them with
+    lookup_citations' degraded flag.
+    """
+    lookup_json, degraded = await lookup_citations(text, extraction, courtlistener, cache)
+    for element in lookup_json:
+        element['start_index'] += offset
+        element['end_index'] += offset
+    if owned_until is not None:
+        lookup_json = [e for e in lookup_json if e['start_index'] < owned_until]
+    return lookup_json, degraded
+
+def _stream_event(event: str, data: Dict[str, Any], stream_format: str) -> str:
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    return json.dumps({"event": event, **data}) + "\n"
+
+async def stream_validation(
+    units: AsyncIterator[tuple],
+    extraction: str,
+    courtlistener: CourtListenerClient,
+    cache: VerificationCache,
+    stream_format: str,
+    include_parsed: bool = False,
+) -> AsyncIterator[str]:
+    """
+    Run the pipeline over (offset, text, owned_until) units in document order,
+    yielding a citation event per ValidatedCitation as soon as its unit is
+    done, a progress event with the running summary after every unit, and
+    the final summary last. Only running counts are kept, never the full list.
+    """
+    pin_reporter_registry()
+    total = verified_count = recognized_count = 0
+    degraded = False
+    resolver = ShortFormResolver()
+    try:
+        async for offset, text, owned_until in units:
+            lookup_json, unit_degraded = await lookup_unit(offset, text, owned_until, extraction, courtlistener, cache)
+            degraded = degraded or unit_degraded
+            result = await run_cpu_bound(len(text), validate_citations, lookup_json, text, include_parsed,
+                                         offset, resolver, owned_until=owned_until)
+            for citation in result.citations:
+                total += 1
+                verified_count += citation.verified
+                recognized_count += bool(citation.reporter)
+                yield _stream_event("citation", citation.model_dump(), stream_format)
+            summary = summarize_citations(total, verified_count, recognized_count, degraded)
+            yield _stream_event("progress", {"processed_chars": offset + len(text), **summary.model_dump()}, stream_format)
+    except CourtListenerError as e:
+        yield _stream_event("error", {"status_code": e.status_code, "detail": f"CourtListener API error: {e.detail}"}, stream_format)
+        return
+    except Exception as e:
+        yield _stream_event("error", {"status_code": 500, "detail": f"Processing error: {str(e)}"}, stream_format)
+        return
+    summary = summarize_citations(total, verified_count, recognized_count, degraded)
+    yield _stream_event("summary", summary.model_dump(), stream_format)
+
+async def _text_units(text: str) -> AsyncIterator[tuple]:
+    for start, end, owned_until in split_text_chunks(text, STREAM_CHUNK_CHARS):
+        yield start, text[start:end], owned_until
+
+async def _pdf_units(futures: List[asyncio.Future]) -> AsyncIterator[tuple]:
+    """
+    Page ranges in document order. Like the windows of _text_units, each unit
+    runs CHUNK_OVERLAP characters into the next range and owns its text up to
+    where that range starts, so a citation split across a range boundary is
+    seen whole. Ranges without text are merged into the next one.
+    """
+    offset, pending = 0, ""
+    for future in futures:
+        pages = await future
+        text = "".join(page + "\n" for page in pages)
+        if pending.strip():
+            yield offset, pending + text[:CHUNK_OVERLAP], offset + len(pending)
+            offset, pending = offset + len(pending), text
+        else:
+            pending += text
+    if pending.strip():
+        yield offset, pending, None
+
+def streaming_response(body: AsyncIterator[str], stream_format: str) -> StreamingResponse:
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(body, media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+# Asynchronous validation jobs persisted in Mongo
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))
+JOB_RESULT_TTL = int(os.environ.get('JOB_RESULT_TTL', 7 * 24 * 3600))
+JOB_QUEUE_SIZE = int(os.environ.get('JOB_QUEUE_SIZE', 100))
+JOB_QUEUE_MAX_BYTES = int(os.environ.get('JOB_QUEUE_MAX_BYTES', 512 * 1024 * 1024))
+JOB_HEARTBEAT_INTERVAL = float(os.environ.get('JOB_HEARTBEAT_INTERVAL', 30))
+ACTIVE_JOB_STATUSES = ["queued", "running"]
+
+class JobProgress(BaseModel):
+    pages_total: int = 0
+    pages_extracted: int = 0
+    chunks_total: int = 0
+    chunks_verified: int = 0
+
+class ValidationJob(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    kind: Literal["pdf", "text"]
+    extraction: Literal["courtlistener", "local"] = "courtlistener"
+    include_parsed: bool = False
+    status: Literal["queued", "running", "completed", "failed"] = "queued"
+    progress: JobProgress = Field(default_factory=JobProgress)
+    result: Optional[ValidationResult] = None
+    error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+class JobRunner:
+    """
+    Queue of validation jobs drained by a fixed number of background worker
+    tasks. Job state and results live in the validation_jobs collection and
+    expire through a TTL index on expires_at. The queue, with the uploaded
+    content, is in memory and bounded by job count and bytes. Every runner
+    heartbeats the active jobs it owns; active jobs whose heartbeat stopped
+    (their process went away) are marked failed by any runner.
+    """
+
+    def __init__(self, collection, courtlistener: CourtListenerClient, cache: VerificationCache,
+                 pdf_executor: Optional[ProcessPoolExecutor], workers: int = JOB_WORKERS,
+                 ttl_seconds: int = JOB_RESULT_TTL, queue_size: int = JOB_QUEUE_SIZE,
+                 max_queued_bytes: int = JOB_QUEUE_MAX_BYTES,
+                 heartbeat_interval: float = JOB_HEARTBEAT_INTERVAL):
+        self.collection = collection
+        self.courtlistener = courtlistener
+        self.cache = cache
+        self.pdf_executor = pdf_executor
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.max_queued_bytes = max_queued_bytes
+        self.queued_bytes = 0
+        self.heartbeat_interval = heartbeat_interval
+        self.id = str(uuid.uuid4())
+        self.workers = workers
+        self.tasks: List[asyncio.Task] = []
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("expires_at", expireAfterSeconds=0)
+        await self.collection.create_index([("created_at", -1)])
+
+    def start(self):
+        self.tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        self.tasks.append(asyncio.create_task(self._heartbeat()))
+
+    async def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    async def submit(self, job: ValidationJob, content: bytes) -> ValidationJob:
+        if self.queue.full() or self.queued_bytes + len(content) > self.max_queued_bytes:
+            raise HTTPException(status_code=503, detail="Job queue is full, please retry later")
+        now = datetime.utcnow()
+        doc = job.model_dump()
+        doc.update(_id=job.id, owner=self.id, heartbeat_at=now, expires_at=job.created_at + self.ttl)
+        await self.collection.insert_one(doc)
+        self.queued_bytes += len(content)
+        self.queue.put_nowait((job, content))
+        return job
+
+    async def get(self, job_id: str) -> Optional[ValidationJob]:
+        doc = await self.collection.find_one({"_id": job_id})
+        return ValidationJob(**doc) if doc else None
+
+    async def recent(self, limit: int) -> List[ValidationJob]:
+        cursor = self.collection.find({}, {"result": 0}).sort("created_at", -1).limit(limit)
+        return [ValidationJob(**doc) async for doc in cursor]
+
+    async def _set(self, job: ValidationJob, **fields):
+        """Set top-level fields of job and of its stored document."""
+        job.updated_at = datetime.utcnow()
+        update = {"updated_at": job.updated_at}
+        for name, value in fields.items():
+            setattr(job, name, value)
+            update[name] = value.model_dump() if isinstance(value, BaseModel) else value
+        await self.collection.update_one({"_id": job.id}, {"$set": update})
+
+    async def _progress(self, job: ValidationJob, total: Optional[Dict[str, int]] = None,
+                        done: Optional[Dict[str, int]] = None):
+        """
+        Record progress: totals are set, done counters are incremented with
+        $inc so concurrently verified chunks never overwrite each other.
+        """
+        job.updated_at = datetime.utcnow()
+        update: Dict[str, Any] = {"$set": {"updated_at": job.updated_at}}
+        for name, value in (total or {}).items():
+            setattr(job.progress, name, value)
+            update["$set"][f"progress.{name}"] = value
+        if done:
+            for name, amount in done.items():
+                setattr(job.progress, name, getattr(job.progress, name) + amount)
+            update["$inc"] = {f"progress.{name}": amount for name, amount in done.items()}
+        await self.collection.update_one({"_id": job.id}, update)
+
+    async def _heartbeat(self):
+        stale = timedelta(seconds=3 * self.heartbeat_interval)
+        while True:
+            try:
+                now = datetime.utcnow()
+                active = {"$in": ACTIVE_JOB_STATUSES}
+                await self.collection.update_many({"owner": self.id, "status": active},
+                                                  {"$set": {"heartbeat_at": now}})
+                orphaned = await self.collection.update_many(
+                    {"status": active, "$or": [{"heartbeat_at": {"$lt": now - stale}},
+                                               {"heartbeat_at": {"$exists": False}}]},
+                    {"$set": {"status": "failed", "updated_at": now,
+                              "error": "Interrupted by a server restart, please submit the job again"}},
+                )
+                if orphaned.modified_count:
+                    logger.warning(f"Marked {orphaned.modified_count} interrupted jobs as failed")
+            except Exception as e:
+                logger.warning(f"Job heartbeat failed: {e}")
+            await asyncio.sleep(self.heartbeat_interval)
+
+    async def _work(self):
+        while True:
+            job, content = await self.queue.get()
+            self.queued_bytes -= len(content)
+            outcome: Dict[str, Any] = {}
+            try:
+                await self._set(job, status="running")
+                # A task of its own, so the registry the job pins dies with it
+                # and the next job sees any reload in between
+                outcome = {"status": "completed", "result": await asyncio.create_task(self._run(job, content))}
+            except HTTPException as e:
+                outcome = {"status": "failed", "error": str(e.detail)}
+            except CourtListenerError as e:
+                outcome = {"status": "failed", "error": f"CourtListener API error: {e.detail}"}
+            except PyPDF2.errors.PdfReadError:
+                outcome = {"status": "failed", "error": "Invalid or corrupted PDF file"}
+            except Exception as e:
+                outcome = {"status": "failed", "error": f"Processing error: {str(e)}"}
+            finally:
+                try:
+                    await self._set(job, **outcome)
+                except Exception as e:
+                    logger.error(f"Could not persist job {job.id}: {e}")
+                self.queue.task_done()
+
+    async def _run(self, job: ValidationJob, content: bytes) -> ValidationResult:
+        pin_reporter_registry()
+        if job.kind == "pdf":
+            pages_total, futures = await schedule_pdf_extraction(content, self.pdf_executor)
+            await self._progress(job, total={"pages_total": pages_total})
+            page_texts = []
+            for future in futures:
+                pages = await future
+                page_texts.extend(pages)
+                await self._progress(job, done={"pages_extracted": len(pages)})
+            text = "".join(page + "\n" for page in page_texts)
+            if not text.strip():
+                raise HTTPException(status_code=400, detail="Could not extract text from PDF. Please ensure the PDF contains searchable text.")
+        else:
+            text = content.decode()
+
+        # One pass over the whole document, so dedupe, the verification cache
+        # and single-flight work across it; progress counts upstream chunks
+        lookup_json, degraded = await lookup_citations(text, job.extraction, self.courtlistener, self.cache,
+                                                       progress=functools.partial(self._progress, job))
+        return await run_cpu_bound(len(text), validate_citations, lookup_json, text, job.include_parsed,
+                                   degraded=degraded)
+
+def get_job_runner() -> JobRunner:
+    """Dependency returning the background job runner."""
+    return app.state.job_runner
 
 # API Endpoints
 
 @api_router.post("/validate-citations", response_model=ValidationResult)
-async def validate_citations_endpoint(lookup_json: List[CitationElement]):
+async def validate_citations_endpoint(lookup_json: List[CitationElement], include_parsed: bool = False):
     """
     Layer A: Core validation microservice endpoint.
     Takes LOOKUP_JSON from CourtListener and returns validated citations.
     """
+    cost = RequestCost.start()
+    pin_reporter_registry()
     try:
         # Convert Pydantic models to dict for processing
         lookup_data = [element.dict() for element in lookup_json]
-        result = validate_citations(lookup_data)
-        return result
+        result = validate_citations(lookup_data, include_parsed=include_parsed)
+        with METRICS.time("serialize"):
+            body = result.model_dump_json()
+        cost.citation_count = len(result.citations)
+        return Response(content=body, media_type="application/json", headers=cost.headers())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Validation error: {str(e)}")
 
 @api_router.post("/validate-pdf", response_model=ValidationResult)
-async def validate_pdf_endpoint(file: UploadFile = File(...)):
+async def validate_pdf_endpoint(
+    file: UploadFile = File(...),
+    extraction: Literal["courtlistener", "local"] = Form("courtlistener"),
+    include_parsed: bool = Form(False),
+    courtlistener: CourtListenerClient = Depends(get_courtlistener_client),
+    cache: VerificationCache = Depends(get_verification_cache),
+    document_cache: DocumentResultCache = Depends(get_document_cache),
+    pdf_executor: Optional[ProcessPoolExecutor] = Depends(get_pdf_executor),
+):
     """
     Upload and validate a PDF document for legal citations.
     Perfect for legal briefs, court documents, and legal memos.
     """
+    cost = RequestCost.start()
+    registry = pin_reporter_registry()
     try:
         # Verify file is PDF
         if not file.filename.lower().endswith('.pdf'):
             raise HTTPException(status_code=400, detail="Only PDF files are supported")
         
-        # Read PDF content
+        # Read PDF content; identical uploads are served from the result cache
         pdf_content = await file.read()
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_content))
+        document_key = document_cache.key("pdf", extraction, pdf_content, include_parsed, registry.version)
+        cached = await document_cache.get(document_key)
+        if cached:
+            return document_response(*cached, hit=True, cost=cost)
         
         # Extract text from all pages
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
+        pages = await extract_pdf_pages(pdf_content, pdf_executor)
+        text = "".join(page + "\n" for page in pages)
+        cost.page_count, cost.text_length = len(pages), len(text)
         
         if not text.strip():
             raise HTTPException(status_code=400, detail="Could not extract text from PDF. Please ensure the PDF contains searchable text.")
         
         # Process through Layer B pipeline
-        courtlistener_url = "https://www.courtlistener.com/api/rest/v4/citation-lookup/"
-        headers = {
-            "Authorization": f"Token {os.environ.get('COURTLISTENER_API_KEY', '')}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {"text": text}
-        
-        response = requests.post(courtlistener_url, json=payload, headers=headers)
-        
-        if response.status_code != 200:
+        try:
+            lookup_json, degraded = await lookup_citations(text, extraction, courtlistener, cache)
+        except CourtListenerError as e:
             raise HTTPException(
-                status_code=response.status_code, 
-                detail=f"Citation extraction failed: {response.text}"
+                status_code=e.status_code, 
+                detail=f"Citation extraction failed: {e.detail}"
             )
         
-        lookup_json = response.json()
-        
         # Validate citations using Layer A
-        result = validate_citations(lookup_json)
-        return result
+        result = await run_cpu_bound(len(text), validate_citations, lookup_json, text, include_parsed,
+                                     degraded=degraded)
+        with METRICS.time("serialize"):
+            body = result.model_dump_json()
+        cost.citation_count = len(result.citations)
+        if degraded:
+            # Not cached, so the document is verified again once CourtListener is back
+            return document_response(body, time.time(), hit=False, cost=cost)
+        return document_response(body, await document_cache.put(document_key, body), hit=False, cost=cost)
         
+    except HTTPException:
+        raise
     except PyPDF2.errors.PdfReadError:
         raise HTTPException(status_code=400, detail="Invalid or corrupted PDF file")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF processing error: {str(e)}")
 
 @api_router.post("/validate-text", response_model=ValidationResult)
-async def validate_text_endpoint(request: TextValidationRequest):
+async def validate_text_endpoint(
+    request: TextValidationRequest,
+    courtlistener: CourtListenerClient = Depends(get_courtlistener_client),
+    cache: VerificationCache = Depends(get_verification_cache),
+    document_cache: DocumentResultCache = Depends(get_document_cache),
+):
     """
     Layer B: Full pipeline endpoint.
     Takes text input, calls CourtListener API, then validates citations.
     """
+    cost = RequestCost.start()
+    cost.text_length = len(request.text)
+    registry = pin_reporter_registry()
     try:
-        # Step 1: Call CourtListener API
-        courtlistener_url = "https://www.courtlistener.com/api/rest/v4/citation-lookup/"
-        headers = {
-            "Authorization": f"Token {os.environ.get('COURTLISTENER_API_KEY', '')}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {"text": request.text}
+        document_key = document_cache.key("text", request.extraction, request.text.encode(),
+                                          request.include_parsed, registry.version)
+        cached = await document_cache.get(document_key)
+        if cached:
+            return document_response(*cached, hit=True, cost=cost)
         
-        response = requests.post(courtlistener_url, json=payload, headers=headers)
-        
-        if response.status_code != 200:
+        # Step 1: Find citations and verify cache misses with CourtListener
+        try:
+            lookup_json, degraded = await lookup_citations(request.text, request.extraction, courtlistener, cache)
+        except CourtListenerError as e:
             raise HTTPException(
-                status_code=response.status_code, 
-                detail=f"CourtListener API error: {response.text}"
+                status_code=e.status_code, 
+                detail=f"CourtListener API error: {e.detail}"
             )
         
-        lookup_json = response.json()
-        
         # Step 2: Validate citations using Layer A
-        result = validate_citations(lookup_json)
-        return result
+        result = await run_cpu_bound(len(request.text), validate_citations, lookup_json, request.text,
+                                     request.include_parsed, degraded=degraded)
+        with METRICS.time("serialize"):
+            body = result.model_dump_json()
+        cost.citation_count = len(result.citations)
+        if degraded:
+            # Not cached, so the document is verified again once CourtListener is back
+            return document_response(body, time.time(), hit=False, cost=cost)
+        return document_response(body, await document_cache.put(document_key, body), hit=False, cost=cost)
         
-    except requests.RequestException as e:
+    except HTTPException:
+        raise
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=500, detail=f"API request error: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
 
-@api_router.get("/reporters", response_model=List[Dict[str, Any]])
-async def get_reporters():
-    """Get available legal reporters list."""
-    return LEGAL_REPORTERS
+@api_router.post("/validate-pdf/stream")
+async def validate_pdf_stream_endpoint(
+    file: UploadFile = File(...),
+    extraction: Literal["courtlistener", "local"] = Form("courtlistener"),
+    stream_format: Literal["ndjson", "sse"] = Form("ndjson", alias="format"),
+    include_parsed: bool = Form(False),
+    courtlistener: CourtListenerClient = Depends(get_courtlistener_client),
+    cache: VerificationCache = Depends(get_verification_cache),
+    pdf_executor: Optional[ProcessPoolExecutor] = Depends(get_pdf_executor),
+):
+    """
+    Streaming variant of /validate-pdf. Emits each validated citation as NDJSON
+    (or Server-Sent Events) as soon as its page range is done, then the summary.
+    """
+    if not file.filename.lower().endswith('.pdf'):
+        raise HTTPException(status_code=400, detail="Only PDF files are supported")
+    try:
+        _, futures = await schedule_pdf_extraction(await file.read(), pdf_executor)
+        # Fail like /validate-pdf when no page has text; this usually only
+        # waits for the first page range
+        has_text = False
+        for future in futures:
+            if any(page.strip() for page in await future):
+                has_text = True
+                break
+    except PyPDF2.errors.PdfReadError:
+        raise HTTPException(status_code=400, detail="Invalid or corrupted PDF file")
+    if not has_text:
+        raise HTTPException(status_code=400, detail="Could not extract text from PDF. Please ensure the PDF contains searchable text.")
+    body = stream_validation(_pdf_units(futures), extraction, courtlistener, cache, stream_format, include_parsed)
+    return streaming_response(body, stream_format)
+
+@api_router.post("/validate-text/stream")
+async def validate_text_stream_endpoint(
+    request: TextValidationRequest,
+    stream_format: Literal["ndjson", "sse"] = Query("ndjson", alias="format"),
+    courtlistener: CourtListenerClient = Depends(get_courtlistener_client),
+    cache: VerificationCache = Depends(get_verification_cache),
+):
+    """
+    Streaming variant of /validate-text. Emits each validated citation as NDJSON
+    (or Server-Sent Events) as soon as its chunk is done, then the summary.
+    """
+    body = stream_validation(_text_units(request.text), request.extraction, courtlistener, cache, stream_format,
+                             request.include_parsed)
+    return streaming_response(body, stream_format)
+
+@api_router.post("/jobs", response_model=ValidationJob, status_code=202)
+async def create_job_endpoint(
+    file: Optional[UploadFile] = File(None),
+    text: Optional[str] = Form(None),
+    extraction: Literal["courtlistener", "local"] = Form("courtlistener"),
+    include_parsed: bool = Form(False),
+    runner: JobRunner = Depends(get_job_runner),
+):
+    """
+    Queue a PDF upload or text for background validation and return the job
+    right away. Poll GET /api/jobs/{id} for progress and the final result.
+    """
+    if file is not None:
+        if not file.filename.lower().endswith('.pdf'):
+            raise HTTPException(status_code=400, detail="Only PDF files are supported")
+        job = ValidationJob(kind="pdf", extraction=extraction, include_parsed=include_parsed)
+        content = await file.read()
+    elif text:
+        job = ValidationJob(kind="text", extraction=extraction, include_parsed=include_parsed)
+        content = text.encode()
+    else:
+        raise HTTPException(status_code=400, detail="Provide a PDF file or text to validate")
+    return await runner.submit(job, content)
+
+@api_router.get("/jobs", response_model=List[ValidationJob])
+async def list_jobs_endpoint(
+    limit: int = Query(50, ge=1, le=500),
+    runner: JobRunner = Depends(get_job_runner),
+):
+    """List the most recent jobs, newest first, without their results."""
+    return await runner.recent(limit)
+
+@api_router.get("/jobs/{job_id}", response_model=ValidationJob)
+async def get_job_endpoint(job_id: str, runner: JobRunner = Depends(get_job_runner)):
+    """Get a job's status, progress and, once completed, its ValidationResult."""
+    job = await runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@api_router.get("/reporters", response_model=List[ReporterRecord])
+async def get_reporters(
+    jurisdiction: Optional[str] = None,
+    state: Optional[str] = None,
+    court_level: Optional[str] = None,
+):
+    """Get available legal reporters list, optionally filtered."""
+    return REPORTER_REGISTRY.filter(jurisdiction=jurisdiction, state=state, court_level=court_level)
 
 @api_router.get("/health")
-async def health_check():
+async def health_check(courtlistener: CourtListenerClient = Depends(get_courtlistener_client)):
     """Health check endpoint."""
-    return {"status": "healthy", "reporters_loaded": len(LEGAL_REPORTERS)}
+    breaker = courtlistener.breaker
+    return {
+        # "degraded" while the breaker keeps CourtListener out of the pipeline
+        "status": "degraded" if breaker and breaker.state == "open" else "healthy",
+        "reporters_loaded": len(REPORTER_REGISTRY),
+        "reporters_version": REPORTER_REGISTRY.version,
+        "courtlistener": courtlistener.stats(),
+    }
+
+# Prometheus scrape target, served at the root like other exporters
+@app.get("/metrics")
+async def metrics_endpoint(courtlistener: CourtListenerClient = Depends(get_courtlistener_client)):
+    """Pipeline metrics of this worker in the Prometheus text format."""
+    lines = METRICS.render() + courtlistener.metric_lines()
+    return Response(content="\n".join(lines) + "\n", media_type="text/plain; version=0.0.4; charset=utf-8")
+
+# Admin endpoints, disabled unless ADMIN_TOKEN is set
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Dependency rejecting requests without the X-Admin-Token header."""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled")
+    if not hmac.compare_digest(x_admin_token or "", ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+@api_router.post("/admin/reload-reporters", dependencies=[Depends(require_admin)])
+async def reload_reporters_endpoint():
+    """
+    Rebuild the reporter tables from the JSON database and atomically swap
+    them in for this worker, then ask every other worker to do the same;
+    they follow within REPORTERS_SYNC_INTERVAL seconds. Requests already
+    running keep their tables.
+    """
+    try:
+        result = await reload_reporter_registry()
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Could not reload reporters: {str(e)}")
+    try:
+        result["generation"] = await app.state.reload_signal.publish()
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Reloaded this worker only, could not notify the others: {str(e)}")
+    return result
 
 # Legacy endpoints (keep existing functionality)
 class StatusCheck(BaseModel):
@@ -355,6 +2417,7 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=list(COST_HEADERS),
 )
 
 # Configure logging
@@ -364,13 +2427,85 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("shutdown")
+async def shutdown_job_runner():
+    await app.state.job_runner.stop()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
 
+@app.on_event("shutdown")
+async def shutdown_courtlistener_client():
+    await app.state.courtlistener.close()
+
+@app.on_event("shutdown")
+async def shutdown_pdf_executor():
+    app.state.pdf_executor.shutdown(cancel_futures=True)
+
+@app.on_event("shutdown")
+async def shutdown_reporters_watcher():
+    for watcher in app.state.reporters_watchers:
+        watcher.cancel()
+
 # Log startup info
 @app.on_event("startup")
 async def startup_event():
+    app.state.courtlistener = CourtListenerClient.from_env(
+        limiter=TokenBucket.from_env(db), breaker=CircuitBreaker.from_env()
+    )
+    app.state.verification_cache = VerificationCache.from_env(db)
+    app.state.document_cache = DocumentResultCache.from_env(db)
+    app.state.pdf_executor = ProcessPoolExecutor(max_workers=PDF_WORKERS)
+    app.state.job_runner = JobRunner(
+        db.validation_jobs, app.state.courtlistener, app.state.verification_cache, app.state.pdf_executor
+    )
+    try:
+        await app.state.verification_cache.ensure_indexes()
+        await app.state.document_cache.ensure_indexes()
+        await app.state.job_runner.ensure_indexes()
+    except Exception as e:
+        logger.warning(f"Could not create cache indexes: {e}")
+    app.state.job_runner.start()
+    app.state.reload_signal = ReloadSignal(db.reporter_reloads)
+    app.state.reporters_watchers = []
+    if REPORTERS_WATCH_INTERVAL > 0:
+        app.state.reporters_watchers.append(asyncio.create_task(watch_reporters_file(REPORTERS_WATCH_INTERVAL)))
+    if REPORTERS_SYNC_INTERVAL > 0:
+        app.state.reporters_watchers.append(asyncio.create_task(app.state.reload_signal.follow(REPORTERS_SYNC_INTERVAL)))
     logger.info(f"Strike Cite API started")
-    logger.info(f"Loaded {len(LEGAL_REPORTERS)} legal reporters")
-    logger.info(f"Reporter lookup table has {len(REPORTER_LOOKUP)} entries")
\ No newline at end of file
+    logger.info(f"Loaded {len(REPORTER_REGISTRY)} legal reporters from {REPORTER_REGISTRY.source} "
+                f"(version {REPORTER_REGISTRY.version[:12]})")
+    logger.info(f"Reporter lookup table has {REPORTER_REGISTRY.key_count} entries")
+    logger.info(f"Reporter matcher compiled with {REPORTER_REGISTRY.matcher.state_count} states")
+
+def serve_with_shared_tables(host: str, port: int, workers: int):
+    """
+    Build the reporter tables once in this master process, publish them in
+    shared memory and run uvicorn workers that attach to them.
+    """
+    import tempfile
+    import uvicorn
+
+    shm_dir = Path('/dev/shm') if Path('/dev/shm').is_dir() else Path(tempfile.gettempdir())
+    path = shm_dir / f"strikecite-reporters-{REPORTER_REGISTRY.version[:16]}-{os.getpid()}.tables"
+    publish_shared_tables(REPORTER_REGISTRY, path)
+    os.environ['REPORTERS_SHARED_TABLES'] = str(path)
+    try:
+        uvicorn.run("server:app", host=host, port=port, workers=workers, app_dir=str(ROOT_DIR))
+    finally:
+        path.unlink(missing_ok=True)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Strike Cite API tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    # The snapshot build step lives in reporters.py, which needs no database
+    serve = commands.add_parser("serve", help="run workers sharing one copy of the reporter tables")
+    serve.add_argument("--host", default="0.0.0.0")
+    serve.add_argument("--port", type=int, default=8001)
+    serve.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    serve_with_shared_tables(args.host, args.port, args.workers)
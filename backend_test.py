@@ -1,8 +1,33 @@
 import requests
 import json
 import sys
+import time
 from datetime import datetime
 
+def make_pdf(pages):
+    """Build a minimal PDF with one page per list of text lines"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for lines in pages:
+        escaped = [line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") for line in lines]
+        content = ("BT /F1 10 Tf 14 TL 50 750 Td " + " ".join(f"({line}) Tj T*" for line in escaped) + " ET").encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+                       b"/Resources << /Font << /F1 3 0 R >> >> >>" % len(objects))
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    pdf, offsets = bytearray(b"%PDF-1.4\n"), []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(pdf)
+
 class StrikeCiteAPITester:
     def __init__(self, base_url="https://9ea613dd-d35e-4223-a0c6-5060536aa0d6.preview.emergentagent.com/api"):
         self.base_url = base_url
@@ -85,6 +110,18 @@ class StrikeCiteAPITester:
                     print(f"✅ Found {abbr} reporter")
                 else:
                     print(f"❌ Missing {abbr} reporter")
+            
+            # Check indexed filtering
+            filtered_success, filtered = self.run_test(
+                "Get Reporters (Federal Supreme Court)",
+                "GET",
+                "reporters?jurisdiction=Federal&court_level=Supreme%20Court",
+                200
+            )
+            if filtered_success and all(r['court_level'] == 'Supreme Court' for r in filtered):
+                print(f"✅ Filtered {len(filtered)} Supreme Court reporters")
+            else:
+                print(f"❌ Reporter filtering failed")
                 
         return success
 
@@ -215,22 +252,730 @@ class StrikeCiteAPITester:
                 
         return success
 
+    def test_validate_text_local_extraction(self):
+        """Test the validate-text endpoint with offline local extraction"""
+        print("\n=== Testing Validate Text Endpoint (local extraction) ===")
+        
+        text_data = {
+            "text": "Roe v. Wade, 410 U.S. 113 (1973); Smith v. Jones, 12 F. Supp. 3d 45; Doe v. Roe, 2014 WY 20.",
+            "extraction": "local"
+        }
+        
+        success, response = self.run_test(
+            "Validate Text (local)",
+            "POST",
+            "validate-text",
+            200,
+            data=text_data
+        )
+        
+        if success:
+            found = {c['raw']: c for c in response['citations']}
+            for raw in ["410 U.S. 113", "12 F. Supp. 3d 45", "2014 WY 20"]:
+                if raw in found and text_data['text'][found[raw]['start_char']:found[raw]['end_char']] == raw:
+                    print(f"✅ Extracted {raw} with correct offsets")
+                else:
+                    print(f"❌ Failed to extract {raw}")
+            if found.get("12 F. Supp. 3d 45", {}).get('reporter') == "F. Supp. 3d":
+                print(f"✅ Identified longest reporter F. Supp. 3d")
+            else:
+                print(f"❌ Failed to identify F. Supp. 3d reporter")
+                
+        return success
+
+    def test_reporter_variants(self):
+        """Test local extraction of reporters written with other spacing and periods"""
+        print("\n=== Testing Reporter Spelling Variants ===")
+
+        expected = {
+            "100 F. 2d 5": "F.2d",
+            "101 F 3d 6": "F.3d",
+            "102 F.Supp.2d 7": "F. Supp. 2d",
+            "103 F.Supp. 2d 8": "F. Supp. 2d",
+            "104 So 2d 9": "So. 2d",
+            "105 S.Ct. 10": "S. Ct.",
+            "106 N.E. 2d 11": "N.E.2d",
+            "107 A. 2d 12": "A.2d",
+            "108 P. 3d 13": "P.3d",
+            "109 S.W. 3d 14": "S.W.3d",
+        }
+        text_data = {
+            "text": "; ".join(expected) + ". We also met 5 so 2 of them.",
+            "extraction": "local"
+        }
+
+        success, response = self.run_test(
+            "Validate Text (variants)",
+            "POST",
+            "validate-text",
+            200,
+            data=text_data
+        )
+
+        if success:
+            found = {c['raw']: c['reporter'] for c in response['citations']}
+            for raw, reporter in expected.items():
+                success &= self.check(f"Extracted {raw} as {reporter}", found.get(raw) == reporter,
+                                      f"found {found.get(raw)}")
+            success &= self.check("Ignored lower-case prose", "5 so 2" not in found, str(sorted(found)))
+
+        return success
+
+    def test_preflight_rejects(self):
+        """Test that impossible citations are rejected locally with a precise note"""
+        print("\n=== Testing Pre-flight Rejects ===")
+
+        text_data = {
+            "text": "Smith v. Jones, 5 F.1d 3 (1850); Doe v. Roe, 400 F. 1 (1930); Roe v. Wade, 410 U.S. 113 (1973); "
+                    "Poe v. Ullman, 5 S.E.3d 7 (2021); People v. Doe, 300 Ill. 1 (1990).",
+            "extraction": "local"
+        }
+
+        success, response = self.run_test(
+            "Validate Text (pre-flight)",
+            "POST",
+            "validate-text",
+            200,
+            data=text_data
+        )
+
+        if success:
+            found = {c['raw']: c for c in response['citations']}
+            for raw, reason in [("5 F.1d 3", "there is no 'F.1d'"), ("400 F. 1", "has no volume 400"),
+                                ("5 S.E.3d 7", "the latest series is 'S.E.2d'")]:
+                citation = found.get(raw)
+                success = self.check(
+                    f"Rejected {raw}: {reason}",
+                    citation is not None and not citation['verified']
+                    and citation['note'].startswith("impossible citation") and reason in citation['note'],
+                    citation['note'] if citation else "not found"
+                ) and success
+            success = self.check(
+                "Kept 410 U.S. 113",
+                "impossible" not in found.get("410 U.S. 113", {}).get('note', "impossible")
+            ) and success
+            note = found.get("300 Ill. 1", {}).get('note', "")
+            success = self.check(
+                "Warned that Ill. ended in 1956",
+                "'Ill.' ends in 1956" in note and "'Ill. 2d'" in note,
+                note
+            ) and success
+
+        return success
+
+    def check(self, description, passed, detail=""):
+        """Record a check that needs no HTTP request"""
+        self.tests_run += 1
+        if passed:
+            self.tests_passed += 1
+            print(f"✅ {description}")
+        else:
+            print(f"❌ {description}" + (f" - {detail}" if detail else ""))
+        return passed
+
+    def test_parallel_citations(self):
+        """Test grouping of parallel citations to one authority"""
+        print("\n=== Testing Parallel Citations ===")
+
+        text_data = {
+            "text": "Roe v. Wade, 410 U.S. 113, 93 S. Ct. 705, 35 L. Ed. 2d 147 (1973); see 123 F.3d 456.",
+            "extraction": "local"
+        }
+
+        success, response = self.run_test(
+            "Validate Text (parallel citations)",
+            "POST",
+            "validate-text",
+            200,
+            data=text_data
+        )
+
+        if success:
+            groups = {c['raw']: c['group_id'] for c in response['citations']}
+            success = self.check(
+                "Grouped 410 U.S. 113, 93 S. Ct. 705 and 35 L. Ed. 2d 147",
+                all(groups.get(raw) == "410 us 113" for raw in ["410 U.S. 113", "93 S. Ct. 705", "35 L. Ed. 2d 147"]),
+                str(groups)
+            ) and success
+            success = self.check(
+                "Left 123 F.3d 456 out of the group",
+                "123 F.3d 456" in groups and groups["123 F.3d 456"] is None,
+                str(groups)
+            ) and success
+
+        return success
+
+    def test_short_forms(self):
+        """Test Id., supra and short-form linking to their full citations"""
+        print("\n=== Testing Short-Form Citations ===")
+
+        text_data = {
+            "text": "Roe v. Wade, 410 U.S. 113 (1973). Id. at 120. "
+                    "Smith v. Jones Corp., 123 F.3d 456 (9th Cir. 1999). Roe, 410 U.S. at 116. "
+                    "Jones, supra, at 460. Id."
+        }
+
+        success, response = self.run_test(
+            "Validate Text (short forms)",
+            "POST",
+            "validate-text",
+            200,
+            data=text_data
+        )
+
+        if success:
+            citations = response['citations']
+            full = {c['start_char']: c for c in citations if c['form'] == "full"}
+            expected = [("id", "Id. at 120", "410 U.S. 113"), ("short", "410 U.S. at 116", "410 U.S. 113"),
+                        ("supra", "Jones, supra, at 460", "123 F.3d 456"), ("id", "Id.", "123 F.3d 456")]
+            short_forms = [c for c in citations if c['form'] != "full"]
+            success = self.check(
+                f"Found {len(expected)} short forms",
+                [(c['form'], c['raw']) for c in short_forms] == [(form, raw) for form, raw, _ in expected],
+                str([(c['form'], c['raw']) for c in short_forms])
+            ) and success
+            for citation, (form, raw, antecedent) in zip(short_forms, expected):
+                linked = full.get(citation['antecedent_start'])
+                success = self.check(
+                    f"'{raw}' links to {antecedent} and shares its verification",
+                    linked is not None and linked['raw'] == antecedent and citation['verified'] == linked['verified'],
+                    f"antecedent_start={citation['antecedent_start']}"
+                ) and success
+
+        # Without a parenthetical, Id. follows the citation's sentence end
+        sentence_success, response = self.run_test(
+            "Validate Text (Id. after a sentence end)",
+            "POST",
+            "validate-text",
+            200,
+            data={"text": "See Roe v. Wade, 410 U.S. 113. Id. at 115.", "extraction": "local"}
+        )
+        if sentence_success:
+            forms = [(c['form'], c['raw'], c['antecedent_start']) for c in response['citations']]
+            sentence_success = self.check(
+                "'Id. at 115' after '410 U.S. 113.' links to it",
+                forms == [("full", "410 U.S. 113", None), ("id", "Id. at 115", 17)],
+                str(forms)
+            )
+
+        return success and sentence_success
+
+    def test_stream_short_forms(self):
+        """Test that streaming over overlapping chunks links short forms like validate-text"""
+        print("\n=== Testing Short-Form Citations in Streams ===")
+
+        # Long enough for several overlapping stream chunks
+        text = ("See Roe v. Wade, 410 U.S. 113, 115 (1973). Id. at 120. "
+                "Smith v. Jones Corp., 123 F.3d 456 (9th Cir. 1999). Roe, 410 U.S. at 116. Id. "
+                "Jones, supra, at 460. Prosser, supra, at 5. 999 U.S. at 5. Ibid. ") * 60
+        text_data = {"text": text, "extraction": "local"}
+
+        success, response = self.run_test(
+            "Validate Text (long document)",
+            "POST",
+            "validate-text",
+            200,
+            data=text_data
+        )
+        self.tests_run += 1
+        try:
+            stream = requests.post(f"{self.base_url}/validate-text/stream?format=ndjson", json=text_data)
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            return False
+        if stream.status_code != 200:
+            print(f"❌ Failed - Expected 200, got {stream.status_code}")
+            return False
+        self.tests_passed += 1
+        print(f"✅ Passed - Status: 200")
+
+        if success:
+            fields = ('start_char', 'form', 'raw', 'antecedent_start', 'verified')
+            expected = [tuple(c[f] for f in fields) for c in response['citations']]
+            events = [json.loads(line) for line in stream.text.splitlines()]
+            streamed = [tuple(e[f] for f in fields) for e in events if e['event'] == "citation"]
+            differing = [pair for pair in zip(expected, streamed) if pair[0] != pair[1]]
+            success = self.check(
+                f"Streamed the same {len(expected)} citations and links",
+                streamed == expected,
+                f"{len(streamed)} streamed, first differences: {differing[:2]}"
+            )
+
+        return success
+
+    def test_stream_pdf(self):
+        """Test that streaming a PDF keeps citations split across page ranges"""
+        print("\n=== Testing PDF Streams ===")
+
+        # Every page break splits a citation, so some fall on a page range boundary
+        pages = [["Brief of Appellant."]] + [["U.S. 113 (1973). The court agreed."]] * 40
+        pages = [lines + ["See Roe v. Wade, 410"] for lines in pages[:-1]] + pages[-1:]
+        form = {"extraction": "local"}
+        files = {"file": ("brief.pdf", make_pdf(pages), "application/pdf")}
+
+        self.tests_run += 2
+        try:
+            whole = requests.post(f"{self.base_url}/validate-pdf", data=form, files=files)
+            stream = requests.post(f"{self.base_url}/validate-pdf/stream", data=form, files=files)
+            empty = requests.post(f"{self.base_url}/validate-pdf/stream", data=form,
+                                  files={"file": ("blank.pdf", make_pdf([[], []]), "application/pdf")})
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            return False
+        if whole.status_code != 200 or stream.status_code != 200:
+            print(f"❌ Failed - Expected 200, got {whole.status_code} and {stream.status_code}")
+            return False
+        self.tests_passed += 2
+        print(f"✅ Passed - Status: 200")
+
+        fields = ('start_char', 'raw', 'reporter')
+        expected = [tuple(c[f] for f in fields) for c in whole.json()['citations']]
+        events = [json.loads(line) for line in stream.text.splitlines()]
+        streamed = [tuple(e[f] for f in fields) for e in events if e['event'] == "citation"]
+        success = self.check(f"Found all {len(pages) - 1} split citations", len(expected) == len(pages) - 1,
+                             f"found {len(expected)}")
+        success &= self.check(f"Streamed the same {len(expected)} citations", streamed == expected,
+                              f"{len(streamed)} streamed")
+        success &= self.check("Rejected a PDF without text", empty.status_code == 400,
+                              f"got {empty.status_code}")
+        return success
+
+    def test_jobs(self):
+        """Test a background job over a document longer than one stream chunk"""
+        print("\n=== Testing Validation Jobs ===")
+
+        # The same authority well apart, in what used to be separate pieces
+        text = "".join(f"Part {i}. See Roe v. Wade, 410 U.S. 113 (1973). " + "Filler text. " * 450
+                       for i in range(5))
+
+        self.tests_run += 1
+        print(f"\n🔍 Testing Create Job...")
+        try:
+            response = requests.post(f"{self.base_url}/jobs", data={"text": text})
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            return False
+        if response.status_code != 202:
+            print(f"❌ Failed - Expected 202, got {response.status_code}")
+            return False
+        self.tests_passed += 1
+        print(f"✅ Passed - Status: 202")
+
+        job = response.json()
+        for _ in range(60):
+            success, job = self.run_test("Get Job", "GET", f"jobs/{job['id']}", 200)
+            if not success or job['status'] not in ("queued", "running"):
+                break
+            time.sleep(1)
+        if not success:
+            return False
+
+        success = self.check("Job completed", job['status'] == "completed", str(job.get('error')))
+        if success:
+            expected_success, expected = self.run_test(
+                "Validate Text (same document)",
+                "POST",
+                "validate-text",
+                200,
+                data={"text": text}
+            )
+            success = self.check(
+                "Job result matches validate-text",
+                expected_success and job['result']['citations'] == expected['citations'],
+                f"{len(job['result']['citations'])} citations"
+            ) and success
+            success = self.check(
+                "Found all 5 occurrences as one authority",
+                len(job['result']['citations']) == 5 and len(job['result']['authorities']) == 1
+            ) and success
+
+        return success
+
+    def test_verification_cache(self):
+        """Test that cached citations in new prose need no upstream call"""
+        print("\n=== Testing Verification Cache ===")
+
+        stamp = datetime.now().isoformat()
+        self.tests_run += 1
+        try:
+            # Different documents, so the document cache cannot answer the second
+            first = requests.post(f"{self.base_url}/validate-text", json={
+                "text": f"Roe v. Wade, 410 U.S. 113 (1973). Filed {stamp}."
+            })
+            second = requests.post(f"{self.base_url}/validate-text", json={
+                "text": f"On March 3, 2020, alleging 4 counts under Title 7, see Roe v. Wade, 410 U.S. 113 (1973). "
+                        f"Filed {stamp}."
+            })
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            return False
+        if first.status_code != 200 or second.status_code != 200:
+            print(f"❌ Failed - Got {first.status_code} and {second.status_code}")
+            return False
+        self.tests_passed += 1
+        print(f"✅ Passed - Status: 200")
+
+        citations = second.json()['citations']
+        success = self.check(
+            "Answered 410 U.S. 113 from the cache",
+            [c['raw'] for c in citations] == ["410 U.S. 113"]
+            and citations[0]['verified'] == first.json()['citations'][0]['verified'],
+            str([(c['raw'], c['verified']) for c in citations])
+        )
+        success = self.check(
+            "Sent nothing upstream for dates and counts in prose",
+            second.headers.get('X-Upstream-Bytes-Sent') == "0",
+            f"X-Upstream-Bytes-Sent: {second.headers.get('X-Upstream-Bytes-Sent')}"
+        ) and success
+
+        return success
+
+    def test_document_cache(self):
+        """Test that a repeated document is served from the document cache"""
+        print("\n=== Testing Document Cache ===")
+
+        text_data = {"text": f"Roe v. Wade, 410 U.S. 113 (1973). Filed {datetime.now().isoformat()}."}
+        self.tests_run += 1
+        try:
+            first = requests.post(f"{self.base_url}/validate-text", json=text_data)
+            second = requests.post(f"{self.base_url}/validate-text", json=text_data)
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            return False
+        if first.status_code != 200 or second.status_code != 200:
+            print(f"❌ Failed - Got {first.status_code} and {second.status_code}")
+            return False
+        self.tests_passed += 1
+        print(f"✅ Passed - Status: 200")
+
+        success = self.check(
+            "Missed the cache on the first request and hit it on the repeat",
+            first.headers.get('X-Cache') == "MISS" and second.headers.get('X-Cache') == "HIT",
+            f"X-Cache: {first.headers.get('X-Cache')}, {second.headers.get('X-Cache')}"
+        )
+        success = self.check("Served the same result", second.content == first.content) and success
+
+        return success
+
+    def import_backend(self):
+        """Import the backend's server module for checks that need no network, or None"""
+        import os
+        from pathlib import Path
+        sys.path.insert(0, str(Path(__file__).parent / 'backend'))
+        # The Motor client is created on import but never connects here
+        os.environ.setdefault('MONGO_URL', "mongodb://localhost:27017")
+        os.environ.setdefault('DB_NAME', "strike_cite_test")
+        try:
+            import server
+        except Exception as e:
+            self.check("Imported the backend", False, str(e))
+            return None
+        return server
+
+    def test_chunking(self):
+        """Test that split_text_chunks windows overlap and their owned ranges tile the text"""
+        print("\n=== Testing Chunking ===")
+
+        server = self.import_backend()
+        if server is None:
+            return False
+
+        text = " ".join(f"word{i}" for i in range(400)) + ". " + "x" * 50
+        chunks = server.split_text_chunks(text, 400, 40)
+        success = self.check(
+            f"split_text_chunks cut {len(text)} characters into {len(chunks)} windows of at most 400",
+            len(chunks) > 1 and all(end - start <= 400 for start, end, _ in chunks),
+            str(chunks)
+        )
+        success = self.check(
+            "Owned ranges tile the text and every window overlaps the next",
+            chunks[0][0] == 0 and chunks[-1][1:] == (len(text), len(text))
+            and all(owned == following[0] < end for (_, end, owned), following in zip(chunks, chunks[1:])),
+            str(chunks)
+        ) and success
+        success = self.check(
+            "Short text is one window",
+            server.split_text_chunks("410 U.S. 113", 400, 40) == [(0, 12, 12)]
+        ) and success
+
+        return success
+
+    def test_reporter_snapshot(self):
+        """Test that the compiled reporter snapshot loads the same registry as the JSON"""
+        print("\n=== Testing Reporter Snapshot ===")
+
+        import tempfile
+        from pathlib import Path
+        if self.import_backend() is None:
+            return False
+        import reporters
+
+        text = "Roe v. Wade, 410 U.S. 113, 93 S. Ct. 705 (1973); see 123 F. 3d 456 and 2019 WL 12345."
+        with tempfile.TemporaryDirectory() as directory:
+            snapshot = Path(directory) / "reporters.snapshot"
+            version = reporters.compile_reporter_snapshot(reporters.REPORTERS_FILE, snapshot)
+            expected = reporters.ReporterRegistry.from_json(reporters.REPORTERS_FILE)
+            loaded = reporters.ReporterRegistry.from_snapshot(snapshot, version)
+            stale = reporters.ReporterRegistry.from_snapshot(snapshot, "0" * 64)
+
+        success = self.check(
+            "Loaded the snapshot with the JSON database's records and version",
+            loaded is not None and loaded.source == "snapshot" and loaded.version == expected.version
+            and loaded.records == expected.records,
+            "not loaded" if loaded is None else loaded.source
+        )
+        success = self.check(
+            "The snapshot's matcher finds the same reporters",
+            loaded is not None and list(loaded.matcher.finditer(text)) == list(expected.matcher.finditer(text))
+        ) and success
+        success = self.check("Ignored a snapshot of another database version", stale is None) and success
+
+        return success
+
+    def test_shared_tables(self):
+        """Test that a worker attached to the shared reporter tables answers like the registry"""
+        print("\n=== Testing Shared Reporter Tables ===")
+
+        import tempfile
+        from pathlib import Path
+        if self.import_backend() is None:
+            return False
+        import reporters
+
+        registry = reporters.ReporterRegistry.from_json(reporters.REPORTERS_FILE)
+        text = "Roe v. Wade, 410 U.S. 113, 93 S. Ct. 705 (1973); see 123 F. 3d 456 and 2019 WL 12345."
+        with tempfile.TemporaryDirectory() as directory:
+            shared = reporters.SharedReporterRegistry.attach(
+                reporters.publish_shared_tables(registry, Path(directory) / "reporters.tables")
+            )
+            success = self.check(
+                f"Attached {len(shared)} records of version {shared.version[:12]}",
+                len(shared) == len(registry) and shared.version == registry.version
+                and shared.key_count == registry.key_count
+            )
+            success = self.check(
+                "Lookups and filters match the registry",
+                all(shared.get(r.abbreviation) == r for r in registry.records)
+                and shared.lookup("F 3d") == registry.lookup("F 3d")
+                and shared.filter(jurisdiction="Federal") == registry.filter(jurisdiction="Federal")
+            ) and success
+            success = self.check(
+                "The shared matcher and diagnostic rules match the registry's",
+                list(shared.matcher.finditer(text)) == list(registry.matcher.finditer(text))
+                and shared.diagnostics.diagnose("123 F3rd 456", "F.3d")
+                == registry.diagnostics.diagnose("123 F3rd 456", "F.3d")
+            ) and success
+
+        return success
+
+    def test_reporter_reload(self):
+        """Test hot reload of the reporter database while a request has its registry pinned"""
+        print("\n=== Testing Reporter Reload ===")
+
+        import asyncio
+        import tempfile
+        from pathlib import Path
+        server = self.import_backend()
+        if server is None:
+            return False
+
+        records = json.loads(server.REPORTERS_FILE.read_text())
+        records.append({"abbreviation": "Test Rptr.", "description": "Reporter added by the reload test."})
+
+        async def reload_while_pinned(path):
+            pinned = server.pin_reporter_registry()
+            result = await server.reload_reporter_registry(path)
+            return pinned, server.reporter_registry(), result
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "reporters.json"
+            path.write_text(json.dumps(records))
+            before = server.reporter_registry()
+            pinned, during, result = asyncio.run(reload_while_pinned(path))
+            after = server.reporter_registry()
+            found = [e['citation'] for e in server.extract_citations_local("See 5 Test Rptr. 7.")]
+            restored = asyncio.run(server.reload_reporter_registry())
+
+        success = self.check(
+            f"Reloaded {result['reporters_loaded']} reporters as a new version",
+            result['reloaded'] and result['previous_version'] == before.version != result['version'],
+            str(result)
+        )
+        success = self.check(
+            "The pinned request kept its registry",
+            pinned is before and during is before and after.version == result['version']
+        ) and success
+        success = self.check("New requests see the added reporter", found == ["5 Test Rptr. 7"], str(found)) and success
+        success = self.check(
+            "Reloading the original database restores its version",
+            restored['reloaded'] and server.reporter_registry().version == before.version
+        ) and success
+
+        return success
+
+    def test_token_bucket(self):
+        """Test that the CourtListener rate limiter bursts, paces and backs off"""
+        print("\n=== Testing Rate Limiter ===")
+
+        import asyncio
+        server = self.import_backend()
+        if server is None:
+            return False
+
+        async def drain(bucket, count):
+            return [await bucket.acquire() for _ in range(count)]
+
+        bucket = server.TokenBucket(rate=20, capacity=2)
+        waits = asyncio.run(drain(bucket, 4))
+        success = self.check(
+            "TokenBucket serves the burst at once and paces the rest",
+            waits[0] < 0.01 and waits[1] < 0.01 and all(0.02 < wait < 0.2 for wait in waits[2:])
+            and bucket.stats()["acquired"] == 4,
+            str(waits)
+        )
+        asyncio.run(bucket.penalize(0.2))
+        waited = asyncio.run(drain(bucket, 1))[0]
+        success = self.check(
+            "TokenBucket.penalize holds callers back",
+            waited >= 0.15,
+            f"waited {waited:.3f}s"
+        ) and success
+
+        return success
+
+    def test_circuit_breaker(self):
+        """Test that the circuit breaker opens, lets one trial through and closes again"""
+        print("\n=== Testing Circuit Breaker ===")
+
+        server = self.import_backend()
+        if server is None:
+            return False
+
+        breaker = server.CircuitBreaker(failure_rate=0.5, slow_seconds=1.0, window=4, min_calls=4, open_seconds=0.05)
+        for ok in (True, False, True, False):
+            breaker.allow()
+            breaker.record(ok, 0.01)
+        success = self.check(
+            "CircuitBreaker opens at the failure rate and refuses requests",
+            breaker.state == "open" and breaker.trips == 1 and not breaker.allow(),
+            str(breaker.stats())
+        )
+        time.sleep(0.06)
+        trial = breaker.allow()
+        success = self.check(
+            "CircuitBreaker lets exactly one trial through when half-open",
+            trial and breaker.state == "half_open" and not breaker.allow(),
+            str(breaker.stats())
+        ) and success
+        breaker.record(True, 2.0)
+        success = self.check(
+            "A slow trial reopens the CircuitBreaker",
+            breaker.state == "open" and breaker.trips == 2,
+            str(breaker.stats())
+        ) and success
+        time.sleep(0.06)
+        breaker.allow()
+        breaker.record(True, 0.01)
+        success = self.check("A good trial closes the CircuitBreaker", breaker.state == "closed") and success
+
+        return success
+
+    def test_metrics(self):
+        """Test the /metrics scrape target"""
+        print("\n=== Testing Metrics ===")
+
+        self.tests_run += 1
+        try:
+            requests.post(f"{self.base_url}/validate-text", json={
+                "text": f"Roe v. Wade, 410 U.S. 113 (1973). Checked {datetime.now().isoformat()}.",
+                "extraction": "local"
+            })
+            metrics = requests.get(f"{self.base_url.rsplit('/api', 1)[0]}/metrics")
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            return False
+        if metrics.status_code != 200:
+            print(f"❌ Failed - Expected 200, got {metrics.status_code}")
+            return False
+        self.tests_passed += 1
+        print(f"✅ Passed - Status: 200")
+
+        return self.check(
+            "/metrics is in the Prometheus text format",
+            metrics.headers.get('Content-Type', "").startswith("text/plain")
+            and "# TYPE strikecite_stage_seconds histogram" in metrics.text
+            and 'strikecite_stage_seconds_count{stage="extract"}' in metrics.text,
+            metrics.text[:200]
+        )
+
+    def test_server_timing(self):
+        """Test the Server-Timing and per-request cost headers"""
+        print("\n=== Testing Server-Timing ===")
+
+        self.tests_run += 1
+        try:
+            response = requests.post(f"{self.base_url}/validate-text", json={
+                "text": f"Roe v. Wade, 410 U.S. 113 (1973). Checked {datetime.now().isoformat()}.",
+                "extraction": "local"
+            })
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            return False
+        if response.status_code != 200:
+            print(f"❌ Failed - Expected 200, got {response.status_code}")
+            return False
+        self.tests_passed += 1
+        print(f"✅ Passed - Status: 200")
+
+        timing = response.headers.get('Server-Timing', "")
+        success = self.check(
+            "Server-Timing reports every stage",
+            all(f"{stage};dur=" in timing for stage in ["extraction", "upstream", "validation", "serialization"]),
+            timing
+        )
+        success = self.check(
+            "X-Text-Length and X-Citation-Count are set",
+            response.headers.get('X-Text-Length') is not None and response.headers.get('X-Citation-Count') == "1",
+            str(dict(response.headers))
+        ) and success
+
+        return success
+
 def main():
     # Setup
     tester = StrikeCiteAPITester()
     
-    # Run tests
-    health_success = tester.test_health_endpoint()
-    reporters_success = tester.test_reporters_endpoint()
-    validate_citations_success = tester.test_validate_citations_endpoint()
-    validate_text_success = tester.test_validate_text_endpoint()
+    # Run tests, every one of them even after a failure
+    results = [
+        tester.test_health_endpoint(),
+        tester.test_reporters_endpoint(),
+        tester.test_validate_citations_endpoint(),
+        tester.test_validate_text_endpoint(),
+        tester.test_validate_text_local_extraction(),
+        tester.test_reporter_variants(),
+        tester.test_preflight_rejects(),
+        tester.test_parallel_citations(),
+        tester.test_short_forms(),
+        tester.test_stream_short_forms(),
+        tester.test_stream_pdf(),
+        tester.test_jobs(),
+        tester.test_verification_cache(),
+        tester.test_document_cache(),
+        tester.test_chunking(),
+        tester.test_reporter_snapshot(),
+        tester.test_shared_tables(),
+        tester.test_reporter_reload(),
+        tester.test_token_bucket(),
+        tester.test_circuit_breaker(),
+        tester.test_metrics(),
+        tester.test_server_timing(),
+    ]
     
     # Print results
     print(f"\n📊 Tests passed: {tester.tests_passed}/{tester.tests_run}")
     
     # Return success status
-    return 0 if (health_success and reporters_success and 
-                validate_citations_success and validate_text_success) else 1
+    return 0 if all(results) else 1
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -4,6 +4,9 @@ Create the COMPLETE comprehensive legal reporters database based on the user's f
 This includes ALL federal, state, regional, and specialized court reporters
 """
 import json
+import subprocess
+import sys
+from pathlib import Path
 
 def create_complete_legal_reporters():
     """
@@ -17,6 +20,7 @@ def create_complete_legal_reporters():
             "abbreviation": "U.S.",
             "aliases": ["US", "U. S."],
             "description": "United States Reports - official reporter for U.S. Supreme Court decisions. Continuous volume numbering (no series).",
+            "first_year": 1790,
             "court_level": "Supreme Court",
             "jurisdiction": "Federal",
             "states": [],
@@ -27,6 +31,7 @@ def create_complete_legal_reporters():
             "abbreviation": "S. Ct.",
             "aliases": ["S Ct", "Sup. Ct."],
             "description": "Supreme Court Reporter - unofficial West reporter for U.S. Supreme Court cases. Parallel to U.S. Reports.",
+            "first_year": 1882,
             "court_level": "Supreme Court",
             "jurisdiction": "Federal",
             "states": [],
@@ -37,6 +42,9 @@ def create_complete_legal_reporters():
             "abbreviation": "L. Ed.",
             "aliases": ["L Ed"],
             "description": "Lawyers' Edition (U.S. Supreme Court) - unofficial reporter (1882-present, second series since 1956).",
+            "last_year": 1956,
+            "last_volume": 100,
+            "successor": "L. Ed. 2d",
             "court_level": "Supreme Court",
             "jurisdiction": "Federal",
             "states": [],
@@ -47,6 +55,7 @@ def create_complete_legal_reporters():
             "abbreviation": "L. Ed. 2d",
             "aliases": ["L.Ed.2d", "L Ed 2d"],
             "description": "Lawyers' Edition, Second Series - continuation of L. Ed. since 1956.",
+            "first_year": 1956,
             "court_level": "Supreme Court",
             "jurisdiction": "Federal",
             "states": [],
@@ -59,6 +68,10 @@ def create_complete_legal_reporters():
             "abbreviation": "F.",
             "aliases": [],
             "description": "Federal Reporter (1st series) - U.S. Courts of Appeals decisions 1880-1924.",
+            "first_year": 1880,
+            "last_year": 1924,
+            "last_volume": 300,
+            "successor": "F.2d",
             "court_level": "Federal Courts of Appeals",
             "jurisdiction": "Federal",
             "states": [],
@@ -69,6 +82,10 @@ def create_complete_legal_reporters():
             "abbreviation": "F.2d",
             "aliases": ["F2d"],
             "description": "Federal Reporter, Second Series - U.S. Courts of Appeals 1925-1993.",
+            "first_year": 1924,
+            "last_year": 1993,
+            "last_volume": 999,
+            "successor": "F.3d",
             "court_level": "Federal Courts of Appeals",
             "jurisdiction": "Federal",
             "states": [],
@@ -79,6 +96,10 @@ def create_complete_legal_reporters():
             "abbreviation": "F.3d",
             "aliases": ["F3d", "F3rd"],
             "description": "Federal Reporter, Third Series - U.S. Courts of Appeals 1993-2021.",
+            "first_year": 1993,
+            "last_year": 2021,
+            "last_volume": 999,
+            "successor": "F.4th",
             "court_level": "Federal Courts of Appeals",
             "jurisdiction": "Federal",
             "states": [],
@@ -89,6 +110,7 @@ def create_complete_legal_reporters():
             "abbreviation": "F.4th",
             "aliases": ["F4th"],
             "description": "Federal Reporter, Fourth Series - U.S. Courts of Appeals 2021-present.",
+            "first_year": 2021,
             "court_level": "Federal Courts of Appeals",
             "jurisdiction": "Federal",
             "states": [],
@@ -99,6 +121,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Fed. App'x",
             "aliases": ["Fed. Appx", "F. App'x"],
             "description": "Federal Appendix - unpublished federal appellate decisions (2001-2021).",
+            "first_year": 2001,
+            "last_year": 2021,
             "court_level": "Federal Courts of Appeals",
             "jurisdiction": "Federal",
             "states": [],
@@ -121,6 +145,10 @@ def create_complete_legal_reporters():
             "abbreviation": "F. Supp.",
             "aliases": ["F Supp"],
             "description": "Federal Supplement (1st series) - U.S. District Court cases 1932-1998.",
+            "first_year": 1932,
+            "last_year": 1998,
+            "last_volume": 999,
+            "successor": "F. Supp. 2d",
             "court_level": "Federal District Courts",
             "jurisdiction": "Federal",
             "states": [],
@@ -131,6 +159,10 @@ def create_complete_legal_reporters():
             "abbreviation": "F. Supp. 2d",
             "aliases": ["F Supp 2d"],
             "description": "Federal Supplement, Second Series - U.S. District Court cases 1998-2014.",
+            "first_year": 1998,
+            "last_year": 2014,
+            "last_volume": 999,
+            "successor": "F. Supp. 3d",
             "court_level": "Federal District Courts",
             "jurisdiction": "Federal",
             "states": [],
@@ -141,6 +173,7 @@ def create_complete_legal_reporters():
             "abbreviation": "F. Supp. 3d",
             "aliases": ["F Supp 3d"],
             "description": "Federal Supplement, Third Series - U.S. District Courts 2014-present.",
+            "first_year": 2014,
             "court_level": "Federal District Courts",
             "jurisdiction": "Federal",
             "states": [],
@@ -173,6 +206,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Fed. Cl.",
             "aliases": [],
             "description": "Federal Claims Reporter - Court of Federal Claims decisions (1982-present).",
+            "first_year": 1982,
             "court_level": "Federal Claims Court",
             "jurisdiction": "Federal",
             "states": [],
@@ -183,6 +217,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Ct. Cl.",
             "aliases": [],
             "description": "Court of Claims Reports - U.S. Court of Claims official reporter (1855-1982).",
+            "first_year": 1855,
+            "last_year": 1982,
             "court_level": "Federal Claims Court",
             "jurisdiction": "Federal",
             "states": [],
@@ -203,6 +239,7 @@ def create_complete_legal_reporters():
             "abbreviation": "M.J.",
             "aliases": [],
             "description": "Military Justice Reporter - Court of Military Appeals/CAAF cases (1975-present).",
+            "first_year": 1975,
             "court_level": "Military Appeals Court",
             "jurisdiction": "Federal",
             "states": [],
@@ -213,6 +250,8 @@ def create_complete_legal_reporters():
             "abbreviation": "C.M.R.",
             "aliases": [],
             "description": "Court-Martial Reports - military appeals (1951-1975).",
+            "first_year": 1951,
+            "last_year": 1975,
             "court_level": "Military Appeals Court",
             "jurisdiction": "Federal",
             "states": [],
@@ -273,6 +312,8 @@ def create_complete_legal_reporters():
             "abbreviation": "B.T.A.",
             "aliases": [],
             "description": "Board of Tax Appeals Reports - predecessor to Tax Court (1924-42).",
+            "first_year": 1924,
+            "last_year": 1942,
             "court_level": "Tax Court",
             "jurisdiction": "Federal",
             "states": [],
@@ -285,6 +326,10 @@ def create_complete_legal_reporters():
             "abbreviation": "A.",
             "aliases": [],
             "description": "Atlantic Reporter (1st) - CT, DE, DC, ME, MD, NH, NJ, PA, RI, VT (1885-1938).",
+            "first_year": 1885,
+            "last_year": 1938,
+            "last_volume": 200,
+            "successor": "A.2d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["CT","DE","DC","ME","MD","NH","NJ","PA","RI","VT"],
@@ -295,6 +340,10 @@ def create_complete_legal_reporters():
             "abbreviation": "A.2d",
             "aliases": [],
             "description": "Atlantic Reporter, Second Series - same states, 1939-2010s.",
+            "first_year": 1938,
+            "last_year": 2010,
+            "last_volume": 999,
+            "successor": "A.3d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["CT","DE","DC","ME","MD","NH","NJ","PA","RI","VT"],
@@ -305,6 +354,7 @@ def create_complete_legal_reporters():
             "abbreviation": "A.3d",
             "aliases": [],
             "description": "Atlantic Reporter, Third Series - current Atlantic states reporter.",
+            "first_year": 2010,
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["CT","DE","DC","ME","MD","NH","NJ","PA","RI","VT"],
@@ -315,6 +365,10 @@ def create_complete_legal_reporters():
             "abbreviation": "N.E.",
             "aliases": [],
             "description": "North Eastern Reporter (1st) - IL, IN, MA, NY, OH (1885-1936).",
+            "first_year": 1885,
+            "last_year": 1936,
+            "last_volume": 200,
+            "successor": "N.E.2d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["IL","IN","MA","NY","OH"],
@@ -325,6 +379,10 @@ def create_complete_legal_reporters():
             "abbreviation": "N.E.2d",
             "aliases": [],
             "description": "North Eastern Reporter, Second Series - IL, IN, MA, NY, OH (1936-2014).",
+            "first_year": 1936,
+            "last_year": 2014,
+            "last_volume": 999,
+            "successor": "N.E.3d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["IL","IN","MA","NY","OH"],
@@ -335,6 +393,7 @@ def create_complete_legal_reporters():
             "abbreviation": "N.E.3d",
             "aliases": [],
             "description": "North Eastern Reporter, Third Series - current series for IL, IN, MA, NY, OH.",
+            "first_year": 2014,
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["IL","IN","MA","NY","OH"],
@@ -345,6 +404,9 @@ def create_complete_legal_reporters():
             "abbreviation": "N.W.",
             "aliases": [],
             "description": "North Western Reporter (1st) - IA, MI, MN, NE, ND, SD, WI (1879-1944).",
+            "first_year": 1879,
+            "last_year": 1944,
+            "successor": "N.W.2d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["IA","MI","MN","NE","ND","SD","WI"],
@@ -355,6 +417,10 @@ def create_complete_legal_reporters():
             "abbreviation": "N.W.2d",
             "aliases": [],
             "description": "North Western Reporter, Second Series - same states, 1944-2023.",
+            "first_year": 1941,
+            "last_year": 2023,
+            "last_volume": 999,
+            "successor": "N.W.3d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["IA","MI","MN","NE","ND","SD","WI"],
@@ -365,6 +431,7 @@ def create_complete_legal_reporters():
             "abbreviation": "N.W.3d",
             "aliases": [],
             "description": "North Western Reporter, Third Series - launched 2024 for NW states.",
+            "first_year": 2023,
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["IA","MI","MN","NE","ND","SD","WI"],
@@ -375,6 +442,10 @@ def create_complete_legal_reporters():
             "abbreviation": "P.",
             "aliases": [],
             "description": "Pacific Reporter (1st) - AK, AZ, CA, CO, HI, ID, KS, MT, NV, NM, OK, OR, UT, WA, WY (1883-1931).",
+            "first_year": 1883,
+            "last_year": 1931,
+            "last_volume": 300,
+            "successor": "P.2d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["AK","AZ","CA","CO","HI","ID","KS","MT","NV","NM","OK","OR","UT","WA","WY"],
@@ -385,6 +456,10 @@ def create_complete_legal_reporters():
             "abbreviation": "P.2d",
             "aliases": [],
             "description": "Pacific Reporter, Second Series - same states, 1931-2000.",
+            "first_year": 1931,
+            "last_year": 2000,
+            "last_volume": 999,
+            "successor": "P.3d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["AK","AZ","CA","CO","HI","ID","KS","MT","NV","NM","OK","OR","UT","WA","WY"],
@@ -395,6 +470,7 @@ def create_complete_legal_reporters():
             "abbreviation": "P.3d",
             "aliases": [],
             "description": "Pacific Reporter, Third Series - current series for Pacific states (2000-present).",
+            "first_year": 2000,
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["AK","AZ","CA","CO","HI","ID","KS","MT","NV","NM","OK","OR","UT","WA","WY"],
@@ -405,6 +481,10 @@ def create_complete_legal_reporters():
             "abbreviation": "S.E.",
             "aliases": [],
             "description": "South Eastern Reporter (1st) - GA, NC, SC, VA, WV (1887-1939).",
+            "first_year": 1887,
+            "last_year": 1939,
+            "last_volume": 200,
+            "successor": "S.E.2d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["GA","NC","SC","VA","WV"],
@@ -415,26 +495,21 @@ def create_complete_legal_reporters():
             "abbreviation": "S.E.2d",
             "aliases": [],
             "description": "South Eastern Reporter, Second Series - GA, NC, SC, VA, WV (1939-present).",
+            "first_year": 1939,
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["GA","NC","SC","VA","WV"],
             "common_citation_mistakes": [],
             "placeholder_examples": ["866 S.E.2d 160 (Va. 2021)"]
         },
-        {
-            "abbreviation": "S.E.3d",
-            "aliases": [],
-            "description": "South Eastern Reporter, Third Series - emerging third series for SE states.",
-            "court_level": "State Appellate Courts",
-            "jurisdiction": "Regional",
-            "states": ["GA","NC","SC","VA","WV"],
-            "common_citation_mistakes": [],
-            "placeholder_examples": ["545 S.E.3d 548 (Ga. 2022)"]
-        },
         {
             "abbreviation": "So.",
             "aliases": [],
             "description": "Southern Reporter (1st) - AL, FL, LA, MS (1887-1941).",
+            "first_year": 1887,
+            "last_year": 1941,
+            "last_volume": 200,
+            "successor": "So. 2d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["AL","FL","LA","MS"],
@@ -445,6 +520,10 @@ def create_complete_legal_reporters():
             "abbreviation": "So. 2d",
             "aliases": ["So.2d"],
             "description": "Southern Reporter, Second Series - AL, FL, LA, MS (1941-2009).",
+            "first_year": 1941,
+            "last_year": 2009,
+            "last_volume": 999,
+            "successor": "So. 3d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["AL","FL","LA","MS"],
@@ -455,6 +534,7 @@ def create_complete_legal_reporters():
             "abbreviation": "So. 3d",
             "aliases": ["So.3d"],
             "description": "Southern Reporter, Third Series - AL, FL, LA, MS (2009-present).",
+            "first_year": 2009,
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["AL","FL","LA","MS"],
@@ -464,7 +544,11 @@ def create_complete_legal_reporters():
         {
             "abbreviation": "S.W.",
             "aliases": [],
-            "description": "South Western Reporter (1st) - AR, KY, MO, TN, TX (1886-1939).",
+            "description": "South Western Reporter (1st) - AR, KY, MO, TN, TX (1886-1928).",
+            "first_year": 1886,
+            "last_year": 1928,
+            "last_volume": 300,
+            "successor": "S.W.2d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["AR","KY","MO","TN","TX"],
@@ -475,6 +559,10 @@ def create_complete_legal_reporters():
             "abbreviation": "S.W.2d",
             "aliases": [],
             "description": "South Western Reporter, Second Series - AR, KY, MO, TN, TX (1928-1999).",
+            "first_year": 1928,
+            "last_year": 1999,
+            "last_volume": 999,
+            "successor": "S.W.3d",
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["AR","KY","MO","TN","TX"],
@@ -485,6 +573,7 @@ def create_complete_legal_reporters():
             "abbreviation": "S.W.3d",
             "aliases": [],
             "description": "South Western Reporter, Third Series - AR, KY, MO, TN, TX (1999-present).",
+            "first_year": 1999,
             "court_level": "State Appellate Courts",
             "jurisdiction": "Regional",
             "states": ["AR","KY","MO","TN","TX"],
@@ -497,6 +586,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Ala.",
             "aliases": [],
             "description": "Alabama Reports - Alabama Supreme Court official reporter (1840-1976).",
+            "first_year": 1840,
+            "last_year": 1976,
             "court_level": "State Supreme Court",
             "jurisdiction": "Alabama",
             "states": ["Alabama"],
@@ -507,6 +598,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Ala. App.",
             "aliases": [],
             "description": "Alabama Appellate Reports - Alabama appellate courts (1910-1976).",
+            "first_year": 1910,
+            "last_year": 1976,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Alabama",
             "states": ["Alabama"],
@@ -517,6 +610,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Alaska",
             "aliases": [],
             "description": "Alaska Reports - territorial and early statehood reporter (1884-1959).",
+            "first_year": 1884,
+            "last_year": 1959,
             "court_level": "State Supreme Court",
             "jurisdiction": "Alaska",
             "states": ["Alaska"],
@@ -527,6 +622,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Ariz.",
             "aliases": [],
             "description": "Arizona Reports - Arizona Supreme Court official reporter (1866-present).",
+            "first_year": 1866,
             "court_level": "State Supreme Court",
             "jurisdiction": "Arizona",
             "states": ["Arizona"],
@@ -537,6 +633,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Ariz. App.",
             "aliases": [],
             "description": "Arizona Appeals Reports - Arizona Court of Appeals (1965-1976).",
+            "first_year": 1965,
+            "last_year": 1976,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Arizona",
             "states": ["Arizona"],
@@ -547,6 +645,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Ark.",
             "aliases": [],
             "description": "Arkansas Reports - Arkansas Supreme Court official reporter (1837-2009).",
+            "first_year": 1837,
+            "last_year": 2009,
             "court_level": "State Supreme Court",
             "jurisdiction": "Arkansas",
             "states": ["Arkansas"],
@@ -557,6 +657,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Ark. App.",
             "aliases": [],
             "description": "Arkansas Appellate Reports - Arkansas Court of Appeals (1981-2009).",
+            "first_year": 1981,
+            "last_year": 2009,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Arkansas",
             "states": ["Arkansas"],
@@ -567,6 +669,10 @@ def create_complete_legal_reporters():
             "abbreviation": "Cal.",
             "aliases": [],
             "description": "California Reports - California Supreme Court official reporter (Cal., Cal. 2d, Cal. 3d, Cal. 4th, Cal. 5th).",
+            "first_year": 1850,
+            "last_year": 1934,
+            "last_volume": 220,
+            "successor": "Cal. 2d",
             "court_level": "State Supreme Court",
             "jurisdiction": "California",
             "states": ["California"],
@@ -577,6 +683,10 @@ def create_complete_legal_reporters():
             "abbreviation": "Cal. 2d",
             "aliases": [],
             "description": "California Reports, Second Series (1934-1969).",
+            "first_year": 1934,
+            "last_year": 1969,
+            "last_volume": 71,
+            "successor": "Cal. 3d",
             "court_level": "State Supreme Court",
             "jurisdiction": "California",
             "states": ["California"],
@@ -587,6 +697,10 @@ def create_complete_legal_reporters():
             "abbreviation": "Cal. 3d",
             "aliases": [],
             "description": "California Reports, Third Series (1969-1991).",
+            "first_year": 1969,
+            "last_year": 1991,
+            "last_volume": 54,
+            "successor": "Cal. 4th",
             "court_level": "State Supreme Court",
             "jurisdiction": "California",
             "states": ["California"],
@@ -597,6 +711,10 @@ def create_complete_legal_reporters():
             "abbreviation": "Cal. 4th",
             "aliases": [],
             "description": "California Reports, Fourth Series (1991-2016).",
+            "first_year": 1991,
+            "last_year": 2016,
+            "last_volume": 63,
+            "successor": "Cal. 5th",
             "court_level": "State Supreme Court",
             "jurisdiction": "California",
             "states": ["California"],
@@ -607,6 +725,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Cal. 5th",
             "aliases": [],
             "description": "California Reports, Fifth Series (2016-present).",
+            "first_year": 2016,
             "court_level": "State Supreme Court",
             "jurisdiction": "California",
             "states": ["California"],
@@ -627,6 +746,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Colo.",
             "aliases": [],
             "description": "Colorado Reports - Colorado Supreme Court official reporter (1864-1980).",
+            "first_year": 1864,
+            "last_year": 1980,
             "court_level": "State Supreme Court",
             "jurisdiction": "Colorado",
             "states": ["Colorado"],
@@ -647,6 +768,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Conn.",
             "aliases": [],
             "description": "Connecticut Reports - Connecticut Supreme Court official reporter (1814-present).",
+            "first_year": 1814,
             "court_level": "State Supreme Court",
             "jurisdiction": "Connecticut",
             "states": ["Connecticut"],
@@ -657,6 +779,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Conn. App.",
             "aliases": [],
             "description": "Connecticut Appellate Reports - Connecticut Appellate Court (1983-present).",
+            "first_year": 1983,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Connecticut",
             "states": ["Connecticut"],
@@ -667,6 +790,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Conn. Supp.",
             "aliases": [],
             "description": "Connecticut Supplement - selected Superior Court decisions (1935-present).",
+            "first_year": 1935,
             "court_level": "State Trial Court",
             "jurisdiction": "Connecticut",
             "states": ["Connecticut"],
@@ -677,6 +801,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Del.",
             "aliases": [],
             "description": "Delaware Reports - Delaware Supreme Court official reporter (1920-1966).",
+            "first_year": 1920,
+            "last_year": 1966,
             "court_level": "State Supreme Court",
             "jurisdiction": "Delaware",
             "states": ["Delaware"],
@@ -687,6 +813,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Del. Ch.",
             "aliases": [],
             "description": "Delaware Chancery Reports - Court of Chancery official reporter (1814-1968).",
+            "first_year": 1814,
+            "last_year": 1968,
             "court_level": "State Chancery Court",
             "jurisdiction": "Delaware",
             "states": ["Delaware"],
@@ -697,6 +825,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Fla.",
             "aliases": [],
             "description": "Florida Reports - Florida Supreme Court official reporter (1846-1948).",
+            "first_year": 1846,
+            "last_year": 1948,
             "court_level": "State Supreme Court",
             "jurisdiction": "Florida",
             "states": ["Florida"],
@@ -707,6 +837,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Ga.",
             "aliases": [],
             "description": "Georgia Reports - Georgia Supreme Court official reporter (1846-present).",
+            "first_year": 1846,
             "court_level": "State Supreme Court",
             "jurisdiction": "Georgia",
             "states": ["Georgia"],
@@ -717,6 +848,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Ga. App.",
             "aliases": [],
             "description": "Georgia Appeals Reports - Georgia Court of Appeals official reporter (1907-present).",
+            "first_year": 1907,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Georgia",
             "states": ["Georgia"],
@@ -726,7 +858,8 @@ def create_complete_legal_reporters():
         {
             "abbreviation": "Haw.",
             "aliases": [],
-            "description": "Hawaii Reports - Hawaii Supreme Court official reporter (1847-1994).",
+            "description": "Hawaii Reports - Hawaii Supreme Court official reporter (1847-present).",
+            "first_year": 1847,
             "court_level": "State Supreme Court",
             "jurisdiction": "Hawaii",
             "states": ["Hawaii"],
@@ -737,6 +870,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Idaho",
             "aliases": [],
             "description": "Idaho Reports - Idaho Supreme Court official reporter (1866-present).",
+            "first_year": 1866,
             "court_level": "State Supreme Court",
             "jurisdiction": "Idaho",
             "states": ["Idaho"],
@@ -746,17 +880,21 @@ def create_complete_legal_reporters():
         {
             "abbreviation": "Ill.",
             "aliases": [],
-            "description": "Illinois Reports - Illinois Supreme Court official reporter (1819-2011).",
+            "description": "Illinois Reports - Illinois Supreme Court official reporter (1819-1956).",
+            "first_year": 1819,
+            "last_year": 1956,
+            "successor": "Ill. 2d",
             "court_level": "State Supreme Court",
             "jurisdiction": "Illinois",
             "states": ["Illinois"],
             "common_citation_mistakes": [],
-            "placeholder_examples": ["238 Ill. 2d 233 (2010)"]
+            "placeholder_examples": ["400 Ill. 11 (1948)"]
         },
         {
             "abbreviation": "Ill. 2d",
             "aliases": [],
             "description": "Illinois Reports, Second Series (1950s-2011).",
+            "last_year": 2011,
             "court_level": "State Supreme Court",
             "jurisdiction": "Illinois",
             "states": ["Illinois"],
@@ -767,6 +905,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Ill. App.",
             "aliases": ["Ill. App. 2d", "Ill. App. 3d"],
             "description": "Illinois Appellate Court Reports (1877-2011).",
+            "first_year": 1877,
+            "last_year": 2011,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Illinois",
             "states": ["Illinois"],
@@ -777,6 +917,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Ind.",
             "aliases": [],
             "description": "Indiana Reports - Indiana Supreme Court official reporter (1848-1981).",
+            "first_year": 1848,
+            "last_year": 1981,
             "court_level": "State Supreme Court",
             "jurisdiction": "Indiana",
             "states": ["Indiana"],
@@ -787,6 +929,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Ind. App.",
             "aliases": [],
             "description": "Indiana Appellate Court Reports (1890-1979).",
+            "first_year": 1890,
+            "last_year": 1979,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Indiana",
             "states": ["Indiana"],
@@ -797,6 +941,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Iowa",
             "aliases": [],
             "description": "Iowa Reports - Iowa Supreme Court official reporter (1839-1968).",
+            "first_year": 1839,
+            "last_year": 1968,
             "court_level": "State Supreme Court",
             "jurisdiction": "Iowa",
             "states": ["Iowa"],
@@ -807,6 +953,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Kan.",
             "aliases": [],
             "description": "Kansas Reports - Kansas Supreme Court official reporter (1862-present).",
+            "first_year": 1862,
             "court_level": "State Supreme Court",
             "jurisdiction": "Kansas",
             "states": ["Kansas"],
@@ -817,6 +964,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Kan. App. 2d",
             "aliases": [],
             "description": "Kansas Court of Appeals Reports (1977-present).",
+            "first_year": 1977,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Kansas",
             "states": ["Kansas"],
@@ -827,6 +975,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Ky.",
             "aliases": [],
             "description": "Kentucky Reports - Kentucky highest court official reports (1785-1951).",
+            "first_year": 1785,
+            "last_year": 1951,
             "court_level": "State Supreme Court",
             "jurisdiction": "Kentucky",
             "states": ["Kentucky"],
@@ -837,6 +987,8 @@ def create_complete_legal_reporters():
             "abbreviation": "La.",
             "aliases": [],
             "description": "Louisiana Reports - Louisiana Supreme Court official reporter (1813-1972).",
+            "first_year": 1813,
+            "last_year": 1972,
             "court_level": "State Supreme Court",
             "jurisdiction": "Louisiana",
             "states": ["Louisiana"],
@@ -847,6 +999,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Me.",
             "aliases": [],
             "description": "Maine Reports - Maine Supreme Judicial Court official reporter (1820-1965).",
+            "first_year": 1820,
+            "last_year": 1965,
             "court_level": "State Supreme Court",
             "jurisdiction": "Maine",
             "states": ["Maine"],
@@ -857,6 +1011,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Md.",
             "aliases": [],
             "description": "Maryland Reports - Maryland Court of Appeals official reporter (1658-present).",
+            "first_year": 1658,
             "court_level": "State Supreme Court",
             "jurisdiction": "Maryland",
             "states": ["Maryland"],
@@ -866,7 +1021,8 @@ def create_complete_legal_reporters():
         {
             "abbreviation": "Md. App.",
             "aliases": [],
-            "description": "Maryland Appellate Reports - Maryland Court of Special Appeals (1967-2022).",
+            "description": "Maryland Appellate Reports - Maryland Court of Special Appeals, now the Appellate Court of Maryland (1967-present).",
+            "first_year": 1967,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Maryland",
             "states": ["Maryland"],
@@ -877,6 +1033,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Mass.",
             "aliases": [],
             "description": "Massachusetts Reports - Massachusetts Supreme Judicial Court official reporter (1804-present).",
+            "first_year": 1804,
             "court_level": "State Supreme Court",
             "jurisdiction": "Massachusetts",
             "states": ["Massachusetts"],
@@ -887,6 +1044,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Mass. App. Ct.",
             "aliases": [],
             "description": "Massachusetts Appeals Court Reports (1972-present).",
+            "first_year": 1972,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Massachusetts",
             "states": ["Massachusetts"],
@@ -896,7 +1054,8 @@ def create_complete_legal_reporters():
         {
             "abbreviation": "Mich.",
             "aliases": [],
-            "description": "Michigan Reports - Michigan Supreme Court official reporter (1840-2016).",
+            "description": "Michigan Reports - Michigan Supreme Court official reporter (1840-present).",
+            "first_year": 1840,
             "court_level": "State Supreme Court",
             "jurisdiction": "Michigan",
             "states": ["Michigan"],
@@ -906,7 +1065,8 @@ def create_complete_legal_reporters():
         {
             "abbreviation": "Mich. App.",
             "aliases": [],
-            "description": "Michigan Appeals Reports - Michigan Court of Appeals (1965-2016).",
+            "description": "Michigan Appeals Reports - Michigan Court of Appeals (1965-present).",
+            "first_year": 1965,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Michigan",
             "states": ["Michigan"],
@@ -917,6 +1077,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Minn.",
             "aliases": [],
             "description": "Minnesota Reports - Minnesota Supreme Court official reporter (1851-1977).",
+            "first_year": 1851,
+            "last_year": 1977,
             "court_level": "State Supreme Court",
             "jurisdiction": "Minnesota",
             "states": ["Minnesota"],
@@ -927,6 +1089,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Miss.",
             "aliases": [],
             "description": "Mississippi Reports - Mississippi Supreme Court official reporter (1839-1966).",
+            "first_year": 1839,
+            "last_year": 1966,
             "court_level": "State Supreme Court",
             "jurisdiction": "Mississippi",
             "states": ["Mississippi"],
@@ -937,6 +1101,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Mo.",
             "aliases": [],
             "description": "Missouri Reports - Missouri Supreme Court official reporter (1821-1956).",
+            "first_year": 1821,
+            "last_year": 1956,
             "court_level": "State Supreme Court",
             "jurisdiction": "Missouri",
             "states": ["Missouri"],
@@ -957,6 +1123,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Mont.",
             "aliases": [],
             "description": "Montana Reports - Montana Supreme Court official reporter (1868-present).",
+            "first_year": 1868,
             "court_level": "State Supreme Court",
             "jurisdiction": "Montana",
             "states": ["Montana"],
@@ -967,6 +1134,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Neb.",
             "aliases": [],
             "description": "Nebraska Reports - Nebraska Supreme Court official reporter (1871-present).",
+            "first_year": 1871,
             "court_level": "State Supreme Court",
             "jurisdiction": "Nebraska",
             "states": ["Nebraska"],
@@ -977,6 +1145,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Neb. App.",
             "aliases": [],
             "description": "Nebraska Appellate Reports - Nebraska Court of Appeals (1995-present).",
+            "first_year": 1992,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Nebraska",
             "states": ["Nebraska"],
@@ -987,6 +1156,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Nev.",
             "aliases": [],
             "description": "Nevada Reports - Nevada Supreme Court official reporter (1865-present).",
+            "first_year": 1865,
             "court_level": "State Supreme Court",
             "jurisdiction": "Nevada",
             "states": ["Nevada"],
@@ -997,6 +1167,7 @@ def create_complete_legal_reporters():
             "abbreviation": "N.H.",
             "aliases": [],
             "description": "New Hampshire Reports - NH Supreme Court official reporter (1816-present).",
+            "first_year": 1816,
             "court_level": "State Supreme Court",
             "jurisdiction": "New Hampshire",
             "states": ["New Hampshire"],
@@ -1007,6 +1178,7 @@ def create_complete_legal_reporters():
             "abbreviation": "N.J.",
             "aliases": [],
             "description": "New Jersey Reports - NJ Supreme Court official reporter (1948-present).",
+            "first_year": 1948,
             "court_level": "State Supreme Court",
             "jurisdiction": "New Jersey",
             "states": ["New Jersey"],
@@ -1017,6 +1189,7 @@ def create_complete_legal_reporters():
             "abbreviation": "N.J. Super.",
             "aliases": [],
             "description": "New Jersey Superior Court Reports - Appellate Division and trial decisions (1948-present).",
+            "first_year": 1948,
             "court_level": "State Intermediate Appellate / Trial",
             "jurisdiction": "New Jersey",
             "states": ["New Jersey"],
@@ -1027,6 +1200,8 @@ def create_complete_legal_reporters():
             "abbreviation": "N.M.",
             "aliases": [],
             "description": "New Mexico Reports - New Mexico Supreme Court official reporter (1852-2012).",
+            "first_year": 1852,
+            "last_year": 2012,
             "court_level": "State Supreme Court",
             "jurisdiction": "New Mexico",
             "states": ["New Mexico"],
@@ -1037,6 +1212,8 @@ def create_complete_legal_reporters():
             "abbreviation": "N.M. App.",
             "aliases": [],
             "description": "New Mexico Appellate Reports - NM Court of Appeals (1966-2012).",
+            "first_year": 1966,
+            "last_year": 2012,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "New Mexico",
             "states": ["New Mexico"],
@@ -1047,6 +1224,7 @@ def create_complete_legal_reporters():
             "abbreviation": "N.Y.",
             "aliases": ["N.Y.2d", "N.Y.3d"],
             "description": "New York Reports - NY Court of Appeals official reporter (1847-present, multiple series).",
+            "first_year": 1847,
             "court_level": "State Highest Court (Court of Appeals)",
             "jurisdiction": "New York",
             "states": ["New York"],
@@ -1087,6 +1265,7 @@ def create_complete_legal_reporters():
             "abbreviation": "N.C.",
             "aliases": [],
             "description": "North Carolina Reports - NC Supreme Court official reporter (1789-present).",
+            "first_year": 1789,
             "court_level": "State Supreme Court",
             "jurisdiction": "North Carolina",
             "states": ["North Carolina"],
@@ -1097,6 +1276,7 @@ def create_complete_legal_reporters():
             "abbreviation": "N.C. App.",
             "aliases": [],
             "description": "North Carolina Court of Appeals Reports (1968-present).",
+            "first_year": 1968,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "North Carolina",
             "states": ["North Carolina"],
@@ -1107,6 +1287,7 @@ def create_complete_legal_reporters():
             "abbreviation": "N.D.",
             "aliases": [],
             "description": "North Dakota Reports - ND Supreme Court official reporter (1878-1953).",
+            "first_year": 1878,
             "court_level": "State Supreme Court",
             "jurisdiction": "North Dakota",
             "states": ["North Dakota"],
@@ -1136,7 +1317,9 @@ def create_complete_legal_reporters():
         {
             "abbreviation": "Okla.",
             "aliases": [],
-            "description": "Oklahoma Reports - Oklahoma Supreme Court official reporter (1900-1954).",
+            "description": "Oklahoma Reports - Oklahoma Supreme Court official reporter (1890-1954).",
+            "first_year": 1890,
+            "last_year": 1954,
             "court_level": "State Supreme Court",
             "jurisdiction": "Oklahoma",
             "states": ["Oklahoma"],
@@ -1147,6 +1330,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Okla. Crim.",
             "aliases": ["Okl. Cr."],
             "description": "Oklahoma Criminal Reports - Oklahoma Court of Criminal Appeals (1908-1954).",
+            "first_year": 1908,
+            "last_year": 1954,
             "court_level": "State Criminal Appeals",
             "jurisdiction": "Oklahoma",
             "states": ["Oklahoma"],
@@ -1157,6 +1342,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Or.",
             "aliases": [],
             "description": "Oregon Reports - Oregon Supreme Court official reporter (1853-present).",
+            "first_year": 1853,
             "court_level": "State Supreme Court",
             "jurisdiction": "Oregon",
             "states": ["Oregon"],
@@ -1167,6 +1353,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Or. App.",
             "aliases": [],
             "description": "Oregon Appellate Reports - Oregon Court of Appeals (1969-present).",
+            "first_year": 1969,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Oregon",
             "states": ["Oregon"],
@@ -1176,7 +1363,8 @@ def create_complete_legal_reporters():
         {
             "abbreviation": "Pa.",
             "aliases": [],
-            "description": "Pennsylvania State Reports - Pa. Supreme Court official reporter (1845-1997).",
+            "description": "Pennsylvania State Reports - Pa. Supreme Court official reporter (1845-present).",
+            "first_year": 1845,
             "court_level": "State Supreme Court",
             "jurisdiction": "Pennsylvania",
             "states": ["Pennsylvania"],
@@ -1187,6 +1375,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Pa. Super.",
             "aliases": [],
             "description": "Pennsylvania Superior Court Reports (1895-1997).",
+            "first_year": 1895,
+            "last_year": 1997,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Pennsylvania",
             "states": ["Pennsylvania"],
@@ -1197,6 +1387,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Pa. Commw.",
             "aliases": [],
             "description": "Pennsylvania Commonwealth Court Reports (1970-1995).",
+            "first_year": 1970,
+            "last_year": 1995,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Pennsylvania",
             "states": ["Pennsylvania"],
@@ -1207,6 +1399,8 @@ def create_complete_legal_reporters():
             "abbreviation": "R.I.",
             "aliases": [],
             "description": "Rhode Island Reports - Rhode Island Supreme Court (1828-1980).",
+            "first_year": 1828,
+            "last_year": 1980,
             "court_level": "State Supreme Court",
             "jurisdiction": "Rhode Island",
             "states": ["Rhode Island"],
@@ -1217,6 +1411,7 @@ def create_complete_legal_reporters():
             "abbreviation": "S.C.",
             "aliases": [],
             "description": "South Carolina Reports - S.C. Supreme Court official reporter (1783-present).",
+            "first_year": 1783,
             "court_level": "State Supreme Court",
             "jurisdiction": "South Carolina",
             "states": ["South Carolina"],
@@ -1227,6 +1422,8 @@ def create_complete_legal_reporters():
             "abbreviation": "S.D.",
             "aliases": [],
             "description": "South Dakota Reports - S.D. Supreme Court official reporter (1879-1996).",
+            "first_year": 1879,
+            "last_year": 1996,
             "court_level": "State Supreme Court",
             "jurisdiction": "South Dakota",
             "states": ["South Dakota"],
@@ -1237,6 +1434,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Tenn.",
             "aliases": [],
             "description": "Tennessee Reports - Tennessee Supreme Court official reporter (1791-1971).",
+            "first_year": 1791,
+            "last_year": 1971,
             "court_level": "State Supreme Court",
             "jurisdiction": "Tennessee",
             "states": ["Tennessee"],
@@ -1247,6 +1446,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Tex.",
             "aliases": [],
             "description": "Texas Reports - Texas Supreme Court official reporter (1846-1962).",
+            "first_year": 1846,
+            "last_year": 1962,
             "court_level": "State Supreme Court",
             "jurisdiction": "Texas",
             "states": ["Texas"],
@@ -1257,6 +1458,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Tex. Crim.",
             "aliases": [],
             "description": "Texas Criminal Reports - Texas Court of Criminal Appeals (1879-1962).",
+            "first_year": 1876,
+            "last_year": 1962,
             "court_level": "State Highest Criminal Court",
             "jurisdiction": "Texas",
             "states": ["Texas"],
@@ -1267,6 +1470,8 @@ def create_complete_legal_reporters():
             "abbreviation": "Utah",
             "aliases": ["Utah 2d"],
             "description": "Utah Reports - Utah Supreme Court official reporter (1851-1999).",
+            "first_year": 1851,
+            "last_year": 1999,
             "court_level": "State Supreme Court",
             "jurisdiction": "Utah",
             "states": ["Utah"],
@@ -1277,6 +1482,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Vt.",
             "aliases": [],
             "description": "Vermont Reports - Vermont Supreme Court official reporter (1829-present).",
+            "first_year": 1826,
             "court_level": "State Supreme Court",
             "jurisdiction": "Vermont",
             "states": ["Vermont"],
@@ -1287,6 +1493,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Va.",
             "aliases": [],
             "description": "Virginia Reports - Virginia Supreme Court official reporter (1790-present).",
+            "first_year": 1790,
             "court_level": "State Supreme Court",
             "jurisdiction": "Virginia",
             "states": ["Virginia"],
@@ -1297,6 +1504,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Va. App.",
             "aliases": [],
             "description": "Virginia Court of Appeals Reports (1985-present).",
+            "first_year": 1985,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Virginia",
             "states": ["Virginia"],
@@ -1307,6 +1515,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Wash.",
             "aliases": ["Wash. 2d"],
             "description": "Washington Reports - Washington Supreme Court official reporter (1854-present, 2d series from 1939).",
+            "first_year": 1854,
             "court_level": "State Supreme Court",
             "jurisdiction": "Washington",
             "states": ["Washington"],
@@ -1317,6 +1526,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Wash. App.",
             "aliases": ["Wn. App."],
             "description": "Washington Appellate Reports - Washington Court of Appeals (1969-present).",
+            "first_year": 1969,
             "court_level": "State Intermediate Appellate",
             "jurisdiction": "Washington",
             "states": ["Washington"],
@@ -1327,6 +1537,7 @@ def create_complete_legal_reporters():
             "abbreviation": "W. Va.",
             "aliases": [],
             "description": "West Virginia Reports - W.Va. Supreme Court of Appeals (1864-present).",
+            "first_year": 1864,
             "court_level": "State Supreme Court",
             "jurisdiction": "West Virginia",
             "states": ["West Virginia"],
@@ -1337,6 +1548,7 @@ def create_complete_legal_reporters():
             "abbreviation": "Wis.",
             "aliases": ["Wis. 2d"],
             "description": "Wisconsin Reports - Wis. Supreme Court official reporter (1853-present, 2d series from 1953).",
+            "first_year": 1853,
             "court_level": "State Supreme Court",
             "jurisdiction": "Wisconsin",
             "states": ["Wisconsin"],
@@ -1346,7 +1558,9 @@ def create_complete_legal_reporters():
         {
             "abbreviation": "Wyo.",
             "aliases": [],
-            "description": "Wyoming Reports - Wyoming Supreme Court official reporter (1869-1954).",
+            "description": "Wyoming Reports - Wyoming Supreme Court official reporter (1869-1959).",
+            "first_year": 1869,
+            "last_year": 1959,
             "court_level": "State Supreme Court",
             "jurisdiction": "Wyoming",
             "states": ["Wyoming"],
@@ -1359,6 +1573,8 @@ def create_complete_legal_reporters():
             "abbreviation": "AR",
             "aliases": [],
             "description": "Arkansas public-domain citation - since 2009, format: Year Ark ### (Supreme) or Year Ark. App ###.",
+            "first_year": 2009,
+            "first_volume": 2009,
             "court_level": "State (Neutral)",
             "jurisdiction": "Arkansas",
             "states": ["Arkansas"],
@@ -1369,6 +1585,8 @@ def create_complete_legal_reporters():
             "abbreviation": "CO",
             "aliases": ["Colo. (neutral)"],
             "description": "Colorado neutral citation - since 2012, format: Year CO ## (Supreme) or Year COA ## (Appeals).",
+            "first_year": 2012,
+            "first_volume": 2012,
             "court_level": "State (Neutral)",
             "jurisdiction": "Colorado",
             "states": ["Colorado"],
@@ -1379,6 +1597,8 @@ def create_complete_legal_reporters():
             "abbreviation": "IL",
             "aliases": [],
             "description": "Illinois neutral citation - since 2011, format: Year IL ### (Supreme) or Year IL App (Dist) ###.",
+            "first_year": 2011,
+            "first_volume": 2011,
             "court_level": "State (Neutral)",
             "jurisdiction": "Illinois",
             "states": ["Illinois"],
@@ -1399,6 +1619,8 @@ def create_complete_legal_reporters():
             "abbreviation": "MT",
             "aliases": [],
             "description": "Montana neutral citation - since 1998, format: Year MT ##.",
+            "first_year": 1998,
+            "first_volume": 1998,
             "court_level": "State (Neutral)",
             "jurisdiction": "Montana",
             "states": ["Montana"],
@@ -1409,6 +1631,8 @@ def create_complete_legal_reporters():
             "abbreviation": "ND",
             "aliases": [],
             "description": "North Dakota neutral citation - since 1997, format: Year ND ##.",
+            "first_year": 1997,
+            "first_volume": 1997,
             "court_level": "State (Neutral)",
             "jurisdiction": "North Dakota",
             "states": ["North Dakota"],
@@ -1429,6 +1653,8 @@ def create_complete_legal_reporters():
             "abbreviation": "OK",
             "aliases": [],
             "description": "Oklahoma neutral citation - since 1997, format: Year OK ## (Supreme), Year OK CR ## (Criminal), Year OK CIV APP ##.",
+            "first_year": 1997,
+            "first_volume": 1997,
             "court_level": "State (Neutral)",
             "jurisdiction": "Oklahoma",
             "states": ["Oklahoma"],
@@ -1439,6 +1665,8 @@ def create_complete_legal_reporters():
             "abbreviation": "SD",
             "aliases": [],
             "description": "South Dakota neutral citation - since 1996, format: Year SD ##.",
+            "first_year": 1996,
+            "first_volume": 1996,
             "court_level": "State (Neutral)",
             "jurisdiction": "South Dakota",
             "states": ["South Dakota"],
@@ -1449,6 +1677,8 @@ def create_complete_legal_reporters():
             "abbreviation": "UT",
             "aliases": [],
             "description": "Utah neutral citation - since 1999, format: Year UT ## (Supreme) or Year UT App ## (Appeals).",
+            "first_year": 1999,
+            "first_volume": 1999,
             "court_level": "State (Neutral)",
             "jurisdiction": "Utah",
             "states": ["Utah"],
@@ -1459,6 +1689,8 @@ def create_complete_legal_reporters():
             "abbreviation": "WI",
             "aliases": [],
             "description": "Wisconsin neutral citation - since 2000, format: Year WI ## (Supreme) or Year WI App ## (Appeals).",
+            "first_year": 2000,
+            "first_volume": 2000,
             "court_level": "State (Neutral)",
             "jurisdiction": "Wisconsin",
             "states": ["Wisconsin"],
@@ -1542,4 +1774,11 @@ if __name__ == "__main__":
     print(f"Regional reporters: {regional}")  
     print(f"State-specific reporters: {state_specific}")
     print(f"Other (neutral, vendor, etc.): {len(reporters) - federal - regional - state_specific}")
-    print("Saved to: /app/legal_reporters_comprehensive.json")
\ No newline at end of file
+    
+    print("Saved to: /app/legal_reporters_comprehensive.json")
+
+    # Compile the versioned binary snapshot the API workers load at startup
+    subprocess.run(
+        [sys.executable, str(Path(__file__).parent / 'backend' / 'reporters.py')],
+        check=True
+    )
\ No newline at end of file
@@ -33,7 +33,7 @@ const AboutPage = () => {
                   and state court decisions.
                 </p>
                 <ul>
-                  <li>149+ comprehensive legal reporters</li>
+                  <li>148 comprehensive legal reporters</li>
                   <li>Federal, Regional, State, and Specialized courts</li>
                   <li>Advanced typo detection and correction suggestions</li>
                   <li>Real-time validation against authoritative sources</li>